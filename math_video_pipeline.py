@@ -37,52 +37,98 @@ if sys.stdout.encoding != 'utf-8':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 # ============================================================================
-# OpenAI 클라이언트 초기화 (TTS + Whisper)
+# 선택 의존성 (사용 시점에 지연 로드)
 # ============================================================================
-
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    print("⚠️  OpenAI 라이브러리가 설치되지 않았습니다 (TTS/Whisper용).")
-    print("   설치: pip install openai")
-
-try:
-    from google.cloud import texttospeech
-    GOOGLE_TTS_AVAILABLE = True
-except ImportError:
-    GOOGLE_TTS_AVAILABLE = False
-    print("⚠️  Google Cloud TTS 라이브러리가 설치되지 않았습니다.")
-    print("   설치: pip install google-cloud-texttospeech")
-
-# Gemini TTS (google-genai)
-try:
-    from google import genai
-    from google.genai import types
-    GEMINI_TTS_AVAILABLE = True
-except ImportError:
-    GEMINI_TTS_AVAILABLE = False
-    print("⚠️  Gemini TTS 라이브러리가 설치되지 않았습니다.")
-    print("   설치: pip install google-genai")
+# status/list/files 같은 명령은 SDK가 필요 없으므로 모듈 로드 시 import하지 않습니다.
+# 처음 사용할 때 optional_import()로 불러오고, 없으면 설치 안내를 한 번만 출력합니다.
 
 import wave
 
-# Supabase (에셋 관리)
-try:
-    from supabase import create_client, Client as SupabaseClient
-    SUPABASE_AVAILABLE = True
-except ImportError:
-    SUPABASE_AVAILABLE = False
-    print("⚠️  Supabase 라이브러리가 설치되지 않았습니다.")
-    print("   설치: pip install supabase")
+OPTIONAL_DEPENDENCIES = {
+    "openai": {
+        "module": "openai",
+        "missing": "OpenAI 라이브러리가 설치되지 않았습니다 (TTS/Whisper용).",
+        "install": "pip install openai"
+    },
+    "google_tts": {
+        "module": "google.cloud.texttospeech",
+        "missing": "Google Cloud TTS 라이브러리가 설치되지 않았습니다.",
+        "install": "pip install google-cloud-texttospeech"
+    },
+    "gemini": {
+        "module": "google.genai",
+        "missing": "Gemini TTS 라이브러리가 설치되지 않았습니다.",
+        "install": "pip install google-genai"
+    },
+    "supabase": {
+        "module": "supabase",  # 에셋 관리
+        "missing": "Supabase 라이브러리가 설치되지 않았습니다.",
+        "install": "pip install supabase"
+    },
+    "pil": {"module": "PIL.Image"},   # 이미지 메타데이터 (없으면 조용히 생략)
+    "numpy": {"module": "numpy"},     # 자막 정렬 DP, 오디오 조립 벡터 연산
+    "faster_whisper": {
+        "module": "faster_whisper",  # 로컬 Whisper (WHISPER_BACKEND=local)
+        "missing": "faster-whisper 라이브러리가 설치되지 않았습니다 (로컬 Whisper용).",
+        "install": "pip install faster-whisper"
+    }
+}
+
+_optional_modules: Dict[str, Any] = {}
+
+
+def optional_import(name: str):
+    """선택 의존성 모듈 로드 (프로세스당 1회, 없으면 None + 설치 안내)"""
+    if name in _optional_modules:
+        return _optional_modules[name]
+
+    import importlib
+
+    spec = OPTIONAL_DEPENDENCIES[name]
+    try:
+        module = importlib.import_module(spec["module"])
+    except ImportError:
+        module = None
+        if spec.get("missing"):
+            print(f"⚠️  {spec['missing']}")
+            print(f"   설치: {spec['install']}")
+
+    _optional_modules[name] = module
+    return module
+
+
+def has_optional(name: str) -> bool:
+    """설치 여부만 확인 (아직 로드하지 않았으면 모듈을 import하지 않음)"""
+    if name in _optional_modules:
+        return _optional_modules[name] is not None
 
-# PIL (이미지 메타데이터)
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+    import importlib.util
+
+    try:
+        return importlib.util.find_spec(OPTIONAL_DEPENDENCIES[name]["module"]) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """첫 속성 접근 때 import하는 모듈 대리 객체
+
+    로드 후에는 모듈 전역 이름(alias)을 실제 모듈로 바꿔, 이후 np.xxx 호출에 대리 비용이 없습니다.
+    """
+
+    def __init__(self, name: str, alias: str):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr: str):
+        module = optional_import(self._name)
+        if module is None:
+            raise ImportError(f"{OPTIONAL_DEPENDENCIES[self._name]['module']} 모듈이 필요합니다.")
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+np = LazyModule("numpy", "np")
 
 
 # ============================================================================
@@ -94,9 +140,37 @@ class QuotaExceededException(Exception):
     pass
 
 
+class FFmpegSystemError(Exception):
+    """씬과 무관한 FFmpeg 환경 오류 (FFmpeg 없음, 디스크 부족, 인코더 없음 등)
+
+    이 오류가 나면 나머지 씬도 모두 실패하므로 새 작업을 중단합니다.
+    """
+    pass
+
+
+def cached_client(factory):
+    """생성에 성공한 API 클라이언트를 프로세스 안에서 재사용 (serve 모드에서 재초기화 방지)"""
+    import functools
+
+    cache = {}
+
+    @functools.wraps(factory)
+    def wrapper():
+        if "client" not in cache:
+            client = factory()
+            if client is None:
+                return None
+            cache["client"] = client
+        return cache["client"]
+
+    return wrapper
+
+
+@cached_client
 def get_openai_client() -> Optional['OpenAI']:
     """OpenAI 클라이언트 생성"""
-    if not OPENAI_AVAILABLE:
+    openai = optional_import("openai")
+    if openai is None:
         return None
     
     api_key = os.getenv("OPENAI_API_KEY")
@@ -115,12 +189,14 @@ def get_openai_client() -> Optional['OpenAI']:
         print("   .env 파일에 OPENAI_API_KEY=sk-... 를 추가하세요.")
         return None
     
-    return OpenAI(api_key=api_key)
+    return openai.OpenAI(api_key=api_key)
 
 
+@cached_client
 def get_google_tts_client() -> Optional['texttospeech.TextToSpeechClient']:
     """Google Cloud TTS 클라이언트 생성"""
-    if not GOOGLE_TTS_AVAILABLE:
+    texttospeech = optional_import("google_tts")
+    if texttospeech is None:
         return None
 
     credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
@@ -147,9 +223,11 @@ def get_google_tts_client() -> Optional['texttospeech.TextToSpeechClient']:
         return None
 
 
+@cached_client
 def get_gemini_client() -> Optional['genai.Client']:
     """Gemini 클라이언트 생성 (TTS용)"""
-    if not GEMINI_TTS_AVAILABLE:
+    genai = optional_import("gemini")
+    if genai is None:
         return None
 
     api_key = os.getenv("GOOGLE_API_KEY")
@@ -188,6 +266,27 @@ STATE_FILE = PROJECT_ROOT / "state.json"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 SKILLS_DIR = PROJECT_ROOT / "skills"
 
+# state.json 저장 설정 (파일 잠금 + 원자적 교체 + 변경 저널)
+STATE_CONFIG = {
+    "lock_timeout": 30.0,          # 다른 프로세스의 잠금 해제 대기 최대 시간 (초)
+    "journal_compact_every": 100   # 저널 항목이 이 수를 넘으면 state.json으로 합침
+}
+
+# 상주 서버 설정 (serve / client)
+SERVE_CONFIG = {
+    "host": "127.0.0.1",               # 로컬 전용
+    "port": 8765,
+    "info_file": PROJECT_ROOT / "cache" / "serve.json",  # 실행 중인 서버 주소 + 토큰 (client가 읽음, 0600)
+    "connect_timeout": 0.5,            # 서버 연결 대기 (없으면 바로 직접 실행)
+    "client_timeout": 6 * 3600         # 긴 명령(tts-all, render-all) 대기 시간 (초)
+}
+
+# 프로젝트 인덱스 설정 (list/status용 SQLite, reindex로 재생성)
+PROJECT_INDEX_CONFIG = {
+    "db_file": PROJECT_ROOT / "cache" / "projects.db",
+    "busy_timeout": 10.0   # 다른 프로세스가 쓰는 중일 때 대기 시간 (초)
+}
+
 # TTS 설정 (OpenAI gpt-4o-mini-tts)
 TTS_CONFIG = {
     "voices": {
@@ -207,7 +306,34 @@ TTS_CONFIG = {
     },
     "default_voice": "alloy",
     "model": "gpt-4o-mini-tts",
-    "audio_encoding": "MP3"
+    "audio_encoding": "MP3",
+    # tts-all 동시 요청 (429 응답에 맞춰 initial~max 사이에서 자동 조절)
+    "concurrency": {
+        "initial": 2,
+        "min": 1,
+        "max": 4
+    },
+    "max_retries": 5,
+    # 합성 캐시: (모델, 음성, instructions, 정규화된 텍스트)가 같으면 API 재호출 없이 재사용
+    "cache_dir": PROJECT_ROOT / "cache" / "tts",
+    # 긴 섹션 분할 합성: 문장 경계에서 chunk_chars 이하로 나눠 동시 생성 후 이어붙임
+    "chunk_chars": 1500,
+    "chunk_gap": 0.3,    # 조각 사이 무음 (초, 앞뒤 무음 제거 후)
+    "chunk_fade": 0.01   # 조각 앞뒤 페이드 (초, 클릭 방지)
+}
+
+# Whisper 음성 인식 설정
+WHISPER_CONFIG = {
+    # 백엔드: "openai" (whisper-1 API) 또는 "local" (faster-whisper, CPU, 네트워크 불필요)
+    # 우선순위: --whisper 옵션 > state.json settings.whisper_backend > 환경변수 WHISPER_BACKEND
+    "backend": os.getenv("WHISPER_BACKEND", "openai"),
+    "openai_model": "whisper-1",
+    "local_model": os.getenv("WHISPER_LOCAL_MODEL", "small"),
+    "local_device": "cpu",
+    "local_compute_type": "int8",
+    "language": "ko",
+    # 전사 캐시: 오디오 내용 해시 + 백엔드 + 모델이 같으면 재전사하지 않음
+    "cache_dir": PROJECT_ROOT / "cache" / "transcripts"
 }
 
 # 스타일 설정
@@ -259,49 +385,738 @@ COLOR_PALETTE = {
     "auxiliary": "GRAY_B"
 }
 
+# 렌더링 설정 (render-all --jobs 병렬 렌더링)
+RENDER_CONFIG = {
+    # Manim 프로세스 1개당 예상 메모리 사용량 (MB, 품질별)
+    "memory_per_job_mb": {
+        "l": 1024,
+        "m": 1536,
+        "h": 2560,
+        "k": 4096
+    },
+    "log_dir": "logs",  # 프로젝트 폴더 기준 씬별 렌더링 로그 위치
+    # 렌더링 캐시 (코드 + 에셋 + 품질 + Manim 버전 해시 기준, 프로젝트 간 공유)
+    "cache_dir": PROJECT_ROOT / "cache" / "renders",
+    "index_file": "render_index.json",  # 8_renders/ 안의 씬 → 캐시 키 기록
+    # 씬별 격리 출력 폴더: media/{project_id}/{scene_id}/{quality}/
+    "media_dir": PROJECT_ROOT / "media",
+    "manifest_file": "render_manifest.json",  # 격리 폴더 안의 정확한 출력 파일 기록
+    # Manim 품질 플래그 → 출력 해상도 폴더
+    "quality_dirs": {
+        "l": "480p15",
+        "m": "720p30",
+        "h": "1080p60",
+        "k": "2160p60"
+    }
+}
+
+
+# 합성 설정 (compose-all --jobs 병렬 합성)
+COMPOSE_CONFIG = {
+    # 이 문구가 FFmpeg 오류에 있으면 씬 문제가 아닌 환경 문제로 보고 전체 중단
+    "systemic_errors": [
+        "No space left on device",
+        "Unknown encoder",
+        "Encoder not found",
+        "Cannot allocate memory",
+        "No such filter",
+        "Read-only file system"
+    ]
+}
+
+
+# 씬/전환 클립 공통 인코딩 규격 (merge-final에서 재인코딩 없이 concat -c copy 하기 위함)
+MEZZANINE_PROFILE = {
+    "sizes": {
+        "16:9": (1920, 1080),
+        "9:16": (1080, 1920)
+    },
+    "fps": 30,
+    "timescale": 15360,  # -video_track_timescale (fps의 배수)
+    "pix_fmt": "yuv420p",
+    "video_codec": ["-c:v", "libx264", "-preset", "fast", "-crf", "23", "-profile:v", "high"],
+    "audio_codec": "aac",
+    "audio_bitrate": "192k",
+    "sample_rate": 48000,
+    "channels": 2,
+    "channel_layout": "stereo"
+}
+
+
+# 배경음악 설정 (merge-final에서 병합과 함께 믹싱)
+BGM_CONFIG = {
+    # BGM 폴더: 환경변수 BGM_DIR > state.json settings.bgm_dir > 프로젝트 루트/BGM
+    "dir": os.getenv("BGM_DIR"),
+    "default_dir": PROJECT_ROOT / "BGM",
+    "extensions": [".mp3", ".m4a", ".wav", ".ogg"],
+    "volume": 0.03  # 나레이션 대비 3%
+}
+
+
+# 미디어 메타데이터 설정 (길이/스트림 정보 캐시)
+MEDIA_PROBE_CONFIG = {
+    # (경로, 크기, 수정시각) 기준 캐시 - 파일이 바뀌지 않으면 다시 측정하지 않음
+    "cache_file": PROJECT_ROOT / "cache" / "media_meta.json",
+    "workers": 8,  # probe_many()의 동시 ffprobe 수
+    # WAV/MP3는 헤더를 직접 읽음 (ffprobe 프로세스 생성 없음)
+    "native_formats": [".wav", ".mp3"]
+}
+
+
+# 씬 오디오 조립 설정 (문장 파일 → 씬 WAV, NumPy)
+AUDIO_ASSEMBLY_CONFIG = {
+    "sample_rate": 48000,          # MEZZANINE_PROFILE과 동일 (합성 시 리샘플 없음)
+    "gap": 0.1,                    # 문장 사이 실제 무음 (초)
+    "frame": 0.01,                 # 에너지 분석 프레임 (초)
+    "silence_threshold_db": -45,   # 이보다 작은 프레임은 무음 (dBFS)
+    "trim_pad": 0.03,              # 앞뒤 무음 제거 후 남길 여유 (초)
+    "target_rms_db": -20,          # 음성 구간 RMS 목표 (dBFS)
+    "peak_ceiling_db": -1          # 정규화 후 최대 피크 (dBFS)
+}
+
+
+# 씬 분할 지점 제안 설정 (tts-split-suggest, 무음 구간 + Whisper 정렬)
+SPLIT_SUGGEST_CONFIG = {
+    "sample_rate": 16000,   # 분석용 디코딩 샘플레이트
+    "frame": 0.01,          # 에너지 프레임 (초)
+    "min_pause": 0.15,      # 이보다 짧은 무음은 쉼으로 보지 않음 (초)
+    "threshold_ratio": 0.3, # 무음 임계값: 바닥 소음 + (음성 레벨 - 바닥) x 비율 (dB)
+    "snap_window": 1.0,     # 예상 경계에서 이 범위 안의 쉼으로 이동 (초)
+    "pause_bonus": 0.5      # 긴 쉼 선호도 (쉼 길이 1초당 거리 감점)
+}
+
+
+# 자막 정렬 설정 (subtitle_display 문장 ↔ Whisper 단어 타임스탬프)
+SUBTITLE_ALIGN_CONFIG = {
+    "gap_cost": 1.0,           # 문자 삽입/삭제 비용 (치환 최대 비용도 1.0)
+    "min_match_ratio": 0.5,    # 대본 문자 중 근접 매칭 비율이 이보다 낮으면 균등 분배
+    "max_cells": 4_000_000     # DP 행렬 최대 크기 (대본 문자수 x 인식 문자수)
+}
+
+# 에셋 다운로드 설정 (Supabase Storage → assets/)
+ASSET_DOWNLOAD_CONFIG = {
+    "workers": 8,              # 동시 다운로드 수
+    "retries": 3,              # 파일당 재시도 횟수 (이어받기)
+    "backoff": 1.0,            # 재시도 대기 시간 기준 (초, 시도마다 2배)
+    "timeout": 60,             # 연결/읽기 타임아웃 (초)
+    "chunk_size": 1 << 16,     # 스트리밍 단위 (바이트)
+    "signed_url_ttl": 600      # 서명 URL 유효 시간 (초)
+}
+
+# 에셋 매니페스트 설정 (Supabase assets 테이블의 로컬 사본)
+ASSET_MANIFEST_CONFIG = {
+    "db_file": PROJECT_ROOT / "cache" / "assets.db",
+    "busy_timeout": 10.0,
+    "watermark_column": "updated_at",  # 이 값 이상인 행만 다시 가져옴 (없으면 매번 전체)
+    "id_column": "id",                 # 페이지 순서 고정용 고유 키 (같은 updated_at 행 구분)
+    "page_size": 1000,                 # PostgREST 기본 최대 행 수
+    "max_age": 300,                    # 마지막 동기화 후 이 시간(초) 안이면 조회 생략
+    "full_refresh_hours": 24           # 삭제된 행 반영을 위한 전체 재동기화 주기
+}
+
+
+def get_mezzanine_size(aspect_ratio: str) -> tuple:
+    """종횡비별 공통 해상도 (width, height)"""
+    return MEZZANINE_PROFILE["sizes"].get(aspect_ratio, MEZZANINE_PROFILE["sizes"]["16:9"])
+
+
+def get_mezzanine_output_args() -> List[str]:
+    """공통 규격 출력 인코딩 옵션 (FFmpeg)"""
+    p = MEZZANINE_PROFILE
+    return [
+        *p["video_codec"],
+        "-r", str(p["fps"]),
+        "-pix_fmt", p["pix_fmt"],
+        "-video_track_timescale", str(p["timescale"]),
+        "-c:a", p["audio_codec"],
+        "-b:a", p["audio_bitrate"],
+        "-ar", str(p["sample_rate"]),
+        "-ac", str(p["channels"])
+    ]
+
+
+def get_scene_media_dir(project_id: str, scene_id: str, quality: str) -> Path:
+    """씬별 Manim 출력 폴더 (프로젝트/씬/품질마다 격리)"""
+    return Path(RENDER_CONFIG["media_dir"]) / project_id / scene_id / quality
+
+
+def load_render_manifest(project_id: str, scene_id: str, quality: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """씬 렌더링 manifest 로드
+
+    Args:
+        quality: None이면 높은 품질부터 확인 (k → h → m → l)
+
+    Returns:
+        manifest dict (output 파일이 실제로 존재할 때만), 없으면 None
+    """
+    qualities = [quality] if quality else ["k", "h", "m", "l"]
+    for q in qualities:
+        manifest_file = get_scene_media_dir(project_id, scene_id, q) / RENDER_CONFIG["manifest_file"]
+        if not manifest_file.exists():
+            continue
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            continue
+        if Path(manifest.get("output", "")).is_file():
+            return manifest
+    return None
+
+
+def get_available_memory() -> Optional[int]:
+    """가용 물리 메모리 (bytes). 확인할 수 없으면 None"""
+    # Linux
+    meminfo = Path("/proc/meminfo")
+    if meminfo.exists():
+        try:
+            with open(meminfo, 'r') as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError):
+            pass
+
+    # Windows
+    if sys.platform == "win32":
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return int(status.ullAvailPhys)
+        except Exception:
+            pass
+
+    return None
+
 
 # ============================================================================
 # 상태 관리 클래스
 # ============================================================================
 
+class FileLock:
+    """프로세스 간 권고 잠금 (fcntl / msvcrt)
+
+    같은 프로세스 안에서는 재진입 가능 (스레드 RLock + 깊이 카운터).
+    잠금 파일 자체에는 내용을 쓰지 않습니다.
+    """
+
+    def __init__(self, lock_file: Path, timeout: float = None):
+        import threading
+
+        self.lock_file = Path(lock_file)
+        self.timeout = STATE_CONFIG["lock_timeout"] if timeout is None else timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fh = None
+
+    def _try_lock(self) -> bool:
+        if os.name == "nt":
+            import msvcrt
+            try:
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                return False
+        else:
+            import fcntl
+            try:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except OSError:
+                return False
+
+    def _unlock(self) -> None:
+        if os.name == "nt":
+            import msvcrt
+            self._fh.seek(0)
+            msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+
+    def acquire(self) -> None:
+        import time
+
+        self._thread_lock.acquire()
+        if self._depth > 0:
+            self._depth += 1
+            return
+
+        try:
+            self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.lock_file, "a+b")
+            deadline = time.monotonic() + self.timeout
+            while not self._try_lock():
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"잠금 대기 시간 초과: {self.lock_file}")
+                time.sleep(0.05)
+        except BaseException:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            self._thread_lock.release()
+            raise
+
+        self._depth = 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self._unlock()
+            finally:
+                self._fh.close()
+                self._fh = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
 class StateManager:
-    """프로젝트 상태 관리"""
+    """프로젝트 상태 관리
+
+    저장 구조:
+    - state.json: 스냅샷 (임시 파일에 쓴 뒤 os.replace로 원자적 교체)
+    - state.journal: 변경 연산 추가 기록 (JSON Lines, 한 줄 = 한 번의 커밋)
+    - state.json.lock: 프로세스 간 쓰기 잠금
+
+    디스크 상태 = 스냅샷 + 저널 재생. 쓰기는 항상 잠금 안에서 디스크 상태를 다시 읽고,
+    마지막으로 읽은 상태(_base)와 작업 사본(_state)의 차이만 연산으로 덧붙이므로
+    여러 프로세스(렌더 워커, compose-all 등)가 서로의 변경을 덮어쓰지 않습니다.
+    저널 연산은 모두 멱등이라 스냅샷 교체 직후 중단되어도 재생 결과가 같습니다.
+
+    대량 갱신은 batch()로 묶으면 블록이 끝날 때 한 번만 기록합니다.
+    """
     
     def __init__(self, state_file: Path = STATE_FILE):
-        self.state_file = state_file
+        import threading
+
+        self.state_file = Path(state_file)
+        self.journal_file = self.state_file.with_suffix(".journal")
         self._state = None
+        self._base = None           # 디스크 상태 (스냅샷 + 재생한 저널)
+        self._snapshot_sig = None   # 마지막으로 읽은 스냅샷 (inode, 크기, 수정시각)
+        self._journal_pos = 0       # 재생한 저널 바이트 위치
+        self._journal_entries = 0   # 현재 저널 항목 수 (압축 판단용)
+        self._journal_dirty = False # 이 인스턴스가 저널에 쓴 적 있음 (종료 시 압축)
+        self._batch_depth = 0       # batch() 중첩 깊이 (0보다 크면 기록 보류)
+        self._batch_ops = []        # batch() 동안 보류한 연산
+        self._batch_snapshot = False
+        self._batch_touched = []    # batch() 동안 보류한 인덱스 재계산 (이미 목록에 있는 파일)
+        self._member_index = {}     # id(리스트) → (리스트, 길이, set) - files.* 중복 검사용
+        self._indexed = None        # 프로젝트 인덱스에 마지막으로 기록한 (id, 제목, 단계, 씬 수, 길이)
+        self._lock = threading.RLock()  # build/병렬 작업에서 동시 수정 방지
+        self._file_lock = FileLock(self.state_file.with_name(self.state_file.name + ".lock"))
     
+    # ------------------------------------------------------------------------
+    # 디스크 읽기/쓰기
+    # ------------------------------------------------------------------------
+
+    def _stat_sig(self) -> Optional[tuple]:
+        try:
+            st = self.state_file.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        """state.json 스냅샷 읽기 (손상 시 보존 후 기본값)"""
+        if not self.state_file.exists():
+            return self._default_state()
+
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            corrupt = self.state_file.with_name(
+                f"{self.state_file.name}.corrupt-{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            )
+            try:
+                import shutil
+                shutil.copy2(self.state_file, corrupt)
+            except OSError:
+                corrupt = None
+            print(f"⚠️  {self.state_file} 파싱 오류. 기본값 + 저널로 복구합니다.")
+            if corrupt:
+                print(f"   손상된 파일 보관: {corrupt.name}")
+            return self._default_state()
+
+    def _refresh_locked(self) -> None:
+        """디스크 상태(_base)를 최신으로 맞춤 (파일 잠금 안에서 호출)
+
+        스냅샷이 바뀌었으면 (다른 프로세스가 압축) 처음부터, 아니면 새 저널 항목만 재생합니다.
+        """
+        sig = self._stat_sig()
+        if self._base is None or sig != self._snapshot_sig:
+            self._base = self._read_snapshot()
+            self._snapshot_sig = sig
+            self._journal_pos = 0
+            self._journal_entries = 0
+
+        if not self.journal_file.exists():
+            self._journal_pos = 0
+            self._journal_entries = 0
+            return
+
+        if self.journal_file.stat().st_size < self._journal_pos:
+            # 스냅샷 교체 없이 저널만 비워진 경우 (압축 직후 상태와 동일)
+            self._journal_pos = 0
+            self._journal_entries = 0
+            return
+
+        with open(self.journal_file, 'rb') as f:
+            f.seek(self._journal_pos)
+            data = f.read()
+
+        consumed = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # 쓰는 도중 중단된 마지막 줄은 무시
+            consumed += len(line)
+            try:
+                entry = json.loads(line.decode('utf-8'))
+            except (ValueError, UnicodeDecodeError):
+                continue
+            for op in entry.get("ops", []):
+                self._apply_op(self._base, op)
+            self._journal_entries += 1
+        self._journal_pos += consumed
+
+    def _snapshot_mode(self) -> int:
+        """state.json 권한 (기존 파일 그대로, 없으면 0666 & ~umask)"""
+        try:
+            return os.stat(self.state_file).st_mode & 0o777
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    def _write_snapshot_locked(self) -> None:
+        """_base를 state.json으로 원자적 교체 후 저널 비우기"""
+        import tempfile
+
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{self.state_file.name}.", suffix=".tmp", dir=str(self.state_file.parent)
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._base, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp는 0600으로 만들므로 기존 파일 권한 유지 (새 파일이면 umask 기준 기본값)
+            os.chmod(tmp_path, self._snapshot_mode())
+            os.replace(tmp_path, self.state_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        # 스냅샷이 저널 내용을 모두 포함하므로 비움 (중단되어도 재생은 멱등)
+        if self.journal_file.exists():
+            with open(self.journal_file, 'wb'):
+                pass
+        self._snapshot_sig = self._stat_sig()
+        self._journal_pos = 0
+        self._journal_entries = 0
+        self._journal_dirty = False
+
+    def _append_journal_locked(self, ops: List[Dict[str, Any]]) -> None:
+        entry = {"ts": datetime.now().isoformat(), "pid": os.getpid(), "ops": ops}
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8')
+        with open(self.journal_file, 'ab') as f:
+            f.write(line)
+        self._journal_pos += len(line)
+        self._journal_entries += 1
+
+        if not self._journal_dirty:
+            import atexit
+            atexit.register(self.compact)
+        self._journal_dirty = True
+
+    # ------------------------------------------------------------------------
+    # 연산 (모두 멱등)
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _apply_op(state: Dict[str, Any], op: Dict[str, Any]) -> None:
+        """저널 연산 하나를 state에 적용
+
+        - set: path 위치에 value 설정 (중간 dict 자동 생성)
+        - del: path 위치 키 삭제
+        - add: path 위치 리스트에 value 추가 (중복 제외, 리스트가 아니면 값 교체)
+        - complete_scene: pending → completed 이동 후 current 갱신
+        """
+        kind = op.get("op")
+
+        if kind == "complete_scene":
+            scenes = state.setdefault("scenes", {})
+            pending = scenes.setdefault("pending", [])
+            completed = scenes.setdefault("completed", [])
+            scene_id = op["value"]
+            if scene_id in pending:
+                pending.remove(scene_id)
+            if scene_id not in completed:
+                completed.append(scene_id)
+            scenes["current"] = pending[0] if pending else None
+            return
+
+        path = op.get("path") or []
+        if not path:
+            if kind == "set" and isinstance(op.get("value"), dict):
+                state.clear()
+                state.update(op["value"])
+            return
+
+        target = state
+        for k in path[:-1]:
+            if not isinstance(target.get(k), dict):
+                if kind == "del":
+                    return
+                target[k] = {}
+            target = target[k]
+        key = path[-1]
+
+        if kind == "set":
+            target[key] = op.get("value")
+        elif kind == "del":
+            target.pop(key, None)
+        elif kind == "add":
+            current = target.get(key)
+            if current is None and key not in target:
+                target[key] = [op["value"]]
+            elif isinstance(current, list):
+                if op["value"] not in current:
+                    current.append(op["value"])
+            else:
+                target[key] = op["value"]
+
+    @classmethod
+    def _diff_ops(cls, base: Any, current: Any, path: List[str] = None) -> List[Dict[str, Any]]:
+        """base → current 변경을 set/del 연산으로 (dict는 키 단위로 내려감)"""
+        path = path or []
+        if not (isinstance(base, dict) and isinstance(current, dict)):
+            return [] if base == current else [{"op": "set", "path": path, "value": current}]
+
+        ops = []
+        for k, v in current.items():
+            if k not in base:
+                ops.append({"op": "set", "path": path + [k], "value": v})
+            elif base[k] != v:
+                ops.extend(cls._diff_ops(base[k], v, path + [k]))
+        for k in base:
+            if k not in current:
+                ops.append({"op": "del", "path": path + [k]})
+        return ops
+
+    def _commit(self, ops: List[Dict[str, Any]] = None, snapshot: bool = False) -> None:
+        """작업 사본 변경분 + 추가 연산을 디스크 상태에 병합해 기록
+
+        Args:
+            ops: 작업 사본에 이미 적용한 연산 (add, complete_scene 등) - 그대로 저널에 기록
+            snapshot: True면 state.json까지 바로 교체, False면 저널에만 추가
+        """
+        import copy
+
+        with self._lock, self._file_lock:
+            if self._state is None:
+                self._refresh_locked()
+                self._state = copy.deepcopy(self._base)
+
+            # ops는 작업 사본에 이미 반영되어 있으므로, 나머지 직접 수정분만 diff로 추출
+            ops = list(ops or [])
+            expected = copy.deepcopy(self._base)
+            for op in ops:
+                self._apply_op(expected, op)
+            local_ops = self._diff_ops(expected, self._state)
+            all_ops = ops + local_ops
+            all_ops.append({"op": "set", "path": ["last_updated"], "value": datetime.now().isoformat()})
+
+            self._refresh_locked()
+            for op in all_ops:
+                self._apply_op(self._base, op)
+
+            if snapshot or self._journal_entries + 1 > STATE_CONFIG["journal_compact_every"]:
+                self._write_snapshot_locked()
+            else:
+                self._append_journal_locked(all_ops)
+
+            # 기존 참조(state = self.load())가 계속 유효하도록 제자리 갱신
+            self._state.clear()
+            self._state.update(copy.deepcopy(self._base))
+            self._member_index.clear()
+
+        self._sync_project_index(all_ops)
+
+    def _sync_project_index(self, ops: List[Dict[str, Any]]) -> None:
+        """프로젝트 인덱스(SQLite)에 단계/제목 반영, 추가된 파일의 폴더는 재계산 표시
+
+        인덱스는 보조 데이터이므로 실패해도 state 기록에는 영향을 주지 않습니다.
+        """
+        state = self._base or {}
+        project_id = state.get("project_id")
+        if not project_id:
+            return
+
+        try:
+            index = get_project_index()
+            key = (project_id, state.get("title"), state.get("current_phase"),
+                   state.get("scenes", {}).get("total"), state.get("settings", {}).get("duration"))
+            if key != self._indexed:
+                index.record_state(*key)
+                self._indexed = key
+
+            paths = [op.get("value", "") for op in ops
+                     if op.get("op") == "add" and op.get("path", [None])[0] == "files"]
+            self._invalidate_index_folders(project_id, paths)
+        except Exception as e:
+            print(f"⚠️  프로젝트 인덱스 갱신 실패 (무시): {e}")
+
+    @staticmethod
+    def _invalidate_index_folders(project_id: str, paths: List[Any]) -> None:
+        """파일 경로들이 속한 프로젝트 폴더를 인덱스에서 재계산 표시"""
+        folders = set()
+        for path in paths:
+            parts = [p for p in re.split(r"[\\/]", str(path)) if p]
+            if project_id in parts[:-2]:
+                folders.add(parts[parts.index(project_id) + 1])
+            elif len(parts) >= 2:
+                folders.add(parts[-2])
+        get_project_index().invalidate(project_id, sorted(folders))
+
+    def _invalidate_touched(self, paths: List[Any]) -> None:
+        """이미 목록에 있던 파일들의 인덱스 폴더 재계산 표시 (실패해도 무시)"""
+        project_id = (self._state or {}).get("project_id")
+        if not project_id or not paths:
+            return
+        try:
+            self._invalidate_index_folders(project_id, paths)
+        except Exception as e:
+            print(f"⚠️  프로젝트 인덱스 갱신 실패 (무시): {e}")
+
+    def _record(self, ops: List[Dict[str, Any]] = None, snapshot: bool = False) -> None:
+        """연산 기록 (batch() 안이면 블록이 끝날 때까지 보류)"""
+        with self._lock:
+            if self._batch_depth:
+                self._batch_ops.extend(ops or [])
+                self._batch_snapshot = self._batch_snapshot or snapshot
+            else:
+                self._commit(ops, snapshot=snapshot)
+
+    def batch(self):
+        """여러 변경을 한 번의 기록으로 묶는 컨텍스트 매니저 (중첩 가능)
+
+        블록 안의 add_file/add_completed_scene/save 호출은 바로 쓰지 않고,
+        가장 바깥 블록이 끝날 때 한 번에 기록합니다 (예외로 빠져나와도 진행분은 기록).
+
+        예:
+            with state.batch():
+                for f in files:
+                    state.add_file("audio", f)
+        """
+        from contextlib import contextmanager
+
+        @contextmanager
+        def _batch():
+            with self._lock:
+                self.load()
+                self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                with self._lock:
+                    self._batch_depth -= 1
+                    if self._batch_depth == 0:
+                        ops, snapshot, touched = self._batch_ops, self._batch_snapshot, self._batch_touched
+                        self._batch_ops, self._batch_snapshot, self._batch_touched = [], False, []
+                        if ops or snapshot:
+                            self._commit(ops, snapshot=snapshot)
+                        self._invalidate_touched(touched)
+
+        return _batch()
+
+    def _contains(self, items: List[Any], value: Any) -> bool:
+        """리스트 중복 검사 (set 인덱스, 리스트가 바뀌면 다시 만듦)"""
+        entry = self._member_index.get(id(items))
+        if entry is None or entry[0] is not items or entry[1] != len(items):
+            entry = (items, len(items), set(items))
+            self._member_index[id(items)] = entry
+        return value in entry[2]
+
+    def _append_unique(self, items: List[Any], value: Any) -> bool:
+        """중복이 아니면 리스트에 추가 (추가했으면 True)"""
+        if self._contains(items, value):
+            return False
+        items.append(value)
+        members = self._member_index[id(items)][2]
+        members.add(value)
+        self._member_index[id(items)] = (items, len(items), members)
+        return True
+
+    def compact(self) -> None:
+        """저널을 state.json 스냅샷으로 합침 (종료 시 자동 호출)"""
+        with self._lock:
+            if not self._journal_dirty:
+                return
+            with self._file_lock:
+                self._refresh_locked()
+                self._write_snapshot_locked()
+
+    # ------------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------------
+
     def load(self) -> Dict[str, Any]:
-        """state.json 로드"""
+        """state.json 로드 (스냅샷 + 저널 재생)"""
+        import copy
+
         if self._state is not None:
             return self._state
 
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    self._state = json.load(f)
-            except json.JSONDecodeError:
-                print(f"⚠️  {self.state_file} 파싱 오류. 초기화합니다.")
-                self._state = self._default_state()
-        else:
-            self._state = self._default_state()
+        with self._lock, self._file_lock:
+            if self._state is None:
+                self._refresh_locked()
+                self._state = copy.deepcopy(self._base)
 
         return self._state
 
     def reload(self) -> Dict[str, Any]:
-        """state.json 강제 재로드 (캐시 무시)"""
-        self._state = None
-        return self.load()
+        """state.json 강제 재로드 (캐시 무시, 저장하지 않은 변경은 버림)"""
+        with self._lock:
+            self._state = None
+            self._base = None
+            self._snapshot_sig = None
+            return self.load()
     
     def save(self) -> None:
-        """state.json 저장"""
-        if self._state is None:
-            self._state = self._default_state()
-        
-        self._state["last_updated"] = datetime.now().isoformat()
-        
-        with open(self.state_file, 'w', encoding='utf-8') as f:
-            json.dump(self._state, f, ensure_ascii=False, indent=2)
+        """state.json 저장 (변경분 병합 + 원자적 교체)"""
+        with self._lock:
+            self.load()
+            self._record(snapshot=True)
     
     def _default_state(self) -> Dict[str, Any]:
         """기본 상태"""
@@ -348,15 +1163,16 @@ class StateManager:
     
     def set(self, key: str, value: Any) -> None:
         """상태 값 설정"""
-        state = self.load()
-        keys = key.split(".")
-        target = state
-        for k in keys[:-1]:
-            if k not in target:
-                target[k] = {}
-            target = target[k]
-        target[keys[-1]] = value
-        self._state = state
+        with self._lock:
+            state = self.load()
+            keys = key.split(".")
+            target = state
+            for k in keys[:-1]:
+                if k not in target:
+                    target[k] = {}
+                target = target[k]
+            target[keys[-1]] = value
+            self._state = state
     
     def update_phase(self, phase: str) -> None:
         """현재 단계 업데이트"""
@@ -365,45 +1181,44 @@ class StateManager:
         print(f"✅ state.json 업데이트됨: current_phase = {phase}")
     
     def add_completed_scene(self, scene_id: str) -> None:
-        """완료된 씬 추가"""
-        state = self.load()
-        
-        if scene_id in state["scenes"]["pending"]:
-            state["scenes"]["pending"].remove(scene_id)
-        
-        if scene_id not in state["scenes"]["completed"]:
-            state["scenes"]["completed"].append(scene_id)
-        
-        # 현재 씬 업데이트
-        if state["scenes"]["pending"]:
-            state["scenes"]["current"] = state["scenes"]["pending"][0]
-        else:
-            state["scenes"]["current"] = None
-        
-        self._state = state
-        self.save()
+        """완료된 씬 추가 (저널에만 기록 - 병렬 워커에서 호출해도 안전)"""
+        with self._lock:
+            state = self.load()
+            op = {"op": "complete_scene", "value": scene_id}
+            self._apply_op(state, op)
+            self._record([op])
     
     def reset(self) -> None:
         """상태를 기본값으로 초기화"""
-        self._state = self._default_state()
-        self.save()
+        with self._lock:
+            self.load()
+            self._state.clear()
+            self._state.update(self._default_state())
+            self.save()
         print("✅ state.json 초기화됨")
 
     def add_file(self, category: str, filepath: str) -> None:
-        """파일 경로 추가"""
-        state = self.load()
-        
-        if category not in state["files"]:
-            state["files"][category] = []
-        
-        if isinstance(state["files"][category], list):
-            if filepath not in state["files"][category]:
-                state["files"][category].append(filepath)
-        else:
-            state["files"][category] = filepath
-        
-        self._state = state
-        self.save()
+        """파일 경로 추가 (저널에만 기록 - 병렬 워커에서 호출해도 안전)"""
+        with self._lock:
+            state = self.load()
+            files = state.setdefault("files", {})
+            current = files.get(category)
+
+            if isinstance(current, list):
+                if not self._append_unique(current, filepath):
+                    # 이미 있음 - 기록할 변경은 없지만 같은 이름으로 덮어쓴 파일일 수 있음
+                    # (제자리 덮어쓰기는 폴더 mtime이 안 바뀌므로 인덱스 폴더를 직접 재계산 표시)
+                    if self._batch_depth:
+                        self._batch_touched.append(filepath)
+                    else:
+                        self._invalidate_touched([filepath])
+                    return
+            elif current is None and category not in files:
+                files[category] = [filepath]
+            else:
+                files[category] = filepath
+
+            self._record([{"op": "add", "path": ["files", category], "value": filepath}])
     
     # ========================================================================
     # /clear 후 재개를 위한 상세 업데이트 함수들
@@ -529,8 +1344,7 @@ class StateManager:
             state['scenes'] = {'total': 0, 'completed': [], 'pending': [], 'current': None}
         
         # completed에 추가
-        if scene_id not in state['scenes']['completed']:
-            state['scenes']['completed'].append(scene_id)
+        self._append_unique(state['scenes']['completed'], scene_id)
         
         # pending에서 제거
         if scene_id in state['scenes']['pending']:
@@ -554,8 +1368,7 @@ class StateManager:
                 'subtitles': []
             }
         
-        if manim_file not in state['files']['manim']:
-            state['files']['manim'].append(manim_file)
+        self._append_unique(state['files']['manim'], manim_file)
         
         self._state = state
         self.save()
@@ -623,39 +1436,456 @@ class StateManager:
 
 
 # ============================================================================
-# 프로젝트 관리 클래스
+# 프로젝트 인덱스 (SQLite)
 # ============================================================================
 
-class ProjectManager:
-    """프로젝트 초기화 및 관리"""
-    
-    def __init__(self, state_manager: StateManager):
-        self.state = state_manager
-    
-    def init_project(
-        self,
-        title: str,
-        duration: int = 480,
-        style: str = "cyberpunk",
-        difficulty: str = "intermediate",
-        aspect_ratio: str = "16:9",
-        voice: str = "ko-KR-Neural2-C"
-    ) -> str:
-        """새 프로젝트 초기화"""
-        
-        # 프로젝트 ID 생성
-        project_id = f"P{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        # 출력 디렉토리 생성
-        project_dir = OUTPUT_DIR / project_id
-        folders = [
-            "0_audio",
-            "1_script",
-            "2_scenes",
-            "3_visual_plans",
-            "4_manim_code",
-            "5_validation",
-            "6_image_prompts",
+class ProjectIndex:
+    """output/P*/ 프로젝트 목록·단계·폴더별 파일 수/크기 인덱스 (cache/projects.db)
+
+    - 폴더 크기는 폴더의 수정시각(mtime)이 바뀐 경우에만 다시 계산 (파일 stat 생략)
+    - 제목/단계/씬 수는 StateManager가 state.json을 기록할 때 갱신
+    - reindex()는 디스크에서 전체를 다시 계산
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS projects (
+            id TEXT PRIMARY KEY,
+            path TEXT,
+            title TEXT,
+            phase TEXT,
+            scenes_total INTEGER,
+            duration INTEGER,
+            updated_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS folders (
+            project_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            files INTEGER NOT NULL DEFAULT 0,
+            size INTEGER NOT NULL DEFAULT 0,
+            mtime_ns INTEGER NOT NULL DEFAULT -1,
+            PRIMARY KEY (project_id, name)
+        );
+    """
+
+    def __init__(self, db_file: Path = None, output_dir: Path = None):
+        import threading
+
+        self.db_file = Path(db_file or PROJECT_INDEX_CONFIG["db_file"])
+        self.output_dir = Path(output_dir or OUTPUT_DIR)
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        import sqlite3
+
+        if self._conn is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_file), timeout=PROJECT_INDEX_CONFIG["busy_timeout"],
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _scan_folder(folder: Path) -> tuple:
+        """폴더 바로 아래 파일 수/크기 (하위 폴더는 제외, 기존 list와 동일 기준)"""
+        files = 0
+        size = 0
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_file():
+                        files += 1
+                        size += entry.stat().st_size
+        except OSError:
+            pass
+        return files, size
+
+    def refresh(self, project_id: Optional[str] = None, full: bool = False) -> None:
+        """디스크와 인덱스 동기화
+
+        Args:
+            project_id: 지정하면 해당 프로젝트만 (없으면 output/P* 전체 + 사라진 프로젝트 정리)
+            full: True면 mtime과 관계없이 모든 폴더 재계산
+        """
+        if project_id:
+            project_dirs = [self.output_dir / project_id]
+        elif self.output_dir.exists():
+            with os.scandir(self.output_dir) as it:
+                project_dirs = [Path(e.path) for e in it if e.is_dir() and e.name.startswith("P")]
+        else:
+            project_dirs = []
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if not project_id:
+                    names = {p.name for p in project_dirs}
+                    known = {r["id"] for r in conn.execute("SELECT id FROM projects")}
+                    for gone in known - names:
+                        conn.execute("DELETE FROM projects WHERE id = ?", (gone,))
+                        conn.execute("DELETE FROM folders WHERE project_id = ?", (gone,))
+
+                for project_dir in project_dirs:
+                    self._refresh_project(conn, project_dir, full)
+
+    def _refresh_project(self, conn, project_dir: Path, full: bool) -> None:
+        pid = project_dir.name
+        if not project_dir.is_dir():
+            conn.execute("DELETE FROM projects WHERE id = ?", (pid,))
+            conn.execute("DELETE FROM folders WHERE project_id = ?", (pid,))
+            return
+
+        conn.execute("INSERT OR IGNORE INTO projects (id, path) VALUES (?, ?)", (pid, str(project_dir)))
+        stored = {r["name"]: r["mtime_ns"] for r in
+                  conn.execute("SELECT name, mtime_ns FROM folders WHERE project_id = ?", (pid,))}
+
+        seen = set()
+        with os.scandir(project_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                seen.add(entry.name)
+                mtime_ns = entry.stat().st_mtime_ns
+                if not full and stored.get(entry.name) == mtime_ns:
+                    continue
+                files, size = self._scan_folder(Path(entry.path))
+                conn.execute(
+                    "INSERT OR REPLACE INTO folders (project_id, name, files, size, mtime_ns) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (pid, entry.name, files, size, mtime_ns)
+                )
+
+        for gone in set(stored) - seen:
+            conn.execute("DELETE FROM folders WHERE project_id = ? AND name = ?", (pid, gone))
+
+    def record_state(self, project_id: str, title: Optional[str] = None, phase: Optional[str] = None,
+                     scenes_total: Optional[int] = None, duration: Optional[int] = None) -> None:
+        """state.json 기준 제목/단계/씬 수 기록"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO projects (id, path, title, phase, scenes_total, duration, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET title = excluded.title, phase = excluded.phase, "
+                    "scenes_total = excluded.scenes_total, duration = excluded.duration, "
+                    "updated_at = excluded.updated_at",
+                    (project_id, str(self.output_dir / project_id), title, phase,
+                     scenes_total, duration, datetime.now().isoformat())
+                )
+
+    def invalidate(self, project_id: str, folders: List[str]) -> None:
+        """폴더를 다음 refresh()에서 다시 계산하도록 표시 (같은 파일명 덮어쓰기 대비)"""
+        if not folders:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "UPDATE folders SET mtime_ns = -1 WHERE project_id = ? AND name = ?",
+                    [(project_id, name) for name in folders]
+                )
+
+    def projects(self) -> List[Dict[str, Any]]:
+        """인덱스의 프로젝트 목록 (최신순, list_projects와 같은 형식 + 제목/단계)"""
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute("SELECT * FROM projects ORDER BY id DESC").fetchall()
+            folder_rows = conn.execute("SELECT project_id, name, files, size FROM folders").fetchall()
+
+        folders: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for r in folder_rows:
+            folders.setdefault(r["project_id"], {})[r["name"]] = {"files": r["files"], "size": r["size"]}
+
+        projects = []
+        for r in rows:
+            project_folders = folders.get(r["id"], {})
+            projects.append({
+                "id": r["id"],
+                "path": r["path"],
+                "title": r["title"],
+                "phase": r["phase"],
+                "scenes_total": r["scenes_total"],
+                "duration": r["duration"],
+                "folders": project_folders,
+                "total_size": sum(f["size"] for f in project_folders.values())
+            })
+        return projects
+
+    def get(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """프로젝트 하나 조회"""
+        for p in self.projects():
+            if p["id"] == project_id:
+                return p
+        return None
+
+    def reindex(self) -> int:
+        """디스크에서 전체 재계산 (제목/단계는 유지, 없으면 project_summary.json에서 보충)"""
+        self.refresh(full=True)
+
+        with self._lock:
+            conn = self._connect()
+            missing = [r["id"] for r in conn.execute("SELECT id FROM projects WHERE title IS NULL")]
+
+        for pid in missing:
+            summary_file = self.output_dir / pid / "project_summary.json"
+            if not summary_file.exists():
+                continue
+            try:
+                with open(summary_file, 'r', encoding='utf-8') as f:
+                    summary = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self.record_state(
+                pid,
+                title=summary.get("title"),
+                scenes_total=summary.get("scenes", {}).get("count"),
+                duration=summary.get("config", {}).get("duration")
+            )
+
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+
+_project_index = None
+
+
+def get_project_index() -> ProjectIndex:
+    """프로세스 공용 ProjectIndex"""
+    global _project_index
+    if _project_index is None:
+        _project_index = ProjectIndex()
+    return _project_index
+
+
+# ============================================================================
+# 씬 저장소 (2_scenes/scenes.json + 개별 s*.json)
+# ============================================================================
+
+class SceneStore:
+    """프로젝트 씬 데이터 읽기/쓰기 단일 창구
+
+    - scenes.json은 배열, {"scenes": [...]} 두 형태 모두 읽고 저장 시 원래 형태 유지
+    - 파일 (크기, 수정시각) 기준 프로세스 캐시: 바뀌지 않았으면 다시 파싱하지 않음 (serve 모드에서 유효)
+    - scene_id → 씬 dict 인덱스로 바로 조회, 정렬은 s32a 같은 ID도 자연 정렬
+    - save()는 scenes.json만 씀. 개별 s*.json은 split/merge(sync_files=True)나 save_scene_file()로만 갱신
+      (scene-editor가 개별 파일을 먼저 만들거나 직접 고치므로 덮어쓰거나 지우지 않음)
+
+    반환되는 씬 dict는 캐시와 공유합니다. 수정하려면 복사한 뒤 save()/save_scene_file()로 저장하세요.
+    """
+
+    SCENE_FILE_RE = re.compile(r"^s\d+[a-z]*$")  # 개별 씬 파일 (scenes.json, scenes_part1.json 제외)
+
+    _cache: Dict[str, tuple] = {}  # 파일 경로 → ((크기, 수정시각), 파싱 결과)
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = Path(project_dir)
+        self.scenes_dir = self.project_dir / "2_scenes"
+        self.scenes_file = self.scenes_dir / "scenes.json"
+
+    @classmethod
+    def for_project(cls, project_id: str) -> 'SceneStore':
+        return cls(OUTPUT_DIR / project_id)
+
+    @staticmethod
+    def natural_key(scene_id: str) -> tuple:
+        """씬 ID 자연 정렬 키 (s2 < s10 < s32 < s32a < s33)"""
+        match = re.match(r"^([^\d]*)(\d+)(.*)$", scene_id)
+        if match:
+            return (0, match.group(1), int(match.group(2)), match.group(3))
+        return (1, scene_id, 0, "")
+
+    # ------------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def _read(cls, path: Path, parse=None) -> Any:
+        """JSON 파일 읽기 (변경 없으면 캐시, 없으면 None)"""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+
+        key = str(path.absolute())
+        sig = (st.st_size, st.st_mtime_ns)
+        cached = cls._cache.get(key)
+        if cached and cached[0] == sig:
+            return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        value = parse(data) if parse else data
+        cls._cache[key] = (sig, value)
+        return value
+
+    @staticmethod
+    def _index(data: Any) -> Dict[str, Any]:
+        """scenes.json 내용 → {raw, scenes, ids, index} (형식 검증 포함)"""
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict):
+            items = data.get("scenes", [])
+        else:
+            items = []
+
+        scenes, ids, index, problems = [], [], {}, []
+        for i, scene in enumerate(items, 1):
+            if not isinstance(scene, dict):
+                problems.append(f"{i}번째 항목이 객체가 아닙니다")
+                continue
+            scene_id = scene.get("scene_id") or f"s{i}"
+            if scene_id in index:
+                problems.append(f"scene_id 중복: {scene_id}")
+                continue
+            scenes.append(scene)
+            ids.append(scene_id)
+            index[scene_id] = scene
+
+        if problems:
+            print(f"⚠️  scenes.json 형식 문제 {len(problems)}건 (해당 항목 제외): {', '.join(problems[:5])}")
+
+        return {"raw": data, "scenes": scenes, "ids": ids, "index": index}
+
+    def _loaded(self) -> Dict[str, Any]:
+        loaded = self._read(self.scenes_file, self._index)
+        return loaded or {"raw": None, "scenes": [], "ids": [], "index": {}}
+
+    def exists(self) -> bool:
+        return self.scenes_file.exists()
+
+    def scenes(self) -> List[Dict[str, Any]]:
+        """scenes.json 순서의 씬 목록 (없으면 빈 목록)"""
+        return self._loaded()["scenes"]
+
+    def ids(self) -> List[str]:
+        """scenes.json 순서의 씬 ID (scene_id 없는 항목은 s{순번})"""
+        return self._loaded()["ids"]
+
+    def sorted_ids(self) -> List[str]:
+        """자연 정렬한 씬 ID"""
+        return sorted(self.ids(), key=self.natural_key)
+
+    def all_ids(self) -> List[str]:
+        """scenes.json 씬 + 개별 파일만 있는 씬 (자연 정렬)"""
+        ids = set(self.ids())
+        if self.scenes_dir.exists():
+            ids.update(f.stem for f in self.scenes_dir.glob("s*.json") if self.SCENE_FILE_RE.match(f.stem))
+        return sorted(ids, key=self.natural_key)
+
+    def get(self, scene_id: str, prefer_file: bool = True) -> Optional[Dict[str, Any]]:
+        """씬 하나 조회 (기본: 개별 s*.json 우선, 없으면 scenes.json 항목)"""
+        if prefer_file:
+            scene = self.scene_file(scene_id)
+            if scene is not None:
+                return scene
+        return self._loaded()["index"].get(scene_id)
+
+    # ------------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def _write(cls, path: Path, data: Any) -> None:
+        """원자적 저장 (임시 파일 → os.replace) + 캐시 무효화"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+        cls._cache.pop(str(path.absolute()), None)
+
+    def save(self, scenes: List[Dict[str, Any]], meta: Optional[Dict[str, Any]] = None,
+             sync_files: bool = False) -> Path:
+        """scenes.json 저장
+
+        Args:
+            scenes: 씬 목록 (저장 순서 = 영상 순서)
+            meta: 주면 {"...meta", "scenes": [...]} 형태로 저장.
+                  없으면 기존 scenes.json 형태 유지 (객체면 다른 키 보존, 새 파일이면 배열)
+            sync_files: True면 목록의 씬을 개별 s*.json으로도 씀 (split-scenes/merge-scenes 전용,
+                        내용이 바뀐 파일만 다시 씀). 목록에 없는 개별 파일은 건드리지 않습니다.
+        """
+        raw = self._loaded()["raw"]
+        if meta is not None:
+            data = dict(meta)
+            data["scenes"] = scenes
+        elif isinstance(raw, dict):
+            data = {k: v for k, v in raw.items() if k != "scenes"}
+            if "total_scenes" in data:
+                data["total_scenes"] = len(scenes)
+            if "total_duration" in data:
+                data["total_duration"] = sum(s.get("duration", 0) for s in scenes)
+            data["scenes"] = scenes
+        else:
+            data = scenes
+
+        self._write(self.scenes_file, data)
+
+        if sync_files:
+            for i, scene in enumerate(scenes, 1):
+                scene_id = scene.get("scene_id") or f"s{i}"
+                try:
+                    current = self._read(self.scenes_dir / f"{scene_id}.json")
+                except (json.JSONDecodeError, OSError):
+                    current = None
+                if current != scene:
+                    self.save_scene_file(scene_id, scene)
+
+        return self.scenes_file
+
+    def scene_file(self, scene_id: str) -> Optional[Dict[str, Any]]:
+        """개별 s*.json 내용 (없거나 읽을 수 없으면 None)"""
+        try:
+            scene = self._read(self.scenes_dir / f"{scene_id}.json")
+        except (json.JSONDecodeError, OSError):
+            return None
+        return scene if isinstance(scene, dict) else None
+
+    def save_scene_file(self, scene_id: str, scene: Dict[str, Any]) -> Path:
+        """개별 s*.json 하나 저장 (scenes.json은 그대로)"""
+        scene_file = self.scenes_dir / f"{scene_id}.json"
+        self._write(scene_file, scene)
+        return scene_file
+
+
+# ============================================================================
+# 프로젝트 관리 클래스
+# ============================================================================
+
+class ProjectManager:
+    """프로젝트 초기화 및 관리"""
+    
+    def __init__(self, state_manager: StateManager):
+        self.state = state_manager
+    
+    def init_project(
+        self,
+        title: str,
+        duration: int = 480,
+        style: str = "cyberpunk",
+        difficulty: str = "intermediate",
+        aspect_ratio: str = "16:9",
+        voice: str = "ko-KR-Neural2-C"
+    ) -> str:
+        """새 프로젝트 초기화"""
+        
+        # 프로젝트 ID 생성
+        project_id = f"P{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
+        # 출력 디렉토리 생성
+        project_dir = OUTPUT_DIR / project_id
+        folders = [
+            "0_audio",
+            "1_script",
+            "2_scenes",
+            "3_visual_plans",
+            "4_manim_code",
+            "5_validation",
+            "6_image_prompts",
             "7_subtitles",
             "8_renders",
             "9_backgrounds",
@@ -773,6 +2003,13 @@ class ProjectManager:
         print(f"   오디오: {len(files.get('audio', []))}개")
         print(f"   Manim: {len(files.get('manim', []))}개")
         print(f"   자막: {len(files.get('subtitles', []))}개")
+
+        index = get_project_index()
+        index.refresh(state["project_id"])
+        indexed = index.get(state["project_id"])
+        if indexed:
+            file_count = sum(f["files"] for f in indexed["folders"].values())
+            print(f"   디스크: {file_count}개 파일, {indexed['total_size'] / (1024 * 1024):.1f} MB")
         print()
         
         if state.get("last_updated"):
@@ -831,39 +2068,17 @@ class ProjectManager:
             print("   🎉 프로젝트가 완료되었습니다!")
 
     def list_projects(self) -> List[Dict]:
-        """output 폴더 내 모든 프로젝트 목록 조회"""
-        projects = []
+        """output 폴더 내 모든 프로젝트 목록 조회 (프로젝트 인덱스 사용)
 
+        바뀐 폴더만 다시 계산합니다. 전체 재계산: python math_video_pipeline.py reindex
+        """
         if not OUTPUT_DIR.exists():
             print("❌ output 폴더가 없습니다.")
-            return projects
-
-        for item in OUTPUT_DIR.iterdir():
-            if item.is_dir() and item.name.startswith("P"):
-                # 프로젝트 폴더 정보 수집
-                project_info = {
-                    "id": item.name,
-                    "path": str(item),
-                    "folders": {},
-                    "total_size": 0
-                }
-
-                # 각 하위 폴더 상태 확인
-                for folder in item.iterdir():
-                    if folder.is_dir():
-                        files = list(folder.glob("*"))
-                        file_count = len([f for f in files if f.is_file()])
-                        folder_size = sum(f.stat().st_size for f in files if f.is_file())
-                        project_info["folders"][folder.name] = {
-                            "files": file_count,
-                            "size": folder_size
-                        }
-                        project_info["total_size"] += folder_size
-
-                projects.append(project_info)
+            return []
 
-        # 날짜 기준 정렬 (최신순)
-        projects.sort(key=lambda x: x["id"], reverse=True)
+        index = get_project_index()
+        index.refresh()
+        projects = index.projects()  # 최신순
 
         # 출력
         print("\n" + "="*70)
@@ -879,7 +2094,10 @@ class ProjectManager:
         for p in projects:
             is_current = "⭐" if p["id"] == current_project else "  "
             size_mb = p["total_size"] / (1024 * 1024)
-            print(f"{is_current} {p['id']} ({size_mb:.1f} MB)")
+            phase = f" [{p['phase']}]" if p.get("phase") else ""
+            print(f"{is_current} {p['id']} ({size_mb:.1f} MB){phase}")
+            if p.get("title"):
+                print(f"      제목: {p['title']}")
 
             # 주요 폴더 상태
             folder_status = []
@@ -898,6 +2116,26 @@ class ProjectManager:
 
         return projects
 
+    def reindex_projects(self) -> int:
+        """프로젝트 인덱스를 디스크에서 전체 재생성"""
+        import time
+
+        start = time.perf_counter()
+        index = get_project_index()
+        count = index.reindex()
+
+        # 현재 프로젝트의 제목/단계는 state.json 기준으로 기록
+        state = self.state.load()
+        if state.get("project_id"):
+            index.record_state(
+                state["project_id"], state.get("title"), state.get("current_phase"),
+                state.get("scenes", {}).get("total"), state.get("settings", {}).get("duration")
+            )
+
+        print(f"✅ 프로젝트 인덱스 재생성: {count}개 프로젝트 ({time.perf_counter() - start:.2f}초)")
+        print(f"   📁 {index.db_file}")
+        return count
+
     def delete_project(self, project_id: str, force: bool = False) -> bool:
         """프로젝트 삭제"""
         import shutil
@@ -1097,6 +2335,759 @@ class ProjectManager:
         return self.clean_project(project_id, target_folders, force=True)
 
 
+# ============================================================================
+# 미디어 메타데이터 (길이/스트림 정보)
+# ============================================================================
+
+class MediaProbe:
+    """오디오/비디오 길이와 스트림 정보 조회 (프로세스 내 공유 + 디스크 캐시)
+
+    - WAV: wave 모듈로 헤더 읽기
+    - MP3: 프레임 헤더 직접 파싱 (Xing/Info/VBRI 프레임 수, 없으면 프레임 스캔)
+    - 그 외 (mp4, mov, m4a...): ffprobe JSON 1회 (format + streams)
+    - 결과는 cache/media_meta.json에 (경로, 크기, mtime_ns) 기준으로 저장
+    - probe()는 메모리에만 기록, 디스크 저장은 명령당 1회 (probe_many 끝, 프로세스 종료, serve 명령 후)
+    - probe_many(): 캐시에 없는 파일만 스레드 풀로 병렬 측정 후 한 번에 저장
+
+    결과 형식:
+        {"duration": 12.3, "size": 123456, "format": "mp3",
+         "streams": [{"codec_type": "audio", "codec_name": "mp3", ...}]}
+    """
+
+    # MPEG Audio Layer III 비트레이트 (kbps) - MPEG1 / MPEG2·2.5
+    MP3_BITRATES = {
+        1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+        2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+    }
+    # 버전 비트(00=2.5, 10=2, 11=1)별 샘플레이트
+    MP3_SAMPLE_RATES = {
+        0: [11025, 12000, 8000],
+        2: [22050, 24000, 16000],
+        3: [44100, 48000, 32000]
+    }
+
+    STREAM_ENTRIES = ("codec_type,codec_name,profile,width,height,pix_fmt,r_frame_rate,"
+                      "time_base,sample_rate,channels,duration")
+
+    def __init__(self, ffprobe_path: Optional[str] = None, cache_file: Optional[Path] = None):
+        import shutil
+        import threading
+
+        self.ffprobe_path = ffprobe_path or shutil.which("ffprobe") or "ffprobe"
+        self.cache_file = Path(cache_file or MEDIA_PROBE_CONFIG["cache_file"])
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # flush 직렬화 (스레드끼리 임시 파일/교체 경합 방지)
+        self._dirty = False
+        self._entries = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def flush(self):
+        """변경된 캐시를 디스크에 저장 (고유 임시 파일 → 교체, 사라진 파일 항목 정리)"""
+        import tempfile
+
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = dict(self._entries)
+                self._dirty = False
+
+            gone = [key for key in snapshot if not os.path.exists(key)]
+            for key in gone:
+                del snapshot[key]
+
+            tmp_file = None
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_file = tempfile.mkstemp(prefix=f".{self.cache_file.name}.", suffix=".tmp",
+                                                dir=str(self.cache_file.parent))
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, ensure_ascii=False)
+                os.replace(tmp_file, self.cache_file)
+            except OSError as e:
+                print(f"⚠️ 미디어 캐시 저장 실패: {e}")
+                if tmp_file:
+                    try:
+                        os.unlink(tmp_file)
+                    except OSError:
+                        pass
+                with self._lock:
+                    self._dirty = True
+                return
+
+            if gone:
+                with self._lock:
+                    for key in gone:
+                        self._entries.pop(key, None)
+
+    @staticmethod
+    def _cache_key(path: Path) -> str:
+        return str(path.resolve())
+
+    def _cached(self, path: Path, stat) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(self._cache_key(path))
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["info"]
+        return None
+
+    def probe(self, file_path, save: bool = False) -> Optional[Dict[str, Any]]:
+        """파일 메타데이터 (없거나 측정 실패 시 None)
+
+        Args:
+            save: True면 바로 디스크에 저장 (기본은 명령 끝에 한 번 저장)
+        """
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        info = self._cached(path, stat)
+        if info is not None:
+            return info
+
+        info = None
+        if path.suffix.lower() in MEDIA_PROBE_CONFIG["native_formats"]:
+            try:
+                info = self._probe_native(path)
+            except (OSError, EOFError, wave.Error):
+                info = None
+        if info is None:
+            info = self._probe_ffprobe(path)
+        if info is None:
+            return None
+
+        info["size"] = stat.st_size
+        with self._lock:
+            self._entries[self._cache_key(path)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "info": info
+            }
+            self._dirty = True
+        if save:
+            self.flush()
+        return info
+
+    def probe_many(self, file_paths: List, workers: Optional[int] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """여러 파일을 한 번에 측정 (캐시 미스만 병렬 처리, 캐시 저장 1회)
+
+        Returns:
+            {str(path): info 또는 None}
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        paths = [Path(p) for p in file_paths]
+        results = {}
+        misses = []
+        for path in paths:
+            try:
+                info = self._cached(path, path.stat())
+            except OSError:
+                results[str(path)] = None
+                continue
+            if info is None:
+                misses.append(path)
+            else:
+                results[str(path)] = info
+
+        if misses:
+            workers = workers or MEDIA_PROBE_CONFIG["workers"]
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(misses)))) as executor:
+                for path, info in zip(misses, executor.map(self.probe, misses)):
+                    results[str(path)] = info
+            self.flush()
+
+        return results
+
+    def duration(self, file_path) -> Optional[float]:
+        """재생 시간 (초)"""
+        info = self.probe(file_path)
+        if not info or info.get("duration") is None:
+            return None
+        return float(info["duration"])
+
+    def has_audio(self, file_path) -> bool:
+        """오디오 스트림 존재 여부"""
+        info = self.probe(file_path)
+        return bool(info) and any(st.get("codec_type") == "audio" for st in info.get("streams", []))
+
+    def _probe_native(self, path: Path) -> Optional[Dict[str, Any]]:
+        if path.suffix.lower() == ".wav":
+            with wave.open(str(path), "rb") as wf:
+                rate = wf.getframerate()
+                if not rate:
+                    return None
+                return {
+                    "duration": wf.getnframes() / float(rate),
+                    "format": "wav",
+                    "streams": [{
+                        "codec_type": "audio",
+                        "codec_name": f"pcm_s{wf.getsampwidth() * 8}le",
+                        "sample_rate": str(rate),
+                        "channels": wf.getnchannels()
+                    }]
+                }
+        return self._probe_mp3(path)
+
+    def _parse_mp3_header(self, data: bytes, pos: int) -> Optional[Dict[str, int]]:
+        """pos 위치의 MPEG Audio Layer III 프레임 헤더 (유효하지 않으면 None)"""
+        if pos + 4 > len(data) or data[pos] != 0xFF or (data[pos + 1] & 0xE0) != 0xE0:
+            return None
+        version = (data[pos + 1] >> 3) & 0x03
+        layer = (data[pos + 1] >> 1) & 0x03
+        bitrate_index = (data[pos + 2] >> 4) & 0x0F
+        rate_index = (data[pos + 2] >> 2) & 0x03
+        if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+            return None
+
+        mpeg1 = version == 3
+        bitrate = self.MP3_BITRATES[1 if mpeg1 else 2][bitrate_index] * 1000
+        sample_rate = self.MP3_SAMPLE_RATES[version][rate_index]
+        padding = (data[pos + 2] >> 1) & 0x01
+        mono = ((data[pos + 3] >> 6) & 0x03) == 3
+        return {
+            "mpeg1": mpeg1,
+            "sample_rate": sample_rate,
+            "channels": 1 if mono else 2,
+            "samples": 1152 if mpeg1 else 576,
+            "length": (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+        }
+
+    def _probe_mp3(self, path: Path) -> Optional[Dict[str, Any]]:
+        """MP3 길이: Xing/Info/VBRI 헤더의 프레임 수, 없으면 전체 프레임 스캔"""
+        data = path.read_bytes()
+
+        # ID3v2 태그 건너뛰기 (synchsafe 크기)
+        pos = 0
+        if data[:3] == b"ID3" and len(data) >= 10:
+            pos = 10 + ((data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14
+                        | (data[8] & 0x7F) << 7 | (data[9] & 0x7F))
+            if data[5] & 0x10:
+                pos += 10  # footer
+
+        # 첫 프레임 동기화 (다음 프레임도 유효해야 인정)
+        first = None
+        while pos < len(data) - 4:
+            header = self._parse_mp3_header(data, pos)
+            if header and (pos + header["length"] >= len(data)
+                           or self._parse_mp3_header(data, pos + header["length"])):
+                first = header
+                break
+            pos += 1
+        if first is None:
+            return None
+
+        info = {
+            "format": "mp3",
+            "streams": [{
+                "codec_type": "audio",
+                "codec_name": "mp3",
+                "sample_rate": str(first["sample_rate"]),
+                "channels": first["channels"]
+            }]
+        }
+
+        # Xing/Info (LAME) 또는 VBRI 헤더의 총 프레임 수
+        side_info = (32 if first["channels"] == 2 else 17) if first["mpeg1"] else \
+                    (17 if first["channels"] == 2 else 9)
+        xing = pos + 4 + side_info
+        frames = None
+        if data[xing:xing + 4] in (b"Xing", b"Info"):
+            flags = int.from_bytes(data[xing + 4:xing + 8], "big")
+            if flags & 0x01:
+                frames = int.from_bytes(data[xing + 8:xing + 12], "big")
+        elif data[pos + 36:pos + 40] == b"VBRI":
+            frames = int.from_bytes(data[pos + 50:pos + 54], "big")
+
+        if frames:
+            info["duration"] = frames * first["samples"] / first["sample_rate"]
+            return info
+
+        # 헤더 없음 (CBR 등): 프레임 헤더만 따라가며 샘플 수 합산
+        total_samples = 0
+        while True:
+            header = self._parse_mp3_header(data, pos)
+            if header is None or header["length"] <= 0:
+                break
+            total_samples += header["samples"]
+            pos += header["length"]
+        info["duration"] = total_samples / first["sample_rate"]
+        return info
+
+    def _probe_ffprobe(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            result = subprocess.run([
+                self.ffprobe_path, "-v", "error",
+                "-show_entries", f"format=duration,format_name:stream={self.STREAM_ENTRIES}",
+                "-of", "json", str(path)
+            ], capture_output=True, text=True)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        try:
+            data = json.loads(result.stdout)
+        except json.JSONDecodeError:
+            return None
+
+        fmt = data.get("format", {})
+        streams = data.get("streams", [])
+        duration = fmt.get("duration")
+        if duration in (None, "N/A"):
+            durations = [float(st["duration"]) for st in streams if st.get("duration") not in (None, "N/A")]
+            duration = max(durations) if durations else None
+        return {
+            "duration": float(duration) if duration is not None else None,
+            "format": fmt.get("format_name", ""),
+            "streams": streams
+        }
+
+
+_media_probe = None
+
+
+def get_media_probe(ffprobe_path: Optional[str] = None) -> MediaProbe:
+    """프로세스 공용 MediaProbe (ffprobe_path를 주면 해당 경로 사용)"""
+    global _media_probe
+    if _media_probe is None:
+        import atexit
+
+        _media_probe = MediaProbe(ffprobe_path)
+        atexit.register(_media_probe.flush)  # 명령 중 측정한 결과를 한 번에 저장
+    elif ffprobe_path:
+        _media_probe.ffprobe_path = ffprobe_path
+    return _media_probe
+
+
+# ============================================================================
+# 씬 오디오 조립 (NumPy)
+# ============================================================================
+
+class AudioAssembler:
+    """문장별 오디오를 float32 버퍼로 한 번 디코딩해 씬 WAV 하나로 조립
+
+    - 디코딩: PCM WAV(같은 샘플레이트)는 wave 모듈로 직접, 그 외는 FFmpeg → f32le 파이프
+    - 문장별 앞뒤 무음 제거 (프레임 RMS 기준)
+    - 문장별 음량 정규화 (무음 프레임을 뺀 RMS → 목표 레벨, 피크 제한)
+    - 문장 사이에 실제 무음(gap) 삽입 → 샘플 단위 오프셋 반환
+    - concat -c copy처럼 MP3 프레임 경계에서 어긋나지 않음
+    """
+
+    def __init__(self, ffmpeg_path: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
+        import shutil
+
+        self.ffmpeg_path = ffmpeg_path or shutil.which("ffmpeg") or "ffmpeg"
+        self.config = config or AUDIO_ASSEMBLY_CONFIG
+        self.sample_rate = self.config["sample_rate"]
+
+    def decode(self, file_path: Path) -> Optional['np.ndarray']:
+        """오디오 파일 → mono float32 (sample_rate), 실패 시 None"""
+        path = Path(file_path)
+        if path.suffix.lower() == ".wav":
+            try:
+                with wave.open(str(path), "rb") as wf:
+                    if wf.getsampwidth() == 2 and wf.getframerate() == self.sample_rate:
+                        data = np.frombuffer(wf.readframes(wf.getnframes()), dtype="<i2")
+                        data = data.reshape(-1, wf.getnchannels()).mean(axis=1)
+                        return (data / 32768.0).astype(np.float32)
+            except (wave.Error, EOFError, OSError):
+                pass
+
+        try:
+            result = subprocess.run([
+                self.ffmpeg_path, "-v", "error", "-i", str(path),
+                "-f", "f32le", "-ac", "1", "-ar", str(self.sample_rate), "-"
+            ], capture_output=True)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        return np.frombuffer(result.stdout, dtype="<f4").astype(np.float32)
+
+    def _frame_rms(self, buffer: 'np.ndarray') -> 'np.ndarray':
+        hop = max(1, int(self.sample_rate * self.config["frame"]))
+        count = len(buffer) // hop
+        if count == 0:
+            return np.zeros(0, dtype=np.float32)
+        frames = buffer[:count * hop].reshape(count, hop)
+        return np.sqrt(np.mean(frames * frames, axis=1))
+
+    def active_range(self, buffer: 'np.ndarray') -> tuple:
+        """앞뒤 무음을 뺀 (start, end) 샘플 구간 (trim_pad만큼 여유 유지)"""
+        hop = max(1, int(self.sample_rate * self.config["frame"]))
+        threshold = 10 ** (self.config["silence_threshold_db"] / 20)
+        active = np.flatnonzero(self._frame_rms(buffer) > threshold)
+        if len(active) == 0:
+            return 0, len(buffer)
+        pad = int(self.sample_rate * self.config["trim_pad"])
+        start = max(0, active[0] * hop - pad)
+        end = min(len(buffer), (active[-1] + 1) * hop + pad)
+        return int(start), int(end)
+
+    def trim_silence(self, buffer: 'np.ndarray') -> 'np.ndarray':
+        """앞뒤 무음 제거"""
+        start, end = self.active_range(buffer)
+        return buffer[start:end]
+
+    def fade(self, buffer: 'np.ndarray', seconds: float) -> 'np.ndarray':
+        """앞뒤 선형 페이드 (이어붙인 경계의 클릭 방지)"""
+        length = min(int(self.sample_rate * seconds), len(buffer) // 2)
+        if length <= 0:
+            return buffer
+        ramp = np.linspace(0.0, 1.0, length, dtype=np.float32)
+        buffer = buffer.copy()
+        buffer[:length] *= ramp
+        buffer[-length:] *= ramp[::-1]
+        return buffer
+
+    def normalize(self, buffer: 'np.ndarray') -> 'np.ndarray':
+        """음성 구간 RMS를 목표 레벨로 (피크 제한)"""
+        rms = self._frame_rms(buffer)
+        active = rms[rms > 10 ** (self.config["silence_threshold_db"] / 20)]
+        if len(active) == 0:
+            return buffer
+        level = float(np.sqrt(np.mean(active * active)))
+        gain = 10 ** (self.config["target_rms_db"] / 20) / level
+        peak = float(np.max(np.abs(buffer))) * gain
+        ceiling = 10 ** (self.config["peak_ceiling_db"] / 20)
+        if peak > ceiling:
+            gain *= ceiling / peak
+        return (buffer * gain).astype(np.float32)
+
+    def assemble(
+        self,
+        files: List[Path],
+        gap: Optional[float] = None,
+        trim: bool = True,
+        normalize: bool = True,
+        fade: float = 0.0
+    ) -> Optional[tuple]:
+        """문장 파일들을 하나의 버퍼로 조립
+
+        Args:
+            fade: 각 파일 앞뒤 페이드 길이 (초)
+
+        Returns:
+            (buffer, [(start_sample, end_sample), ...], [앞에서 잘라낸 샘플 수, ...])
+            - 파일별 음성 구간 / 원본 파일 0초의 위치 = start_sample - 잘라낸 샘플 수
+            - 디코딩 실패 시 None
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        gap = self.config["gap"] if gap is None else gap
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(files)))) as executor:
+            buffers = list(executor.map(self.decode, files))
+
+        for file_path, buffer in zip(files, buffers):
+            if buffer is None:
+                print(f"      ❌ 디코딩 실패: {Path(file_path).name}")
+                return None
+
+        lead_trims = [0] * len(buffers)
+        if trim:
+            ranges = [self.active_range(b) for b in buffers]
+            lead_trims = [start for start, _ in ranges]
+            buffers = [b[start:end] for b, (start, end) in zip(buffers, ranges)]
+        if normalize:
+            buffers = [self.normalize(b) for b in buffers]
+        if fade > 0:
+            buffers = [self.fade(b, fade) for b in buffers]
+
+        silence = np.zeros(int(round(gap * self.sample_rate)), dtype=np.float32)
+        parts = []
+        offsets = []
+        position = 0
+        for i, buffer in enumerate(buffers):
+            if i > 0 and len(silence):
+                parts.append(silence)
+                position += len(silence)
+            parts.append(buffer)
+            offsets.append((position, position + len(buffer)))
+            position += len(buffer)
+
+        combined = np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+        return combined, offsets, lead_trims
+
+    def write_wav(self, buffer: 'np.ndarray', output_file: Path) -> Path:
+        """float32 버퍼 → 16bit PCM mono WAV"""
+        pcm = (np.clip(buffer, -1.0, 1.0) * 32767).astype("<i2")
+        output_file = Path(output_file)
+        tmp_file = output_file.with_name(f"{output_file.stem}.tmp.wav")
+        with wave.open(str(tmp_file), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(self.sample_rate)
+            wf.writeframes(pcm.tobytes())
+        os.replace(tmp_file, output_file)
+        return output_file
+
+    def write_mp3(self, buffer: 'np.ndarray', output_file: Path) -> Optional[Path]:
+        """float32 버퍼 → MP3 (FFmpeg 파이프 인코딩, 실패 시 None)"""
+        output_file = Path(output_file)
+        tmp_file = output_file.with_name(f"{output_file.stem}.tmp.mp3")
+        try:
+            result = subprocess.run([
+                self.ffmpeg_path, "-y", "-v", "error",
+                "-f", "f32le", "-ar", str(self.sample_rate), "-ac", "1", "-i", "-",
+                "-c:a", "libmp3lame", "-q:a", "2", str(tmp_file)
+            ], input=np.clip(buffer, -1.0, 1.0).astype("<f4").tobytes(), capture_output=True)
+        except OSError:
+            return None
+        if result.returncode != 0 or not tmp_file.exists():
+            return None
+        os.replace(tmp_file, output_file)
+        return output_file
+
+
+# ============================================================================
+# API 동시 요청 제어
+# ============================================================================
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 방식 동시 요청 수 제어 (Rate limit 429에 맞춰 자동 조절)
+
+    - 성공: 한도를 천천히 증가 (현재 한도만큼 성공하면 +1, 최대 maximum)
+    - 429: 한도를 절반으로 줄이고 대기 시간 동안 모든 새 요청 보류
+    """
+
+    def __init__(self, initial: int = 2, minimum: int = 1, maximum: int = 4):
+        import threading
+
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self.throttled = 0
+        self.cooldown_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """요청 슬롯 확보 (한도 초과/대기 시간 중이면 블록)"""
+        import time
+
+        with self._cond:
+            while True:
+                wait = self.cooldown_until - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                elif self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                else:
+                    self._cond.wait()
+
+    def release(self, throttled: bool = False, retry_after: float = 0.0):
+        """요청 슬롯 반환
+
+        Args:
+            throttled: 429 응답을 받았으면 True
+            retry_after: 모든 요청을 보류할 시간 (초)
+        """
+        import time
+
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                self.throttled += 1
+                # 같은 대기 구간 안의 여러 429는 한 번만 감소
+                if now >= self.cooldown_until:
+                    self.limit = max(self.minimum, self.limit / 2)
+                self.cooldown_until = max(self.cooldown_until, now + retry_after)
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+
+# ============================================================================
+# TTS 합성 캐시
+# ============================================================================
+
+class TTSCache:
+    """텍스트 해시 기반 TTS 캐시 (cache/tts/)
+
+    키 = SHA-256(모델 | 음성 | instructions | 정규화된 텍스트)
+    - {key}.mp3: 합성 결과 (Whisper 결과는 TranscriptCache가 오디오 내용 기준으로 보관)
+    씬 순서가 바뀌거나 다른 프로젝트여도 문장이 같으면 그대로 재사용합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir or TTS_CONFIG["cache_dir"])
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """유니코드 NFC + 공백 정리 (공백/줄바꿈 차이로 캐시가 빗나가지 않도록)"""
+        import unicodedata
+
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    def compute_key(self, model: str, voice: str, instructions: str, text: str) -> str:
+        import hashlib
+
+        payload = "\x1f".join([model, voice, instructions or "", self.normalize_text(text)])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def restore_audio(self, key: str, dest: Path) -> bool:
+        """캐시된 MP3를 dest로 복사 (없으면 False)
+
+        하드링크 대신 복사: 0_audio/의 파일은 분할/재생성 시 제자리에서 덮어쓰이므로
+        링크로 연결하면 캐시 원본까지 바뀔 수 있음
+        """
+        import shutil
+
+        cached = self._path(key, ".mp3")
+        if not cached.exists():
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached, dest)
+        return True
+
+    def put_audio(self, key: str, source: Path):
+        """합성 결과 저장 (임시 파일 → rename)"""
+        import shutil
+
+        dest = self._path(key, ".mp3")
+        if dest.exists():
+            return
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(dest.name + f".{os.getpid()}.{id(source)}.tmp")
+        try:
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, dest)
+        except OSError as e:
+            print(f"      ⚠️ TTS 캐시 저장 실패: {e}")
+            tmp.unlink(missing_ok=True)
+
+
+
+# ============================================================================
+# 음성 인식 (전사 캐시 + 로컬 Whisper)
+# ============================================================================
+
+class TranscriptCache:
+    """오디오 내용 해시 기반 전사 캐시 (cache/transcripts/)
+
+    키 = SHA-256(오디오 바이트) + 백엔드 + 모델 + 언어
+    - 파일 이름/위치가 달라도 같은 오디오면 재사용 (TTS 캐시에서 복원한 MP3 포함)
+    - 프롬프트(예상 내용 힌트)는 키에 넣지 않음: 같은 오디오의 전사는 같다고 봄
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir or WHISPER_CONFIG["cache_dir"])
+
+    def compute_key(self, audio_file: Path, backend: str, model: str) -> str:
+        import hashlib
+
+        digest = hashlib.sha256()
+        with open(audio_file, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        payload = "\x1f".join([digest.hexdigest(), backend, model, WHISPER_CONFIG["language"]])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        cached = self._path(key)
+        if not cached.exists():
+            return None
+        try:
+            with open(cached, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        dest = self._path(key)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(dest.name + f".{os.getpid()}.{id(result)}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp, dest)
+
+
+class LocalWhisperBackend:
+    """faster-whisper (CTranslate2) 로컬 전사 - 네트워크 없이 CPU에서 실행
+
+    모델은 프로세스당 한 번만 로드해 공유합니다.
+    결과 형식은 whisper-1 API 경로와 같음: {segments, words, full_text, duration}
+    설치: pip install faster-whisper
+    """
+
+    _model = None
+    _model_name = None
+    _lock = None
+
+    @classmethod
+    def _get_model(cls):
+        import threading
+
+        if cls._lock is None:
+            cls._lock = threading.Lock()
+        with cls._lock:
+            if cls._model is None or cls._model_name != WHISPER_CONFIG["local_model"]:
+                WhisperModel = optional_import("faster_whisper").WhisperModel
+
+                print(f"   📦 로컬 Whisper 모델 로드: {WHISPER_CONFIG['local_model']} "
+                      f"({WHISPER_CONFIG['local_device']}, {WHISPER_CONFIG['local_compute_type']})")
+                cls._model = WhisperModel(
+                    WHISPER_CONFIG["local_model"],
+                    device=WHISPER_CONFIG["local_device"],
+                    compute_type=WHISPER_CONFIG["local_compute_type"]
+                )
+                cls._model_name = WHISPER_CONFIG["local_model"]
+            return cls._model
+
+    @staticmethod
+    def is_available() -> bool:
+        return has_optional("faster_whisper")
+
+    def transcribe(self, audio_file: Path, prompt: str = "") -> Dict[str, Any]:
+        model = self._get_model()
+        segments, info = model.transcribe(
+            str(audio_file),
+            language=WHISPER_CONFIG["language"],
+            initial_prompt=prompt or None,
+            word_timestamps=True,
+            vad_filter=False
+        )
+
+        result = {"segments": [], "words": [], "full_text": "", "duration": info.duration}
+        texts = []
+        for seg in segments:
+            text = seg.text.strip()
+            texts.append(text)
+            result["segments"].append({
+                "text": text,
+                "start": seg.start,
+                "end": seg.end,
+                "duration": seg.end - seg.start
+            })
+            for word in seg.words or []:
+                result["words"].append({
+                    "text": word.word.strip(),
+                    "start": word.start,
+                    "end": word.end
+                })
+        result["full_text"] = " ".join(texts)
+        return result
+
+
 # ============================================================================
 # TTS 생성기 클래스
 # ============================================================================
@@ -1127,6 +3118,14 @@ class TTSGenerator:
     def __init__(self, state_manager: StateManager):
         self.state = state_manager
         self.openai_client = get_openai_client()
+        self.tts_cache = TTSCache()
+        self.transcript_cache = TranscriptCache()
+        self.whisper_backend = self.state.get("settings.whisper_backend") or WHISPER_CONFIG["backend"]
+        self.tts_limiter = AdaptiveConcurrencyLimiter(
+            initial=TTS_CONFIG["concurrency"]["initial"],
+            minimum=TTS_CONFIG["concurrency"]["min"],
+            maximum=TTS_CONFIG["concurrency"]["max"]
+        )
 
     def _split_into_sentences(self, text: str) -> List[str]:
         """텍스트를 문장 단위로 분할 (줄바꿈 기준)
@@ -1148,16 +3147,6 @@ class TTSGenerator:
             wf.setframerate(rate)
             wf.writeframes(pcm_data)
 
-    def _get_wav_duration(self, filename: Path) -> float:
-        """WAV 파일의 재생 시간 계산"""
-        try:
-            with wave.open(str(filename), "rb") as wf:
-                frames = wf.getnframes()
-                rate = wf.getframerate()
-                return frames / float(rate)
-        except:
-            return 0.0
-
     def _save_partial_timing(self, audio_dir: Path, scene_id: str, voice_name: str,
                              sentence_results: list, audio_files: list, total_duration: float):
         """부분 완료된 TTS 타이밍 저장 (한도 초과 시 사용)"""
@@ -1177,18 +3166,40 @@ class TTSGenerator:
         print(f"   📁 부분 저장: {timing_file}")
 
     def _generate_openai_tts(self, text: str, voice: str, output_file: Path,
-                              instructions: str = None, max_retries: int = 3) -> bool:
-        """OpenAI gpt-4o-mini-tts로 음성 생성 (MP3 출력)"""
+                              instructions: str = None, max_retries: int = None) -> bool:
+        """OpenAI gpt-4o-mini-tts로 음성 생성 (MP3 출력)
+
+        동시 요청 수는 self.tts_limiter가 제어합니다 (429 시 자동 감소 + 대기).
+
+        Raises:
+            QuotaExceededException: 계정 한도 초과 (insufficient_quota) - 재시도해도 실패
+        """
         import time
 
         # instructions 기본값
         if instructions is None:
             instructions = self.DEFAULT_INSTRUCTIONS
+        if max_retries is None:
+            max_retries = TTS_CONFIG["max_retries"]
+
+        mp3_file = output_file.with_suffix('.mp3')
+
+        # 같은 텍스트/음성/instructions로 합성한 적이 있으면 캐시에서 복사
+        cache_key = self._tts_cache_key(text, voice, instructions)
+        if self.tts_cache.restore_audio(cache_key, mp3_file):
+            print(f"      ♻️  TTS 캐시 사용 (API 호출 없음)")
+            return True
+
+        if not self.openai_client:
+            print("❌ OpenAI 클라이언트를 초기화할 수 없습니다.")
+            print("   .env 파일에 OPENAI_API_KEY를 설정하세요.")
+            return False
 
         for attempt in range(max_retries):
+            self.tts_limiter.acquire()
             try:
                 response = self.openai_client.audio.speech.create(
-                    model="gpt-4o-mini-tts",  # 새 모델 (한국어 품질 개선, 저렴)
+                    model=TTS_CONFIG["model"],  # gpt-4o-mini-tts (한국어 품질 개선, 저렴)
                     voice=voice,
                     input=text,
                     instructions=instructions,  # 음성 스타일 지정
@@ -1196,52 +3207,74 @@ class TTSGenerator:
                 )
 
                 # MP3 파일로 저장
-                mp3_file = output_file.with_suffix('.mp3')
                 response.stream_to_file(str(mp3_file))
 
-                # 성공 후 짧은 대기 (Rate limit 방지)
-                time.sleep(0.3)
-                return True
-
             except Exception as e:
-                error_str = str(e).lower()
-                if "429" in str(e) or "rate" in error_str:
-                    wait_time = 5 * (2 ** attempt)  # 5, 10, 20초
-                    print(f"      ⏳ Rate limit - {wait_time}초 대기 후 재시도 ({attempt+1}/{max_retries})")
-                    time.sleep(wait_time)
+                kind = self._classify_openai_error(e)
+                if kind == "quota":
+                    self.tts_limiter.release()
+                    raise QuotaExceededException(str(e))
+
+                if kind == "rate_limit":
+                    wait_time = self._get_retry_after(e) or min(60, 5 * (2 ** attempt))  # 5, 10, 20초...
+                    self.tts_limiter.release(throttled=True, retry_after=wait_time)
+                    print(f"      ⏳ Rate limit - {wait_time:.0f}초 대기 후 재시도 ({attempt+1}/{max_retries}), "
+                          f"동시 요청 {int(self.tts_limiter.limit)}개로 조정")
                 else:
+                    self.tts_limiter.release()
                     print(f"      ❌ OpenAI TTS 실패: {e}")
                     if attempt < max_retries - 1:
                         time.sleep(2)
+                continue
+
+            self.tts_limiter.release()
+            self.tts_cache.put_audio(cache_key, mp3_file)
+            return True
 
         return False
 
-    def _get_mp3_duration(self, filename: Path) -> float:
-        """MP3 파일의 재생 시간 계산 (mutagen 또는 ffprobe 사용)"""
-        try:
-            # mutagen 시도
-            from mutagen.mp3 import MP3
-            audio = MP3(str(filename))
-            return audio.info.length
-        except ImportError:
-            pass
-        except Exception:
-            pass
+    def _tts_cache_key(self, text: str, voice: str, instructions: Optional[str] = None) -> str:
+        """TTS 캐시 키 (모델 + 음성 + instructions + 정규화된 텍스트)"""
+        if instructions is None:
+            instructions = self.DEFAULT_INSTRUCTIONS
+        return self.tts_cache.compute_key(TTS_CONFIG["model"], voice, instructions, text)
+
+    @staticmethod
+    def _classify_openai_error(error: Exception) -> Optional[str]:
+        """OpenAI 오류 분류: "quota"(insufficient_quota), "rate_limit"(429), 그 외 None
+
+        메시지 문자열 대신 오류 타입/코드/상태 코드로 판단합니다
+        ("rate"는 "generate" 같은 단어에도 걸려 일반 오류를 스로틀로 오인함).
+        """
+        body = getattr(error, "body", None)
+        if isinstance(body, dict) and isinstance(body.get("error"), dict):
+            body = body["error"]
+        code = getattr(error, "code", None) or (body.get("code") if isinstance(body, dict) else None)
+        if code == "insufficient_quota":
+            return "quota"
+
+        status = getattr(error, "status_code", None)
+        if status is None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        openai = sys.modules.get("openai")  # 클라이언트가 있으면 이미 로드됨 (없으면 설치 안내 출력 생략)
+        rate_limit_error = getattr(openai, "RateLimitError", None)
+        if status == 429 or (rate_limit_error is not None and isinstance(error, rate_limit_error)):
+            return "rate_limit"
+        return None
 
+    def _get_retry_after(self, error: Exception) -> Optional[float]:
+        """429 응답의 Retry-After 헤더 (초)"""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
         try:
-            # ffprobe 시도
-            import subprocess
-            result = subprocess.run(
-                ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-                 '-of', 'csv=p=0', str(filename)],
-                capture_output=True, text=True
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return float(result.stdout.strip())
-        except Exception:
-            pass
+            value = headers.get("retry-after")
+            return float(value) if value else None
+        except (TypeError, ValueError):
+            return None
 
-        return 0.0
+    def _get_mp3_duration(self, filename: Path) -> float:
+        """MP3 파일의 재생 시간 계산 (MediaProbe: 헤더 파싱 + 캐시)"""
+        return get_media_probe().duration(filename) or 0.0
 
     def _extract_voice_name(self, voice_setting: str) -> str:
         """설정에서 OpenAI 음성 이름 추출"""
@@ -1347,7 +3380,10 @@ class TTSGenerator:
     # ========================================================================
 
     def _transcribe_with_whisper(self, audio_file: Path, original_text: str) -> Optional[Dict[str, Any]]:
-        """Whisper API로 오디오 파일 분석하여 문장별 timestamp 추출
+        """Whisper로 오디오 파일 분석하여 문장별 timestamp 추출
+
+        같은 오디오(내용 해시) + 백엔드 + 모델의 결과가 캐시에 있으면 재사용합니다.
+        백엔드: self.whisper_backend ("openai": whisper-1 API / "local": faster-whisper)
 
         Args:
             audio_file: 분석할 오디오 파일 경로
@@ -1361,14 +3397,32 @@ class TTSGenerator:
                 "duration": 10.5    # 총 길이
             }
         """
-        if not self.openai_client:
-            return None
+        backend = self.whisper_backend
+        model = WHISPER_CONFIG["local_model"] if backend == "local" else WHISPER_CONFIG["openai_model"]
 
         try:
-            print(f"   📊 Whisper 타임스탬프 추출 중...")
+            cache_key = self.transcript_cache.compute_key(audio_file, backend, model)
+        except OSError as e:
+            print(f"      ❌ Whisper 분석 실패: {e}")
+            return None
+
+        cached = self.transcript_cache.get(cache_key)
+        if cached:
+            print(f"   ♻️  전사 캐시 사용 ({Path(audio_file).name})")
+            return cached
 
-            # Whisper 프롬프트 (인식 정확도 향상용)
-            prompt = f"""[엄격 규칙]
+        if backend == "local":
+            result = self._transcribe_local(audio_file, original_text)
+        else:
+            result = self._transcribe_openai(audio_file, original_text)
+
+        if result and result.get("segments"):
+            self.transcript_cache.put(cache_key, result)
+        return result
+
+    def _whisper_prompt(self, original_text: str) -> str:
+        """Whisper 프롬프트 (인식 정확도 향상용)"""
+        return f"""[엄격 규칙]
 1. 음성에 들린 내용만 정확히 전사
 2. 인사말, 감사, 추임새, 감탄사 절대 추가 금지
 3. 타임스탬프는 실제 발화 시간 정확히 반영
@@ -1376,14 +3430,39 @@ class TTSGenerator:
 이것은 수학 교육 영상 나레이션입니다.
 수학 용어: 미분, 적분, 벡터, 내적, 제곱근, 함수, 그래프 등
 
-예상 내용: {original_text[:200]}"""
+예상 내용: {original_text[:200]}"""
+
+    def _transcribe_local(self, audio_file: Path, original_text: str) -> Optional[Dict[str, Any]]:
+        """faster-whisper 로컬 전사 (네트워크 불필요)"""
+        if not LocalWhisperBackend.is_available():
+            print("      ❌ 로컬 Whisper를 사용할 수 없습니다.")
+            print("         설치: pip install faster-whisper")
+            return None
+
+        try:
+            print(f"   📊 Whisper 타임스탬프 추출 중... (로컬 {WHISPER_CONFIG['local_model']})")
+            result = LocalWhisperBackend().transcribe(audio_file, self._whisper_prompt(original_text))
+            print(f"      ✅ {len(result['segments'])}개 세그먼트, {len(result['words'])}개 단어 추출")
+            return result
+        except Exception as e:
+            print(f"      ❌ Whisper 분석 실패: {e}")
+            return None
+
+    def _transcribe_openai(self, audio_file: Path, original_text: str) -> Optional[Dict[str, Any]]:
+        """whisper-1 API 전사"""
+        if not self.openai_client:
+            return None
+
+        try:
+            print(f"   📊 Whisper 타임스탬프 추출 중...")
+            prompt = self._whisper_prompt(original_text)
 
             with open(audio_file, "rb") as f:
                 # verbose_json으로 segment별 timestamp 획득
                 response = self.openai_client.audio.transcriptions.create(
-                    model="whisper-1",
+                    model=WHISPER_CONFIG["openai_model"],
                     file=f,
-                    language="ko",
+                    language=WHISPER_CONFIG["language"],
                     response_format="verbose_json",
                     timestamp_granularities=["segment", "word"],
                     prompt=prompt
@@ -1435,13 +3514,9 @@ class TTSGenerator:
         - 씬 전체를 한 번에 TTS → 자연스러운 음성
         - Whisper로 문장별 timestamp 추출 → 정확한 자막 타이밍
         - 파일 1개로 관리 용이
+        - 같은 텍스트/음성은 TTS 캐시에서 재사용 (MP3 + Whisper 결과)
         """
 
-        if not self.openai_client:
-            print("❌ OpenAI 클라이언트를 초기화할 수 없습니다.")
-            print("   .env 파일에 OPENAI_API_KEY를 설정하세요.")
-            return None
-
         project_dir = OUTPUT_DIR / self.state.get("project_id", "unknown")
         audio_dir = project_dir / "0_audio"
         audio_dir.mkdir(parents=True, exist_ok=True)
@@ -1461,6 +3536,9 @@ class TTSGenerator:
         audio_file = audio_dir / f"{scene_id}.mp3"
         print(f"   🔊 TTS 생성 중...")
 
+        # tts-split --wav로 만든 이전 WAV는 새 음성과 맞지 않으므로 제거
+        (audio_dir / f"{scene_id}.wav").unlink(missing_ok=True)
+
         success = self._generate_openai_tts(text, voice_name, audio_file)
 
         if not success:
@@ -1471,7 +3549,7 @@ class TTSGenerator:
         total_duration = self._get_mp3_duration(audio_file)
         print(f"   ✅ TTS 완료: {total_duration:.2f}초")
 
-        # 2. Whisper로 문장별 timestamp 추출
+        # 2. Whisper로 문장별 timestamp 추출 (같은 오디오의 전사 결과가 캐시에 있으면 재사용)
         whisper_result = self._transcribe_with_whisper(audio_file, text)
 
         if not whisper_result or not whisper_result.get("segments"):
@@ -1563,11 +3641,13 @@ class TTSGenerator:
         # 2. Fallback: scenes.json의 narration_tts 또는 narration_display
         return scene_data.get("narration_tts") or scene_data.get("narration_display", "")
 
-    def generate_all_from_scenes(self, start_from: int = 1) -> List[Dict[str, Any]]:
+    def generate_all_from_scenes(self, start_from: int = 1, jobs: Optional[int] = None) -> List[Dict[str, Any]]:
         """scenes.json의 모든 씬에 대해 TTS 생성 (문장별)
 
         Args:
             start_from: 시작할 씬 번호 (1부터 시작, 예: 14면 s14부터 시작)
+            jobs: 최대 동시 TTS 요청 수 (기본: TTS_CONFIG concurrency.max)
+                  429 응답에 맞춰 자동으로 줄였다 늘립니다. Whisper 분석은 다른 씬의 TTS와 겹쳐 실행.
 
         텍스트 소스 우선순위:
             1. 2_narration/{scene_id}_narration.json의 narration_tts
@@ -1576,21 +3656,14 @@ class TTSGenerator:
         """
         project_id = self.state.get("project_id", "unknown")
         project_dir = OUTPUT_DIR / project_id
-        scenes_file = project_dir / "2_scenes" / "scenes.json"
+        store = SceneStore(project_dir)
         audio_dir = project_dir / "0_audio"
 
-        if not scenes_file.exists():
-            print(f"❌ 씬 파일이 없습니다: {scenes_file}")
+        if not store.exists():
+            print(f"❌ 씬 파일이 없습니다: {store.scenes_file}")
             return []
 
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # scenes.json이 배열이면 직접 사용, 객체면 scenes 키 사용
-        if isinstance(data, list):
-            scenes = data
-        else:
-            scenes = data if isinstance(data, list) else data.get("scenes", [])
+        scenes = store.scenes()
         if not scenes:
             print("❌ 씬이 없습니다.")
             return []
@@ -1614,6 +3687,8 @@ class TTSGenerator:
         total_duration = 0.0
         skipped = 0
 
+        # 1. 작업 목록 구성 (start_from 이전 씬은 기존 결과 사용)
+        tasks = []  # (순번, scene_id, scene_num, text)
         for i, scene in enumerate(scenes, 1):
             scene_id = scene.get("scene_id", f"s{i}")
 
@@ -1639,26 +3714,25 @@ class TTSGenerator:
                 print(f"\n⚠️  [{scene_id}] 나레이션 텍스트가 없습니다. 건너뜁니다.")
                 continue
 
-            print(f"\n[{i}/{len(scenes)}] {scene_id}")
+            tasks.append((i, scene_id, scene_num, text))
 
-            try:
-                result = self.generate(scene_id, text)
-            except QuotaExceededException:
-                # 한도 초과 시 현재까지 진행 상황 저장 후 중단
-                print("\n" + "="*60)
-                print(f"⚠️  TTS 생성 중단: {len(results)}/{len(scenes)}개 씬 완료")
-                print(f"   총 문장: {total_sentences}개")
-                print(f"   총 시간: {total_duration:.1f}초 ({total_duration/60:.1f}분)")
-                print(f"\n   📌 다음 명령으로 이어서 진행하세요:")
-                print(f"   python math_video_pipeline.py tts-all --start-from {scene_num}")
-                print("="*60)
-
-                # 부분 완료 상태 저장
-                if results:
-                    self.state.update_tts_partial(project_id, all_audio_files, scene_num)
-
-                return results  # 현재까지 결과 반환
+        # 2. 동시 실행 (TTS 요청 수는 limiter가 제어, Whisper는 그 밖에서 겹쳐 실행)
+        max_jobs = jobs if jobs and jobs > 0 else TTS_CONFIG["concurrency"]["max"]
+        self.tts_limiter = AdaptiveConcurrencyLimiter(
+            initial=min(TTS_CONFIG["concurrency"]["initial"], max_jobs),
+            minimum=TTS_CONFIG["concurrency"]["min"],
+            maximum=max_jobs
+        )
+        if max_jobs > 1:
+            print(f"   동시 TTS 요청: 최대 {max_jobs}개 (429 발생 시 자동 감소)")
+
+        # 씬마다 add_file이 state를 쓰지 않도록 묶어서 마지막에 한 번 기록
+        with self.state.batch():
+            scene_results, quota_stopped = self._run_tts_tasks(tasks, len(scenes), max_jobs)
 
+        # 씬 순서대로 결과 정리
+        for _, scene_id, _, _ in tasks:
+            result = scene_results.get(scene_id)
             if result:
                 results.append(result)
                 # 문장별 오디오 파일 수집
@@ -1666,6 +3740,23 @@ class TTSGenerator:
                 total_sentences += result.get("sentence_count", 0)
                 total_duration += result.get("total_duration", 0.0)
 
+        if quota_stopped:
+            # 한도 초과: 완료되지 않은 첫 씬부터 재개
+            resume_num = min(scene_num for _, scene_id, scene_num, _ in tasks if scene_id in quota_stopped)
+            print("\n" + "="*60)
+            print(f"⚠️  TTS 생성 중단: {len(results)}/{len(scenes)}개 씬 완료")
+            print(f"   총 문장: {total_sentences}개")
+            print(f"   총 시간: {total_duration:.1f}초 ({total_duration/60:.1f}분)")
+            print(f"\n   📌 다음 명령으로 이어서 진행하세요:")
+            print(f"   python math_video_pipeline.py tts-all --start-from {resume_num}")
+            print("="*60)
+
+            # 부분 완료 상태 저장
+            if results:
+                self.state.update_tts_partial(project_id, all_audio_files, resume_num)
+
+            return results  # 현재까지 결과 반환
+
         print("\n" + "="*60)
         print(f"✅ TTS 생성 완료: {len(results)}/{len(scenes)}개 씬")
         print(f"   총 문장: {total_sentences}개")
@@ -1676,37 +3767,56 @@ class TTSGenerator:
 
         return results
 
+    def _run_tts_tasks(self, tasks: List[tuple], total: int, max_jobs: int) -> tuple:
+        """씬별 TTS(+Whisper) 작업을 스레드 풀에서 실행
+
+        한도 초과(QuotaExceededException)가 나면 아직 시작하지 않은 씬은 실행하지 않습니다.
+
+        Returns:
+            ({scene_id: 결과}, {한도 초과로 완료되지 않은 scene_id})
+        """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        scene_results = {}
+        quota_stopped = set()
+        stop = threading.Event()
+
+        def worker(task):
+            i, scene_id, _, text = task
+            if stop.is_set():
+                quota_stopped.add(scene_id)
+                return
+            print(f"\n[{i}/{total}] {scene_id}")
+            try:
+                scene_results[scene_id] = self.generate(scene_id, text)
+            except QuotaExceededException as e:
+                quota_stopped.add(scene_id)
+                if not stop.is_set():
+                    stop.set()
+                    print(f"\n🛑 API 한도 초과: {e}")
+
+        # TTS 슬롯(max_jobs) + Whisper 분석이 겹칠 여유 스레드
+        workers = 1 if max_jobs <= 1 else max_jobs * 2
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(worker, tasks))
+
+        return scene_results, quota_stopped
+
     def generate_for_scene(self, scene_id: str) -> Optional[Dict[str, Any]]:
         """단일 씬의 TTS 재생성 (narration#.json 우선, scenes.json fallback)"""
         project_id = self.state.get("project_id", "unknown")
         project_dir = OUTPUT_DIR / project_id
-        scenes_dir = project_dir / "2_scenes"
-
-        # 개별 씬 파일 먼저 확인
-        scene_file = scenes_dir / f"{scene_id}.json"
-        if scene_file.exists():
-            with open(scene_file, 'r', encoding='utf-8') as f:
-                scene_data = json.load(f)
-        else:
-            # scenes.json에서 찾기
-            scenes_file = scenes_dir / "scenes.json"
-            if not scenes_file.exists():
-                print(f"❌ 씬 파일이 없습니다: {scenes_file}")
-                return None
-
-            with open(scenes_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            scenes = data if isinstance(data, list) else data.get("scenes", [])
-            scene_data = None
-            for scene in scenes:
-                if scene.get("scene_id") == scene_id:
-                    scene_data = scene
-                    break
+        store = SceneStore(project_dir)
 
-            if not scene_data:
+        # 개별 씬 파일 우선, 없으면 scenes.json 항목
+        scene_data = store.get(scene_id)
+        if not scene_data:
+            if not store.exists() and not (store.scenes_dir / f"{scene_id}.json").exists():
+                print(f"❌ 씬 파일이 없습니다: {store.scenes_file}")
+            else:
                 print(f"❌ 씬을 찾을 수 없습니다: {scene_id}")
-                return None
+            return None
 
         # narration_tts 텍스트 가져오기 (narration#.json 우선)
         text = self._get_narration_tts(project_dir, scene_id, scene_data)
@@ -1738,29 +3848,18 @@ class TTSGenerator:
         "아웃트로": "outro"
     }
 
-    def generate_section_tts(self) -> Dict[str, Any]:
-        """Step 4a: reading_script.json에서 섹션별 TTS 생성
+    def _load_section_texts(self) -> List[tuple]:
+        """reading_script.json에서 섹션별 TTS 텍스트 로드
 
         Returns:
-            {
-                "sections": ["hook", "analysis", "core", "apply", "outro"],
-                "files": {"hook": "hook.mp3", ...},
-                "durations": {"hook": 12.5, ...}
-            }
+            [(section_name, section_key, tts_text), ...] (텍스트 없는 섹션 제외)
         """
-        if not self.openai_client:
-            print("❌ OpenAI 클라이언트를 초기화할 수 없습니다.")
-            return {}
-
         project_id = self.state.get("project_id", "unknown")
-        project_dir = OUTPUT_DIR / project_id
-        script_file = project_dir / "1_script" / "reading_script.json"
-        audio_dir = project_dir / "0_audio"
-        audio_dir.mkdir(parents=True, exist_ok=True)
+        script_file = OUTPUT_DIR / project_id / "1_script" / "reading_script.json"
 
         if not script_file.exists():
             print(f"❌ 대본 파일이 없습니다: {script_file}")
-            return {}
+            return []
 
         with open(script_file, 'r', encoding='utf-8') as f:
             script_data = json.load(f)
@@ -1768,22 +3867,9 @@ class TTSGenerator:
         sections = script_data.get("sections", [])
         if not sections:
             print("❌ 대본에 섹션이 없습니다.")
-            return {}
-
-        # 음성 설정
-        voice_setting = self.state.get("settings.voice", "alloy")
-        voice_name = self._extract_voice_name(voice_setting)
-
-        print(f"\n🎤 섹션별 TTS 생성 시작 (OpenAI gpt-4o-mini-tts)")
-        print(f"   음성: {voice_name}")
-        print("="*60)
-
-        result = {
-            "sections": [],
-            "files": {},
-            "durations": {}
-        }
+            return []
 
+        section_texts = []
         for section in sections:
             section_name = section.get("section", "unknown")
             section_key = self.SECTION_MAP.get(section_name, section_name.lower())
@@ -1803,31 +3889,288 @@ class TTSGenerator:
                 print(f"   ⚠️ {section_name}: TTS 텍스트 없음, 건너뜀")
                 continue
 
-            output_file = audio_dir / f"{section_key}.mp3"
-            print(f"\n   📢 [{section_name}] → {section_key}.mp3")
-            preview = tts_text[:60] + "..." if len(tts_text) > 60 else tts_text
-            print(f"      텍스트: {preview}")
+            section_texts.append((section_name, section_key, tts_text))
+
+        return section_texts
+
+    @staticmethod
+    def _chunk_tts_text(text: str, limit: int) -> List[str]:
+        """문장 경계(.?!)에서 limit 글자 이하 조각으로 나눔 (한 문장이 넘치면 공백 기준)"""
+        chunks = []
+        current = ""
+        for sentence in re.split(r'(?<=[.?!。…])\s+', text.strip()):
+            sentence = sentence.strip()
+            while len(sentence) > limit:
+                cut = sentence.rfind(" ", 0, limit)
+                if cut <= 0:
+                    cut = limit
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(sentence[:cut].strip())
+                sentence = sentence[cut:].strip()
+            if not sentence:
+                continue
+            if current and len(current) + 1 + len(sentence) > limit:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}".strip()
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _synthesize_chunked(self, section_key: str, chunks: List[str], voice_name: str,
+                            audio_dir: Path) -> bool:
+        """긴 섹션: 조각별 동시 TTS → 무음 정리 + 페이드로 이어붙여 {section_key}.mp3
+
+        조각 파일과 위치는 {section_key}_chunks/ 와 {section_key}_chunks.json에 남겨
+        Whisper 분석을 조각 단위로 하고 섹션 시간으로 옮길 수 있게 합니다.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        chunk_dir = audio_dir / f"{section_key}_chunks"
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        chunk_files = [chunk_dir / f"chunk_{i:02d}.mp3" for i in range(1, len(chunks) + 1)]
+
+        jobs = TTS_CONFIG["concurrency"]["max"]
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(chunks)))) as pool:
+            results = list(pool.map(
+                lambda item: self._generate_openai_tts(item[0], voice_name, item[1]),
+                zip(chunks, chunk_files)
+            ))
+        if not all(results):
+            print(f"      ❌ [{section_key}] 일부 조각 생성 실패")
+            return False
+
+        assembler = AudioAssembler()
+        assembled = assembler.assemble(
+            chunk_files, gap=TTS_CONFIG["chunk_gap"], trim=True, normalize=False, fade=TTS_CONFIG["chunk_fade"]
+        )
+        if assembled is None or assembler.write_mp3(assembled[0], audio_dir / f"{section_key}.mp3") is None:
+            print(f"      ❌ [{section_key}] 조각 이어붙이기 실패")
+            return False
+
+        buffer, offsets, lead_trims = assembled
+        sample_rate = assembler.sample_rate
+        chunk_info = {
+            "section": section_key,
+            "duration": len(buffer) / sample_rate,
+            "chunks": [
+                {
+                    "index": i,
+                    "text": text,
+                    "file": str(chunk_file.relative_to(audio_dir)),
+                    "start": start / sample_rate,
+                    "end": end / sample_rate,
+                    # 조각 파일의 0초가 섹션에서 놓이는 위치 (Whisper 시간 보정용)
+                    "offset": (start - lead_trim) / sample_rate
+                }
+                for i, (text, chunk_file, (start, end), lead_trim)
+                in enumerate(zip(chunks, chunk_files, offsets, lead_trims), 1)
+            ]
+        }
+        with open(audio_dir / f"{section_key}_chunks.json", 'w', encoding='utf-8') as f:
+            json.dump(chunk_info, f, ensure_ascii=False, indent=2)
+        return True
+
+    def _synthesize_section(self, section_name: str, section_key: str, tts_text: str,
+                            voice_name: str, audio_dir: Path) -> Optional[float]:
+        """섹션 하나의 TTS 생성 → {section_key}.mp3
 
+        chunk_chars보다 긴 섹션은 문장 경계로 나눠 동시에 생성한 뒤 이어붙입니다.
+
+        Returns:
+            오디오 길이 (실패 시 None)
+        """
+        output_file = audio_dir / f"{section_key}.mp3"
+        preview = tts_text[:60] + "..." if len(tts_text) > 60 else tts_text
+        print(f"\n   📢 [{section_name}] → {section_key}.mp3")
+        print(f"      텍스트: {preview}")
+
+        # 이전 분할 생성 기록은 새 오디오와 맞지 않으므로 제거
+        (audio_dir / f"{section_key}_chunks.json").unlink(missing_ok=True)
+
+        chunks = self._chunk_tts_text(tts_text, TTS_CONFIG["chunk_chars"])
+        if len(chunks) > 1 and not has_optional("numpy"):
+            print(f"      ⚠️ [{section_key}] numpy가 없어 분할 생성 없이 한 번에 요청합니다.")
+            chunks = [tts_text]
+
+        if len(chunks) > 1:
+            print(f"      ✂️  [{section_key}] {len(tts_text)}자 → {len(chunks)}개 조각 동시 생성")
+            success = self._synthesize_chunked(section_key, chunks, voice_name, audio_dir)
+        else:
             success = self._generate_openai_tts(tts_text, voice_name, output_file)
 
-            if success:
-                duration = self._get_mp3_duration(output_file)
+        if not success:
+            print(f"      ❌ [{section_key}] 실패")
+            return None
+
+        duration = self._get_mp3_duration(output_file)
+        print(f"      ✅ [{section_key}] 완료: {duration:.1f}초")
+        return duration
+
+    def _transcribe_chunks(self, section_key: str, audio_dir: Path) -> Optional[Dict[str, Any]]:
+        """분할 생성된 섹션: 조각별 Whisper 결과를 섹션 시간으로 옮겨 합침 (없으면 None)"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        chunk_file = audio_dir / f"{section_key}_chunks.json"
+        if not chunk_file.exists():
+            return None
+        with open(chunk_file, 'r', encoding='utf-8') as f:
+            chunk_info = json.load(f)
+        chunks = chunk_info.get("chunks", [])
+        if not chunks or not all((audio_dir / c["file"]).exists() for c in chunks):
+            return None
+
+        jobs = TTS_CONFIG["concurrency"]["max"]
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(chunks)))) as pool:
+            results = list(pool.map(lambda c: self._transcribe_with_whisper(audio_dir / c["file"], ""), chunks))
+        if not all(r and r.get("segments") for r in results):
+            return None
+
+        merged = {"segments": [], "words": [], "full_text": "", "duration": chunk_info.get("duration", 0)}
+        texts = []
+        for chunk, result in zip(chunks, results):
+            offset = chunk["offset"]
+            for seg in result["segments"]:
+                merged["segments"].append({**seg, "start": seg["start"] + offset, "end": seg["end"] + offset})
+            for word in result.get("words", []):
+                merged["words"].append({**word, "start": word["start"] + offset, "end": word["end"] + offset})
+            texts.append(result.get("full_text", ""))
+        merged["full_text"] = " ".join(t for t in texts if t)
+        return merged
+
+    def _transcribe_section(self, section_key: str, audio_file: Path, audio_dir: Path) -> Optional[Dict[str, Any]]:
+        """섹션 하나의 Whisper 분석 → {section_key}_timestamps.json
+
+        분할 생성된 섹션은 조각별로 분석해 조각 위치만큼 시간을 옮겨 합칩니다.
+        """
+        print(f"\n   📊 [{section_key}] Whisper 분석")
+        whisper_result = self._transcribe_chunks(section_key, audio_dir)
+        if whisper_result:
+            print(f"      🧩 [{section_key}] 조각별 분석 결과를 섹션 시간으로 합침")
+        else:
+            whisper_result = self._transcribe_with_whisper(audio_file, "")
+
+        if not whisper_result or not whisper_result.get("segments"):
+            print(f"      ❌ [{section_key}] Whisper 분석 실패")
+            return None
+
+        timestamp_file = audio_dir / f"{section_key}_timestamps.json"
+        with open(timestamp_file, 'w', encoding='utf-8') as f:
+            json.dump(whisper_result, f, ensure_ascii=False, indent=2)
+        print(f"      ✅ [{section_key}] {len(whisper_result['segments'])}개 세그먼트 → {timestamp_file.name}")
+        return whisper_result
+
+    def _run_section_jobs(self, section_texts: List[tuple], voice_name: str, audio_dir: Path,
+                          jobs: int, transcribe: bool) -> tuple:
+        """섹션별 작업(TTS → 바로 Whisper)을 최대 jobs개 동시에 실행
+
+        각 섹션은 독립 작업: MP3가 나오는 즉시 그 섹션의 Whisper 분석 시작
+        한도 초과(QuotaExceededException)가 나면 아직 시작하지 않은 섹션은 실행하지 않습니다.
+
+        Returns:
+            (section_tts_result, {section_key: whisper_result})
+        """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        # 섹션 스레드 수만큼 TTS 요청도 동시에 보내도록 limiter 재구성 (429 시 자동 감소)
+        jobs = max(1, jobs)
+        self.tts_limiter = AdaptiveConcurrencyLimiter(
+            initial=jobs,
+            minimum=min(TTS_CONFIG["concurrency"]["min"], jobs),
+            maximum=jobs
+        )
+
+        durations = {}
+        timestamps = {}
+        stop = threading.Event()
+
+        def worker(item):
+            section_name, section_key, tts_text = item
+            if stop.is_set():
+                return
+            try:
+                duration = self._synthesize_section(section_name, section_key, tts_text, voice_name, audio_dir)
+            except QuotaExceededException as e:
+                if not stop.is_set():
+                    stop.set()
+                    print(f"\n🛑 API 한도 초과: {e}")
+                return
+            if duration is None:
+                return
+            durations[section_key] = duration
+            if transcribe:
+                whisper_result = self._transcribe_section(section_key, audio_dir / f"{section_key}.mp3", audio_dir)
+                if whisper_result:
+                    timestamps[section_key] = whisper_result
+
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(section_texts)))) as pool:
+            list(pool.map(worker, section_texts))
+
+        if stop.is_set():
+            skipped = [key for _, key, _ in section_texts if key not in durations]
+            if skipped:
+                command = "tts-pipeline" if transcribe else "tts-sections"
+                print(f"\n⏭️  생성하지 못한 섹션 {len(skipped)}개: {', '.join(skipped)}")
+                print(f"   한도 복구 후 재개: python math_video_pipeline.py {command}")
+                print("   (완료된 섹션은 TTS 캐시에서 복사되어 API를 다시 호출하지 않습니다)")
+
+        # 대본 순서대로 결과 정리
+        result = {"sections": [], "files": {}, "durations": {}}
+        for _, section_key, _ in section_texts:
+            if section_key in durations:
                 result["sections"].append(section_key)
-                result["files"][section_key] = str(output_file)
-                result["durations"][section_key] = duration
-                print(f"      ✅ 완료: {duration:.1f}초")
-            else:
-                print(f"      ❌ 실패")
+                result["files"][section_key] = str(audio_dir / f"{section_key}.mp3")
+                result["durations"][section_key] = durations[section_key]
 
-        # 결과 저장
         result_file = audio_dir / "section_tts_result.json"
         with open(result_file, 'w', encoding='utf-8') as f:
             json.dump(result, f, ensure_ascii=False, indent=2)
 
+        return result, timestamps
+
+    def generate_section_tts(self, jobs: Optional[int] = None) -> Dict[str, Any]:
+        """Step 4a: reading_script.json에서 섹션별 TTS 생성
+
+        Args:
+            jobs: 동시에 생성할 섹션 수 (기본: TTS_CONFIG concurrency.max)
+
+        Returns:
+            {
+                "sections": ["hook", "analysis", "core", "apply", "outro"],
+                "files": {"hook": "hook.mp3", ...},
+                "durations": {"hook": 12.5, ...}
+            }
+        """
+        if not self.openai_client:
+            print("❌ OpenAI 클라이언트를 초기화할 수 없습니다.")
+            return {}
+
+        project_id = self.state.get("project_id", "unknown")
+        audio_dir = OUTPUT_DIR / project_id / "0_audio"
+        audio_dir.mkdir(parents=True, exist_ok=True)
+
+        section_texts = self._load_section_texts()
+        if not section_texts:
+            return {}
+
+        # 음성 설정
+        voice_name = self._extract_voice_name(self.state.get("settings.voice", "alloy"))
+        jobs = jobs or TTS_CONFIG["concurrency"]["max"]
+
+        print(f"\n🎤 섹션별 TTS 생성 시작 (OpenAI gpt-4o-mini-tts)")
+        print(f"   음성: {voice_name} | 동시 섹션: {min(jobs, len(section_texts))}")
+        print("="*60)
+
+        result, _ = self._run_section_jobs(section_texts, voice_name, audio_dir, jobs, transcribe=False)
+
         print("\n" + "="*60)
         total_duration = sum(result["durations"].values())
         print(f"✅ 섹션별 TTS 완료: {len(result['sections'])}개 섹션, 총 {total_duration:.1f}초")
-        print(f"   📁 결과: {result_file}")
+        print(f"   📁 결과: {audio_dir / 'section_tts_result.json'}")
 
         return result
 
@@ -1863,31 +4206,150 @@ class TTSGenerator:
                 print(f"   ⚠️ {section_key}: 오디오 파일 없음")
                 continue
 
-            print(f"\n   📢 [{section_key}]")
-
-            # Whisper 분석
-            whisper_result = self._transcribe_with_whisper(audio_file, "")
-
-            if whisper_result and whisper_result.get("segments"):
+            whisper_result = self._transcribe_section(section_key, audio_file, audio_dir)
+            if whisper_result:
                 all_timestamps[section_key] = whisper_result
 
-                # 개별 타임스탬프 파일 저장
-                timestamp_file = audio_dir / f"{section_key}_timestamps.json"
-                with open(timestamp_file, 'w', encoding='utf-8') as f:
-                    json.dump(whisper_result, f, ensure_ascii=False, indent=2)
-                print(f"      ✅ {len(whisper_result['segments'])}개 세그먼트 추출")
-                print(f"      📁 저장: {timestamp_file.name}")
-            else:
-                print(f"      ❌ Whisper 분석 실패")
-
         print("\n" + "="*60)
         print(f"✅ 타임스탬프 추출 완료: {len(all_timestamps)}개 섹션")
 
         return all_timestamps
 
-    def split_audio_by_scenes(self) -> Dict[str, str]:
+    def suggest_split_points(self, force: bool = False, bench: bool = False) -> Dict[str, Any]:
+        """Step 4c: 섹션 오디오에서 씬 분할 지점 자동 계산 → split_points_{section}.json
+
+        scenes.json의 section 필드로 섹션별 씬을 모으고, 섹션 오디오의 무음 구간과
+        {section}_timestamps.json의 Whisper 단어 정렬로 경계를 정합니다.
+        (audio-splitter 에이전트 없이 tts-split 가능)
+
+        Args:
+            force: 기존 split_points 파일도 덮어쓰기
+            bench: 파일을 쓰지 않고 기존 split_points와 경계 오차 비교
+
+        Returns:
+            {section: {"splits": [...], ...}}
+        """
+        import time
+
+        project_id = self.state.get("project_id", "unknown")
+        project_dir = OUTPUT_DIR / project_id
+        audio_dir = project_dir / "0_audio"
+        store = SceneStore(project_dir)
+        result_file = audio_dir / "section_tts_result.json"
+
+        if not result_file.exists() or not store.exists():
+            print("❌ section_tts_result.json 또는 scenes.json이 없습니다.")
+            print("   먼저 'python math_video_pipeline.py tts-pipeline' 실행하세요.")
+            return {}
+        if not has_optional("numpy"):
+            print("❌ numpy가 필요합니다. 설치: pip install numpy")
+            return {}
+
+        with open(result_file, 'r', encoding='utf-8') as f:
+            tts_result = json.load(f)
+        scenes = store.scenes()
+
+        # 섹션별 씬 (scenes.json 순서 유지)
+        section_scenes = {}
+        for i, scene in enumerate(scenes, 1):
+            scene_id = scene.get("scene_id", f"s{i}")
+            section_name = scene.get("section", "")
+            section_key = self.SECTION_MAP.get(section_name, section_name.lower())
+            text = self._get_narration_tts(project_dir, scene_id, scene)
+            section_scenes.setdefault(section_key, []).append((scene_id, text))
+
+        suggester = SplitPointSuggester()
+        results = {}
+        errors = []
+        audio_seconds = 0.0
+        elapsed = 0.0
+
+        print(f"\n🔎 씬 분할 지점 계산 (무음 구간 + Whisper 정렬)")
+        print("="*60)
+
+        for section_key in tts_result.get("sections", []):
+            audio_file = Path(tts_result["files"].get(section_key, ""))
+            section_list = section_scenes.get(section_key, [])
+            split_file = audio_dir / f"split_points_{section_key}.json"
+
+            if not audio_file.exists() or not section_list:
+                print(f"   ⚠️ [{section_key}] 오디오 또는 씬 없음, 건너뜀")
+                continue
+
+            timestamps = {}
+            timestamp_file = audio_dir / f"{section_key}_timestamps.json"
+            if timestamp_file.exists():
+                with open(timestamp_file, 'r', encoding='utf-8') as f:
+                    timestamps = json.load(f)
+
+            started = time.perf_counter()
+            suggestion = suggester.suggest(audio_file, section_list, timestamps)
+            elapsed += time.perf_counter() - started
+            if suggestion is None:
+                print(f"   ❌ [{section_key}] 오디오 디코딩 실패")
+                continue
+            audio_seconds += suggestion["duration"]
+            results[section_key] = suggestion
+
+            print(f"\n   📂 [{section_key}] {len(section_list)}개 씬, 쉼 {suggestion['pauses']}개")
+            for split in suggestion["splits"]:
+                print(f"      {split['scene_id']}: {split['start']:.2f} ~ {split['end']:.2f}")
+
+            if bench:
+                if not split_file.exists():
+                    continue
+                with open(split_file, 'r', encoding='utf-8') as f:
+                    reference = {sp["scene_id"]: sp for sp in json.load(f).get("splits", [])}
+                diffs = [
+                    abs(sp["start"] - reference[sp["scene_id"]].get("start", 0))
+                    for sp in suggestion["splits"][1:] if sp["scene_id"] in reference
+                ]
+                errors.extend(diffs)
+                if diffs:
+                    print(f"      📏 기존 대비 경계 오차: 평균 {sum(diffs) / len(diffs):.3f}초, 최대 {max(diffs):.3f}초")
+                continue
+
+            if split_file.exists() and not force:
+                print(f"      ⏭️  {split_file.name} 이미 있음 (덮어쓰려면 --force)")
+                continue
+
+            with open(split_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "section": section_key,
+                    "source_file": audio_file.name,
+                    "splits": suggestion["splits"],
+                    "method": "vad_whisper",
+                    "created_at": datetime.now().isoformat()
+                }, f, ensure_ascii=False, indent=2)
+            print(f"      📁 저장: {split_file.name}")
+
+        print("\n" + "="*60)
+        if audio_seconds:
+            print(f"⏱️  분석 시간: {elapsed:.2f}초 / 오디오 {audio_seconds / 60:.1f}분 "
+                  f"(분당 {elapsed / (audio_seconds / 60):.2f}초)")
+        if bench:
+            if errors:
+                ordered = sorted(errors)
+                print(f"📏 경계 {len(ordered)}개: 평균 {sum(ordered) / len(ordered):.3f}초 | "
+                      f"p90 {ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]:.3f}초 | 최대 {ordered[-1]:.3f}초")
+            else:
+                print("⚠️ 비교할 기존 split_points 파일이 없습니다.")
+        else:
+            print(f"✅ 분할 지점 계산 완료: {len(results)}개 섹션")
+            print("   다음: python math_video_pipeline.py tts-split")
+
+        return results
+
+    def split_audio_by_scenes(self, wav: bool = False) -> Dict[str, str]:
         """Step 4d: split_points.json 기반으로 FFmpeg로 씬별 오디오 분할
 
+        섹션 MP3를 섹션당 한 번만 디코딩하고, asplit + atrim 그래프로
+        모든 씬 구간을 한 번의 FFmpeg 실행에서 출력합니다.
+        (씬마다 FFmpeg를 실행하면 -ss 위치까지 매번 처음부터 디코딩)
+
+        Args:
+            wav: True면 합성용 무손실 WAV(PCM)도 같은 실행에서 함께 출력
+
         Returns:
             {"s1": "s1.mp3", "s2": "s2.mp3", ...}
         """
@@ -1902,13 +4364,16 @@ class TTSGenerator:
 
         if not split_files:
             print(f"❌ split_points 파일이 없습니다.")
-            print("   audio-splitter 에이전트를 먼저 실행하세요.")
+            print("   tts-split-suggest 또는 audio-splitter 에이전트를 먼저 실행하세요.")
             return {}
 
-        print(f"\n✂️ 씬별 오디오 분할 시작 (FFmpeg)")
+        print(f"\n✂️ 씬별 오디오 분할 시작 (FFmpeg, 섹션당 1회 디코딩)")
+        if wav:
+            print(f"   🎚️  WAV(PCM) 동시 출력")
         print("="*60)
 
         result = {}
+        durations = {}
         total_scenes = 0
 
         for split_file in sorted(split_files):
@@ -1925,42 +4390,70 @@ class TTSGenerator:
 
             print(f"\n   📂 [{section}] {len(splits)}개 씬 분할")
 
+            # 유효한 구간만 (소스 길이로 끝 시각 보정)
+            source_duration = get_media_probe().duration(source_file)
+            cuts = []
             for split in splits:
                 scene_id = split.get("scene_id", "")
                 start = split.get("start", 0)
                 end = split.get("end", 0)
-                duration = end - start
+                if source_duration:
+                    end = min(end, source_duration)
 
-                if duration <= 0:
+                if not scene_id or end - start <= 0:
                     print(f"      ⚠️ {scene_id}: 유효하지 않은 구간 ({start:.2f} ~ {end:.2f})")
                     continue
+                cuts.append((scene_id, start, end))
 
-                output_file = audio_dir / f"{scene_id}.mp3"
+            if not cuts:
+                continue
 
-                # FFmpeg로 분할
-                cmd = [
-                    "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
-                    "-i", str(source_file),
-                    "-ss", f"{start:.3f}",
-                    "-t", f"{duration:.3f}",
-                    "-c:a", "libmp3lame", "-q:a", "2",
-                    str(output_file)
-                ]
+            # [0:a] → asplit → 구간별 atrim → (mp3 [+ wav]) 출력
+            labels = "".join(f"[in{i}]" for i in range(len(cuts)))
+            filters = [f"[0:a]asplit={len(cuts)}{labels}"] if len(cuts) > 1 else ["[0:a]anull[in0]"]
+            outputs = []
+            for i, (scene_id, start, end) in enumerate(cuts):
+                trim = f"[in{i}]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS"
+                if wav:
+                    filters.append(f"{trim},asplit=2[mp3_{i}][wav_{i}]")
+                    outputs += ["-map", f"[wav_{i}]", "-c:a", "pcm_s16le", str(audio_dir / f"{scene_id}.wav")]
+                else:
+                    filters.append(f"{trim}[mp3_{i}]")
+                outputs += ["-map", f"[mp3_{i}]", "-c:a", "libmp3lame", "-q:a", "2",
+                            str(audio_dir / f"{scene_id}.mp3")]
 
-                try:
-                    subprocess.run(cmd, check=True, capture_output=True)
-                    actual_duration = self._get_mp3_duration(output_file)
-                    result[scene_id] = str(output_file)
-                    total_scenes += 1
-                    print(f"      ✅ {scene_id}: {actual_duration:.1f}초 ({start:.2f}~{end:.2f})")
-                except subprocess.CalledProcessError as e:
-                    print(f"      ❌ {scene_id}: FFmpeg 오류 - {e.stderr.decode() if e.stderr else str(e)}")
-                except Exception as e:
-                    print(f"      ❌ {scene_id}: {e}")
+            cmd = [
+                "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+                "-i", str(source_file),
+                "-filter_complex", ";".join(filters),
+                *outputs
+            ]
+
+            try:
+                subprocess.run(cmd, check=True, capture_output=True)
+            except subprocess.CalledProcessError as e:
+                print(f"      ❌ [{section}] FFmpeg 오류 - {e.stderr.decode() if e.stderr else str(e)}")
+                continue
+            except Exception as e:
+                print(f"      ❌ [{section}] {e}")
+                continue
+
+            for scene_id, start, end in cuts:
+                output_file = audio_dir / f"{scene_id}.mp3"
+                if not wav:
+                    # 이전 --wav 실행의 WAV는 새 구간과 맞지 않으므로 제거
+                    (audio_dir / f"{scene_id}.wav").unlink(missing_ok=True)
+                if not output_file.exists():
+                    print(f"      ❌ {scene_id}: 출력 파일 없음")
+                    continue
+                result[scene_id] = str(output_file)
+                durations[scene_id] = end - start
+                total_scenes += 1
+                print(f"      ✅ {scene_id}: {end - start:.1f}초 ({start:.2f}~{end:.2f})")
 
-        # 분할 완료 후 씬별 timing.json 생성
+        # 분할 완료 후 씬별 timing.json 생성 (구간 길이 사용, 재측정 없음)
         print(f"\n   📝 씬별 timing.json 생성 중...")
-        self._generate_scene_timings_from_splits(audio_dir, split_files)
+        self._generate_scene_timings_from_splits(audio_dir, split_files, durations)
 
         print("\n" + "="*60)
         print(f"✅ 오디오 분할 완료: {total_scenes}개 씬")
@@ -1971,8 +4464,14 @@ class TTSGenerator:
 
         return result
 
-    def _generate_scene_timings_from_splits(self, audio_dir: Path, split_files: List[Path]):
-        """분할된 씬별 오디오에 대해 timing.json 생성"""
+    def _generate_scene_timings_from_splits(self, audio_dir: Path, split_files: List[Path],
+                                            durations: Optional[Dict[str, float]] = None):
+        """분할된 씬별 오디오에 대해 timing.json 생성
+
+        Args:
+            durations: {scene_id: 구간 길이} - 있으면 출력 파일을 다시 측정하지 않음
+        """
+        durations = durations or {}
         project_id = self.state.get("project_id", "unknown")
         project_dir = OUTPUT_DIR / project_id
 
@@ -1985,10 +4484,12 @@ class TTSGenerator:
 
             # 섹션 타임스탬프 로드
             section_segments = []
+            section_words = []
             if timestamp_file.exists():
                 with open(timestamp_file, 'r', encoding='utf-8') as f:
                     ts_data = json.load(f)
                     section_segments = ts_data.get("segments", [])
+                    section_words = ts_data.get("words", [])
 
             for split in split_data.get("splits", []):
                 scene_id = split.get("scene_id", "")
@@ -2015,8 +4516,24 @@ class TTSGenerator:
                             "duration": relative_end - relative_start
                         })
 
+                # 구간 안의 단어 (자막 정렬용, 단어 중간 시각 기준)
+                scene_words = []
+                for word in section_words:
+                    word_start = word.get("start", 0)
+                    word_end = word.get("end", 0)
+                    if start <= (word_start + word_end) / 2 < end:
+                        scene_words.append({
+                            "text": word.get("text", ""),
+                            "start": max(0, word_start - start),
+                            "end": min(end - start, word_end - start)
+                        })
+
                 # timing.json 생성
-                duration = self._get_mp3_duration(audio_file)
+                duration = durations.get(scene_id)
+                if duration is None:
+                    duration = self._get_mp3_duration(audio_file)
+                wav_file = audio_dir / f"{scene_id}.wav"
+                audio_files = [str(audio_file)] + ([str(wav_file)] if wav_file.exists() else [])
                 timing_data = {
                     "scene_id": scene_id,
                     "voice": self.state.get("settings.voice", "alloy"),
@@ -2033,7 +4550,8 @@ class TTSGenerator:
                         }
                         for i, seg in enumerate(scene_segments)
                     ],
-                    "audio_files": [str(audio_file)],
+                    "words": scene_words,
+                    "audio_files": audio_files,
                     "created_at": datetime.now().isoformat(),
                     "method": "section_split"
                 }
@@ -2044,34 +4562,63 @@ class TTSGenerator:
 
         print(f"      ✅ timing.json 파일 생성 완료")
 
-    def run_tts_pipeline(self) -> bool:
-        """전체 섹션별 TTS 파이프라인 실행 (tts-sections → tts-timestamps)
+    def run_tts_pipeline(self, jobs: Optional[int] = None) -> bool:
+        """전체 섹션별 TTS 파이프라인 실행 (섹션별 TTS → 바로 Whisper)
+
+        각 섹션을 독립 작업으로 최대 jobs개 동시에 처리합니다.
+        섹션 MP3가 나오는 즉시 그 섹션의 Whisper 분석을 시작하므로
+        전체 시간은 섹션 합계가 아니라 가장 긴 섹션 수준입니다.
 
-        Note: tts-split은 audio-splitter 에이전트 실행 후 별도 호출 필요
+        Args:
+            jobs: 동시에 처리할 섹션 수 (기본: TTS_CONFIG concurrency.max)
+
+        Note: tts-split은 tts-split-suggest 또는 audio-splitter 에이전트 실행 후 별도 호출 필요
         """
         print("\n" + "="*60)
         print("🎬 섹션별 TTS 파이프라인 시작")
         print("="*60)
 
-        # Step 4a: 섹션별 TTS 생성
-        print("\n📌 Step 4a: 섹션별 TTS 생성")
-        tts_result = self.generate_section_tts()
-        if not tts_result.get("sections"):
+        if not self.openai_client:
+            print("❌ OpenAI 클라이언트를 초기화할 수 없습니다.")
+            return False
+
+        project_id = self.state.get("project_id", "unknown")
+        audio_dir = OUTPUT_DIR / project_id / "0_audio"
+        audio_dir.mkdir(parents=True, exist_ok=True)
+
+        section_texts = self._load_section_texts()
+        if not section_texts:
             print("❌ 섹션별 TTS 생성 실패")
             return False
 
-        # Step 4b: Whisper 타임스탬프 추출
-        print("\n📌 Step 4b: Whisper 타임스탬프 추출")
-        timestamps = self.extract_timestamps()
+        voice_name = self._extract_voice_name(self.state.get("settings.voice", "alloy"))
+        jobs = jobs or TTS_CONFIG["concurrency"]["max"]
+
+        # Step 4a + 4b: 섹션별 TTS 생성 → Whisper 타임스탬프 추출 (섹션 단위 병렬)
+        print(f"\n📌 Step 4a+4b: 섹션별 TTS + Whisper (동시 섹션: {min(jobs, len(section_texts))})")
+        print(f"   음성: {voice_name}")
+        tts_result, timestamps = self._run_section_jobs(
+            section_texts, voice_name, audio_dir, jobs, transcribe=True
+        )
+        if not tts_result.get("sections"):
+            print("❌ 섹션별 TTS 생성 실패")
+            return False
         if not timestamps:
             print("❌ 타임스탬프 추출 실패")
             return False
 
+        missing = [key for key in tts_result["sections"] if key not in timestamps]
+        if missing:
+            print(f"\n⚠️ 타임스탬프 누락 섹션: {', '.join(missing)}")
+            print("   재시도: python math_video_pipeline.py tts-timestamps")
+
         print("\n" + "="*60)
         print("✅ TTS 파이프라인 1단계 완료!")
+        print(f"   {len(tts_result['sections'])}개 섹션, 총 {sum(tts_result['durations'].values()):.1f}초")
         print()
         print("📌 다음 단계:")
-        print("   1. audio-splitter 에이전트 호출 (섹션별 병렬)")
+        print("   1. python math_video_pipeline.py tts-split-suggest (자동)")
+        print("      또는 audio-splitter 에이전트 호출 (섹션별 병렬)")
         print("   2. 완료 후: python math_video_pipeline.py tts-split")
         print("="*60)
 
@@ -2088,7 +4635,7 @@ class TTSGenerator:
         """
         project_id = self.state.get("project_id", "unknown")
         project_dir = OUTPUT_DIR / project_id
-        scenes_dir = project_dir / "2_scenes"
+        store = SceneStore(project_dir)
         audio_dir = project_dir / "0_audio"
 
         result = {"ok": [], "mismatch": [], "missing_scene": [], "missing_timing": []}
@@ -2098,18 +4645,16 @@ class TTSGenerator:
             return text.replace(',', '').replace('.', '').replace('...', '').replace(' ', '').replace('?', '').replace('!', '')[:40]
 
         def check_scene(sid: str):
-            scene_file = scenes_dir / f"{sid}.json"
+            scene_data = store.get(sid)
             timing_file = audio_dir / f"{sid}_timing.json"
 
-            if not scene_file.exists():
+            if not scene_data:
                 result["missing_scene"].append(sid)
                 return
             if not timing_file.exists():
                 result["missing_timing"].append(sid)
                 return
 
-            with open(scene_file, 'r', encoding='utf-8') as f:
-                scene_data = json.load(f)
             with open(timing_file, 'r', encoding='utf-8') as f:
                 timing_data = json.load(f)
 
@@ -2129,14 +4674,9 @@ class TTSGenerator:
             # 단일 씬 검증
             check_scene(scene_id)
         else:
-            # 전체 검증 - scenes 폴더의 모든 s*.json
-            import re
-            scene_files = sorted(scenes_dir.glob("s*.json"),
-                                key=lambda p: (int(re.match(r's(\d+)', p.stem).group(1)) if re.match(r's(\d+)', p.stem) else 0, p.stem))
-            for sf in scene_files:
-                sid = sf.stem
-                if re.match(r's\d+[a-z]?$', sid):  # s1, s2, s32a 등
-                    check_scene(sid)
+            # 전체 검증 - scenes.json + 개별 s*.json의 모든 씬 (s1, s2, s32a 등)
+            for sid in store.all_ids():
+                check_scene(sid)
 
         # 결과 출력
         print("\n" + "="*60)
@@ -2191,20 +4731,13 @@ class TTSGenerator:
             return None
 
         project_dir = OUTPUT_DIR / project_id
-        scenes_file = project_dir / "2_scenes" / "scenes.json"
+        store = SceneStore(project_dir)
 
-        if not scenes_file.exists():
-            print(f"❌ scenes.json이 없습니다: {scenes_file}")
+        if not store.exists():
+            print(f"❌ scenes.json이 없습니다: {store.scenes_file}")
             return None
 
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            scenes_data = json.load(f)
-
-        # scenes.json은 배열 형태일 수도, {"scenes": [...]} 형태일 수도 있음
-        if isinstance(scenes_data, list):
-            scenes = scenes_data
-        else:
-            scenes = scenes_data.get("scenes", [])
+        scenes = store.scenes()
 
         if not scenes:
             print("❌ scenes.json에 씬 데이터가 없습니다.")
@@ -2334,10 +4867,11 @@ class TTSGenerator:
         return {"available": available, "missing": missing}
 
     def process_audio_files(self) -> bool:
-        """외부 녹음 파일 처리 (Whisper 분석 + timing.json 생성)
+        """외부 녹음 파일 처리 (씬 WAV 조립 + timing.json 생성)
 
-        각 문장별 오디오 파일의 duration을 측정하고
-        씬별 timing.json을 생성합니다.
+        각 문장별 오디오 파일을 디코딩해 앞뒤 무음 제거, 음량 정규화 후
+        문장 사이에 실제 무음을 넣어 씬별 {scene_id}.wav로 합치고,
+        샘플 오프셋 기준의 씬별 timing.json을 생성합니다.
 
         Returns:
             성공 여부
@@ -2385,7 +4919,16 @@ class TTSGenerator:
                 "text": text
             })
 
-        # 각 씬별로 처리
+        if not has_optional("numpy"):
+            print("❌ numpy가 필요합니다 (씬 오디오 조립).")
+            print("   설치: pip install numpy")
+            return False
+
+        assembler = AudioAssembler()
+        sample_rate = assembler.sample_rate
+        gap = AUDIO_ASSEMBLY_CONFIG["gap"]
+
+        # 각 씬별로 처리: 문장 파일 → 무음 제거/정규화 → 실제 gap 삽입 → {scene_id}.wav
         all_audio_files = []
 
         for scene_id in sorted(scene_sentences.keys(), key=lambda x: int(x[1:]) if x[1:].isdigit() else 0):
@@ -2393,59 +4936,59 @@ class TTSGenerator:
 
             print(f"\n[{scene_id}] {len(sentences)}개 문장 처리 중...")
 
-            sentence_results = []
-            audio_files = []
-            current_time = 0.0
-
+            # 파일 찾기 (mp3 또는 wav)
+            source_files = []
             for sent in sentences:
-                key = sent["key"]
+                mp3_file = audio_dir / f"{sent['key']}.mp3"
+                source_files.append(mp3_file if mp3_file.exists() else audio_dir / f"{sent['key']}.wav")
 
-                # 파일 찾기 (mp3 또는 wav)
-                mp3_file = audio_dir / f"{key}.mp3"
-                wav_file = audio_dir / f"{key}.wav"
-
-                if mp3_file.exists():
-                    audio_file = mp3_file
-                    file_ext = "mp3"
-                else:
-                    audio_file = wav_file
-                    file_ext = "wav"
+            assembled = assembler.assemble(source_files, gap=gap)
+            if assembled is None:
+                print(f"   ❌ {scene_id}: 오디오 조립 실패")
+                continue
+            buffer, offsets, _ = assembled
 
-                # duration 측정
-                duration = self._get_audio_duration(audio_file)
-                gap = 0.1  # 문장 사이 여유 시간
+            scene_file = assembler.write_wav(buffer, audio_dir / f"{scene_id}.wav")
+            total_samples = len(buffer)
 
+            # 문장 구간: 음성 시작 ~ 다음 문장 시작 (gap 포함), 샘플 단위 기록
+            sentence_results = []
+            for i, (sent, source_file, (start_sample, end_sample)) in enumerate(zip(sentences, source_files, offsets)):
+                next_start = offsets[i + 1][0] if i + 1 < len(offsets) else total_samples
                 sentence_results.append({
                     "index": sent["index"],
                     "text": sent["text"],
-                    "file": f"{key}.{file_ext}",
-                    "start": round(current_time, 3),
-                    "end": round(current_time + duration + gap, 3),
-                    "duration": round(duration + gap, 3)
+                    "file": source_file.name,
+                    "start": round(start_sample / sample_rate, 3),
+                    "end": round(next_start / sample_rate, 3),
+                    "duration": round((next_start - start_sample) / sample_rate, 3),
+                    "start_sample": start_sample,
+                    "end_sample": end_sample
                 })
+                print(f"   {sent['key']}: {(end_sample - start_sample) / sample_rate:.2f}초")
 
-                audio_files.append(f"{key}.{file_ext}")
-                all_audio_files.append(f"{key}.{file_ext}")
-                current_time += duration + gap
-
-                print(f"   {key}: {duration:.2f}초 (+{gap}s gap)")
+            all_audio_files.append(scene_file.name)
 
             # timing.json 저장
             timing_file = audio_dir / f"{scene_id}_timing.json"
             timing_data = {
                 "scene_id": scene_id,
                 "voice": "external_recording",
-                "total_duration": round(current_time, 3),
+                "total_duration": round(total_samples / sample_rate, 3),
+                "sample_rate": sample_rate,
+                "total_samples": total_samples,
                 "sentence_count": len(sentence_results),
                 "sentences": sentence_results,
-                "audio_files": audio_files,
-                "created_at": datetime.now().isoformat()
+                "audio_files": [scene_file.name],
+                "source_files": [f.name for f in source_files],
+                "created_at": datetime.now().isoformat(),
+                "method": "audio_assembly"
             }
 
             with open(timing_file, 'w', encoding='utf-8') as f:
                 json.dump(timing_data, f, ensure_ascii=False, indent=2)
 
-            print(f"   ✅ {timing_file.name} 저장 (총 {current_time:.2f}초)")
+            print(f"   ✅ {scene_file.name} + {timing_file.name} 저장 (총 {total_samples / sample_rate:.2f}초)")
 
         # state 업데이트
         self.state.update_tts_completed(project_id, all_audio_files)
@@ -2460,41 +5003,6 @@ class TTSGenerator:
 
         return True
 
-    def _get_audio_duration(self, audio_file: Path) -> float:
-        """오디오 파일의 재생 시간 측정 (mp3/wav 지원)"""
-        import subprocess
-
-        try:
-            # ffprobe 사용
-            result = subprocess.run(
-                [
-                    "ffprobe", "-v", "error",
-                    "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1",
-                    str(audio_file)
-                ],
-                capture_output=True,
-                text=True
-            )
-            return float(result.stdout.strip())
-        except:
-            pass
-
-        # wav 파일인 경우 wave 모듈 사용
-        if audio_file.suffix.lower() == ".wav":
-            return self._get_wav_duration(audio_file)
-
-        # mp3 파일인 경우 mutagen 시도
-        try:
-            from mutagen.mp3 import MP3
-            audio = MP3(str(audio_file))
-            return audio.info.length
-        except:
-            pass
-
-        print(f"      ⚠️  duration 측정 실패: {audio_file.name}")
-        return 0.0
-
 # ============================================================================
 # 파일 관리 클래스
 # ============================================================================
@@ -2582,21 +5090,15 @@ class FileManager:
             return None
         
         project_id = self.state.get("project_id")
-        scenes_dir = project_dir / "2_scenes"
-        scenes_dir.mkdir(parents=True, exist_ok=True)
-        
-        scenes_file = scenes_dir / "scenes.json"
         
         data = {
             "project_id": project_id,
             "total_scenes": len(scenes),
             "total_duration": sum(s.get("duration", 0) for s in scenes),
-            "scenes": scenes,
             "created_at": datetime.now().isoformat()
         }
         
-        with open(scenes_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        scenes_file = SceneStore(project_dir).save(scenes, meta=data)
         
         # 상태 업데이트 - 새로운 함수 사용
         scene_ids = [s.get("scene_id", f"s{i+1}") for i, s in enumerate(scenes)]
@@ -2675,15 +5177,11 @@ class FileManager:
         if not project_dir:
             return None
         
-        scenes_file = project_dir / "2_scenes" / "scenes.json"
-        
-        if not scenes_file.exists():
+        store = SceneStore(project_dir)
+        if not store.exists():
             return None
         
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return data.get("scenes", [])
+        return store.scenes()
     
     def load_timing(self, scene_id: str) -> Optional[Dict[str, Any]]:
         """타이밍 데이터 로드"""
@@ -2718,11 +5216,12 @@ class FileManager:
 # Supabase 클라이언트
 # ============================================================================
 
+@cached_client
 def get_supabase_client() -> Optional['SupabaseClient']:
-    """Supabase 클라이언트 생성 (Service Role Key 사용)"""
-    if not SUPABASE_AVAILABLE:
-        return None
+    """Supabase 클라이언트 생성 (Service Role Key 사용)
 
+    SUPABASE_URL=local:<폴더> 이면 LocalSupabaseClient (오프라인 테스트용, 키 불필요)
+    """
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_SERVICE_KEY")
 
@@ -2738,11 +5237,516 @@ def get_supabase_client() -> Optional['SupabaseClient']:
                     elif line.startswith("SUPABASE_SERVICE_KEY="):
                         key = line.split("=", 1)[1].strip().strip('"\'')
 
+    if url and url.startswith("local:"):
+        return LocalSupabaseClient(Path(url[len("local:"):]))
+
+    supabase = optional_import("supabase")
+    if supabase is None:
+        return None
+
     if not url or not key:
         print("❌ SUPABASE_URL 또는 SUPABASE_SERVICE_KEY가 설정되지 않았습니다.")
         return None
 
-    return create_client(url, key)
+    return supabase.create_client(url, key)
+
+
+class LocalSupabaseClient:
+    """Supabase 대체 클라이언트 (오프라인 테스트용, SUPABASE_URL=local:<폴더>)
+
+    AssetManager가 쓰는 범위만 흉내 냅니다.
+    - table(name): select / eq / gte / order / range / limit / upsert(on_conflict) / execute
+      테이블은 <폴더>/tables/<name>.json, upsert 시 updated_at 갱신, file_path = folder/file_name,
+      새 행에는 id 자동 부여
+    - storage.from_(bucket): upload / download / create_signed_urls (file:// URL)
+      파일은 <폴더>/storage/<bucket>/<path>
+    """
+
+    def __init__(self, root: Path):
+        import threading
+
+        self.root = Path(root)
+        self.lock = threading.Lock()
+        self.storage = _LocalStorage(self)
+
+    def table(self, name: str) -> '_LocalQuery':
+        return _LocalQuery(self, name)
+
+    def _table_file(self, name: str) -> Path:
+        return self.root / "tables" / f"{name}.json"
+
+    def _load(self, name: str) -> List[Dict[str, Any]]:
+        table_file = self._table_file(name)
+        if not table_file.exists():
+            return []
+        with open(table_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save(self, name: str, rows: List[Dict[str, Any]]) -> None:
+        table_file = self._table_file(name)
+        table_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = table_file.with_name(f".{table_file.name}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, table_file)
+
+
+class _LocalQuery:
+    """LocalSupabaseClient.table() 쿼리 빌더"""
+
+    def __init__(self, client: LocalSupabaseClient, name: str):
+        self.client = client
+        self.name = name
+        self.columns = "*"
+        self.filters = []
+        self.order_by = []
+        self.bounds = None
+        self.upsert_rows = None
+        self.conflict_keys = None
+
+    def select(self, columns: str = "*", **kwargs) -> '_LocalQuery':
+        self.columns = columns
+        return self
+
+    def eq(self, column: str, value: Any) -> '_LocalQuery':
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def gte(self, column: str, value: Any) -> '_LocalQuery':
+        self.filters.append(lambda row: row.get(column) is not None and str(row[column]) >= str(value))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> '_LocalQuery':
+        self.order_by.append((column, desc))
+        return self
+
+    def range(self, start: int, end: int) -> '_LocalQuery':
+        self.bounds = (start, end + 1)
+        return self
+
+    def limit(self, count: int) -> '_LocalQuery':
+        self.bounds = (0, count)
+        return self
+
+    def upsert(self, data, on_conflict: str = "id", **kwargs) -> '_LocalQuery':
+        self.upsert_rows = data if isinstance(data, list) else [data]
+        self.conflict_keys = [k.strip() for k in on_conflict.split(",")]
+        return self
+
+    def execute(self):
+        from types import SimpleNamespace
+
+        with self.client.lock:
+            rows = self.client._load(self.name)
+            if self.upsert_rows is not None:
+                return SimpleNamespace(data=self._upsert(rows))
+
+        rows = [row for row in rows if all(f(row) for f in self.filters)]
+        for column, desc in reversed(self.order_by):  # 안정 정렬: 뒤 키부터
+            rows.sort(key=lambda row, c=column: (row.get(c) is None, "" if row.get(c) is None else row.get(c)),
+                      reverse=desc)
+        if self.bounds:
+            rows = rows[self.bounds[0]:self.bounds[1]]
+        if self.columns.strip() != "*":
+            keys = [c.strip() for c in self.columns.split(",")]
+            rows = [{k: row.get(k) for k in keys} for row in rows]
+        return SimpleNamespace(data=rows)
+
+    def _upsert(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        written = []
+        for item in self.upsert_rows:
+            row = dict(item)
+            if "file_name" in row:
+                folder = row.get("folder")
+                row["file_path"] = f"{folder}/{row['file_name']}" if folder else row["file_name"]
+            row["updated_at"] = datetime.now().isoformat()
+
+            key = tuple(row.get(k) for k in self.conflict_keys)
+            for i, existing in enumerate(rows):
+                if tuple(existing.get(k) for k in self.conflict_keys) == key:
+                    rows[i] = {**existing, **row}
+                    written.append(rows[i])
+                    break
+            else:
+                row.setdefault("id", max((r.get("id") or 0 for r in rows), default=0) + 1)
+                rows.append(row)
+                written.append(row)
+        self.client._save(self.name, rows)
+        return written
+
+
+class _LocalStorage:
+    def __init__(self, client: LocalSupabaseClient):
+        self.client = client
+
+    def from_(self, bucket: str) -> '_LocalBucket':
+        return _LocalBucket(self.client.root / "storage" / bucket)
+
+
+class _LocalBucket:
+    """LocalSupabaseClient.storage.from_() 버킷"""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def upload(self, path: str, file: bytes, file_options: dict = None):
+        target = self.root / path
+        if target.exists():
+            raise Exception(f"Duplicate: {path} already exists")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(file)
+        return {"path": path}
+
+    def download(self, path: str) -> bytes:
+        return (self.root / path).read_bytes()
+
+    def create_signed_urls(self, paths: List[str], expires_in: int) -> List[Dict[str, Any]]:
+        return [
+            {"path": p, "signedURL": (self.root / p).resolve().as_uri(), "error": None}
+            if (self.root / p).exists() else {"path": p, "signedURL": None, "error": "Object not found"}
+            for p in paths
+        ]
+
+
+# ============================================================================
+# 에셋 매니페스트 (Supabase assets 테이블 로컬 사본)
+# ============================================================================
+
+class AssetManifest:
+    """Supabase assets 테이블의 로컬 SQLite 사본 (cache/assets.db)
+
+    - sync(): 워터마크(updated_at) 이후 바뀐 행만 페이지 단위로 가져와 병합
+    - max_age 안에 동기화했으면 조회 자체를 생략 → asset-check가 네트워크 왕복 없이 동작
+    - 삭제된 행은 증분으로 알 수 없으므로 full_refresh_hours마다 전체 재동기화
+    - 업로드한 행은 upsert()로 바로 반영 (다시 조회하지 않음)
+    - 워터마크 컬럼이 없는 테이블이면 전체 조회로 대체 (전체 조회 결과에 컬럼이 있으면 증분 복구)
+    - 일시적인 조회 오류는 그대로 올려 보냄 → 호출 측이 마지막 사본 사용, 증분 모드는 유지
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS assets (
+            file_path TEXT PRIMARY KEY,
+            changed_at TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, db_file: Path = None):
+        import threading
+
+        self.db_file = Path(db_file or ASSET_MANIFEST_CONFIG["db_file"])
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        import sqlite3
+
+        if self._conn is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_file), timeout=ASSET_MANIFEST_CONFIG["busy_timeout"],
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def row_path(row: Dict[str, Any]) -> Optional[str]:
+        """행의 에셋 경로 (file_path 없으면 storage_path, folder/file_name 순)"""
+        path = row.get("file_path") or row.get("storage_path")
+        if not path and row.get("file_name"):
+            path = f"{row['folder']}/{row['file_name']}" if row.get("folder") else row["file_name"]
+        return path
+
+    def _get_meta(self, conn, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn, key: str, value: Optional[str]) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @staticmethod
+    def _age(stamp: Optional[str]) -> float:
+        """ISO 시각 → 지금까지 경과 초 (없으면 무한대)"""
+        if not stamp:
+            return float("inf")
+        try:
+            return (datetime.now() - datetime.fromisoformat(stamp)).total_seconds()
+        except ValueError:
+            return float("inf")
+
+    def _fetch(self, supabase, since: Optional[str]) -> List[Dict[str, Any]]:
+        """assets 행 페이지 단위 조회 (since가 있으면 워터마크 이상인 행만)
+
+        Postgres는 ORDER BY 없이는 페이지 사이 순서를 보장하지 않으므로 항상 고유 키로 정렬합니다.
+        """
+        column = ASSET_MANIFEST_CONFIG["watermark_column"]
+        id_column = ASSET_MANIFEST_CONFIG["id_column"]
+        page_size = ASSET_MANIFEST_CONFIG["page_size"]
+        rows = []
+        start = 0
+        while True:
+            query = supabase.table("assets").select("*")
+            if since is not None:
+                query = query.gte(column, since).order(column)
+            query = query.order(id_column)
+            page = query.range(start, start + page_size - 1).execute().data or []
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            start += page_size
+
+    @staticmethod
+    def _missing_column(error: Exception) -> bool:
+        """워터마크 컬럼이 없어서 난 오류인지 (PostgREST 42703 / column ... does not exist)"""
+        code = getattr(error, "code", None)
+        if code is None and error.args and isinstance(error.args[0], dict):
+            code = error.args[0].get("code")
+        message = str(error)
+        return str(code) == "42703" or "42703" in message or ("column" in message and "does not exist" in message)
+
+    def sync(self, supabase, full: bool = False, max_age: Optional[float] = None) -> Optional[int]:
+        """Supabase → 로컬 사본 동기화
+
+        Args:
+            supabase: Supabase 클라이언트
+            full: True면 전체 조회 후 교체 (삭제된 행 반영)
+            max_age: 마지막 동기화가 이 시간(초) 안이면 조회 생략
+
+        Returns:
+            가져온 행 수 (조회를 생략했으면 None)
+        """
+        config = ASSET_MANIFEST_CONFIG
+        with self._lock:
+            conn = self._connect()
+            if not full and max_age is not None and self._age(self._get_meta(conn, "synced_at")) < max_age:
+                return None
+
+            watermark = self._get_meta(conn, "watermark")
+            incremental = self._get_meta(conn, "incremental") != "0"
+            if self._age(self._get_meta(conn, "full_synced_at")) > config["full_refresh_hours"] * 3600:
+                full = True
+
+            rows = None
+            if not full and incremental and watermark:
+                try:
+                    rows = self._fetch(supabase, watermark)
+                except Exception as e:
+                    if not self._missing_column(e):
+                        raise
+                    # 워터마크 컬럼이 없는 테이블 → 전체 조회 (증분 여부는 아래에서 결과로 판단)
+                    print(f"⚠️  워터마크 컬럼 없음, 전체 조회로 대체: {e}")
+            if rows is None:
+                full = True
+                rows = self._fetch(supabase, None)
+
+            now = datetime.now().isoformat()
+            stamps = [str(r[config["watermark_column"]]) for r in rows if r.get(config["watermark_column"])]
+            if not full and watermark:
+                stamps.append(watermark)
+            with conn:
+                if full:
+                    conn.execute("DELETE FROM assets")
+                    self._set_meta(conn, "full_synced_at", now)
+                    if rows:
+                        # 행에 워터마크 컬럼이 있으면 다음부터 증분 조회 (컬럼이 추가된 경우 복구)
+                        has_column = any(config["watermark_column"] in r for r in rows)
+                        self._set_meta(conn, "incremental", "1" if has_column else "0")
+                self._upsert_rows(conn, rows)
+                self._set_meta(conn, "watermark", max(stamps) if stamps else None)
+                self._set_meta(conn, "synced_at", now)
+            return len(rows)
+
+    def _upsert_rows(self, conn, rows: List[Dict[str, Any]]) -> None:
+        column = ASSET_MANIFEST_CONFIG["watermark_column"]
+        for row in rows:
+            path = self.row_path(row)
+            if path:
+                conn.execute(
+                    "INSERT OR REPLACE INTO assets (file_path, changed_at, data) VALUES (?, ?, ?)",
+                    (path, row.get(column), json.dumps(row, ensure_ascii=False, default=str))
+                )
+
+    def upsert(self, rows: List[Dict[str, Any]]) -> None:
+        """업로드 직후 행 반영 (워터마크는 그대로 → 다음 증분 조회에서 서버 값으로 덮어씀)"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._upsert_rows(conn, rows)
+
+    def assets(self) -> Dict[str, Dict[str, Any]]:
+        """file_path → 행"""
+        with self._lock:
+            cursor = self._connect().execute("SELECT file_path, data FROM assets")
+            return {path: json.loads(data) for path, data in cursor}
+
+    def synced_at(self) -> Optional[str]:
+        with self._lock:
+            return self._get_meta(self._connect(), "synced_at")
+
+
+_asset_manifest = None
+
+
+def get_asset_manifest() -> AssetManifest:
+    """프로세스 공용 AssetManifest"""
+    global _asset_manifest
+    if _asset_manifest is None:
+        _asset_manifest = AssetManifest()
+    return _asset_manifest
+
+
+# ============================================================================
+# 에셋 다운로더 (병렬 + 이어받기 + 검증)
+# ============================================================================
+
+class AssetDownloader:
+    """Supabase Storage 에셋 병렬 다운로드
+
+    - 서명 URL을 한 번에 발급받아 스레드 풀에서 스트리밍 다운로드 (파일 전체를 메모리에 올리지 않음)
+    - 임시 파일(.이름.part)에 받은 뒤 검증을 통과하면 os.replace로 교체 → 잘린 PNG가 남지 않음
+    - 실패 시 .part 크기부터 Range 요청으로 이어받기, 재시도 사이 지수 대기
+    - DB 메타데이터의 file_size(있으면 sha256/checksum)로 검증, 불일치 시 처음부터 다시 받음
+    - 서명 URL을 못 받으면 storage.download() 바이트로 대체
+    """
+
+    def __init__(self, supabase, bucket: str, assets_dir: Path):
+        self.supabase = supabase
+        self.bucket = bucket
+        self.assets_dir = Path(assets_dir)
+        self.config = ASSET_DOWNLOAD_CONFIG
+
+    def download_all(self, items: Dict[str, Dict[str, Any]]) -> Dict[str, bool]:
+        """여러 에셋 다운로드
+
+        Args:
+            items: file_path → DB 메타데이터 (file_size, sha256 등)
+
+        Returns:
+            file_path → 성공 여부
+        """
+        if not items:
+            return {}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        urls = self._signed_urls(list(items))
+        workers = max(1, min(self.config["workers"], len(items)))
+        print(f"\n⬇️  다운로드 {len(items)}개 (동시 {workers}개)")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {fp: executor.submit(self.download, fp, meta, urls.get(fp))
+                       for fp, meta in items.items()}
+            return {fp: future.result() for fp, future in futures.items()}
+
+    def _signed_urls(self, file_paths: List[str]) -> Dict[str, str]:
+        """서명 URL 일괄 발급 (실패한 항목은 빠짐 → download() 바이트로 대체)"""
+        bucket = self.supabase.storage.from_(self.bucket)
+        ttl = self.config["signed_url_ttl"]
+        urls = {}
+        try:
+            for item in bucket.create_signed_urls(file_paths, ttl) or []:
+                url = item.get("signedURL") or item.get("signedUrl")
+                if url and not item.get("error"):
+                    urls[item.get("path")] = url
+        except Exception:
+            for fp in file_paths:
+                try:
+                    item = bucket.create_signed_url(fp, ttl) or {}
+                    url = item.get("signedURL") or item.get("signedUrl")
+                    if url:
+                        urls[fp] = url
+                except Exception:
+                    pass
+        return urls
+
+    def download(self, file_path: str, meta: Optional[Dict[str, Any]] = None, url: Optional[str] = None) -> bool:
+        """에셋 하나 다운로드 (재시도 + 이어받기 + 검증 후 원자적 교체)"""
+        import time
+
+        meta = meta or {}
+        local_path = self.assets_dir / file_path
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        part = local_path.with_name(f".{local_path.name}.part")
+
+        error = None
+        for attempt in range(self.config["retries"] + 1):
+            if attempt:
+                time.sleep(self.config["backoff"] * (2 ** (attempt - 1)))
+            try:
+                if url:
+                    self._stream(url, part)
+                else:
+                    data = self.supabase.storage.from_(self.bucket).download(file_path)
+                    with open(part, 'wb') as f:
+                        f.write(data)
+
+                error = self._verify(part, meta)
+                if error is None:
+                    os.replace(part, local_path)
+                    return True
+                part.unlink(missing_ok=True)  # 내용 불일치 → 이어받지 않고 처음부터
+            except Exception as e:
+                error = str(e)
+
+        part.unlink(missing_ok=True)
+        print(f"   ⚠️  다운로드 실패 ({file_path}): {error}")
+        return False
+
+    def _stream(self, url: str, part: Path) -> None:
+        """URL → .part 스트리밍 (.part가 있으면 Range로 이어받기)"""
+        import urllib.error
+        import urllib.request
+
+        offset = part.stat().st_size if part.exists() else 0
+        request = urllib.request.Request(url)
+        if offset:
+            request.add_header("Range", f"bytes={offset}-")
+
+        try:
+            response = urllib.request.urlopen(request, timeout=self.config["timeout"])
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                return  # 이미 끝까지 받음 → 검증 단계에서 확인
+            raise
+
+        with response:
+            # 206이 아니면 서버가 Range를 무시한 것 → 처음부터
+            mode = 'ab' if offset and response.status == 206 else 'wb'
+            with open(part, mode) as f:
+                while True:
+                    chunk = response.read(self.config["chunk_size"])
+                    if not chunk:
+                        break
+                    f.write(chunk)
+
+    @staticmethod
+    def _verify(path: Path, meta: Dict[str, Any]) -> Optional[str]:
+        """DB 메타데이터와 비교 (문제 없으면 None, 있으면 사유)"""
+        size = path.stat().st_size
+        if size == 0:
+            return "빈 파일"
+
+        expected_size = meta.get("file_size")
+        if expected_size and size != int(expected_size):
+            return f"크기 불일치 ({size} != {expected_size})"
+
+        expected_hash = meta.get("sha256") or meta.get("checksum")
+        if expected_hash:
+            import hashlib
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            if digest.hexdigest() != str(expected_hash).lower():
+                return "sha256 불일치"
+
+        return None
 
 
 # ============================================================================
@@ -2758,6 +5762,7 @@ class AssetManager:
     def __init__(self, state_manager: StateManager):
         self.state = state_manager
         self.supabase = get_supabase_client()
+        self.manifest = get_asset_manifest()
 
     def get_project_dir(self) -> Optional[Path]:
         """현재 프로젝트 디렉토리"""
@@ -2766,6 +5771,34 @@ class AssetManager:
             return OUTPUT_DIR / project_id
         return None
 
+    def _remote_assets(self, max_age: Optional[float] = ASSET_MANIFEST_CONFIG["max_age"],
+                       full: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Supabase 보유 에셋 (file_path → 행), 로컬 매니페스트에서 응답
+
+        max_age 안에 동기화했으면 조회하지 않고, 아니면 바뀐 행만 가져옵니다.
+        조회에 실패하면 마지막으로 동기화한 사본을 그대로 씁니다.
+        """
+        try:
+            pulled = self.manifest.sync(self.supabase, full=full, max_age=max_age)
+            if pulled:
+                print(f"🔄 에셋 매니페스트 동기화: {pulled}개 행")
+        except Exception as e:
+            print(f"⚠️  Supabase 조회 오류: {e}")
+            synced_at = self.manifest.synced_at()
+            if synced_at:
+                print(f"   로컬 매니페스트 사용 (마지막 동기화: {synced_at[:19]})")
+        return self.manifest.assets()
+
+    def sync_manifest(self, full: bool = False) -> int:
+        """에셋 매니페스트 강제 동기화 (asset-index 명령)"""
+        if not self.supabase:
+            print("❌ Supabase 연결 실패.")
+            return 0
+
+        assets = self._remote_assets(max_age=None, full=full)
+        print(f"✅ 에셋 매니페스트: {len(assets)}개 ({self.manifest.db_file})")
+        return len(assets)
+
     def check_assets(self) -> dict:
         """
         에셋 체크: Supabase 조회 + 다운로드 + 누락 목록 생성 + scenes.json 확장자 업데이트
@@ -2778,16 +5811,14 @@ class AssetManager:
             print("❌ 활성 프로젝트가 없습니다.")
             return {"available": [], "missing": [], "downloaded": []}
 
-        scenes_file = project_dir / "2_scenes" / "scenes.json"
-        if not scenes_file.exists():
+        store = SceneStore(project_dir)
+        if not store.exists():
             print("❌ 씬 파일이 없습니다. 먼저 씬 분할을 진행하세요.")
             return {"available": [], "missing": [], "downloaded": []}
 
-        # 1. scenes.json에서 required_elements 수집
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        scenes = data if isinstance(data, list) else data.get("scenes", [])
+        # 1. scenes.json에서 required_elements 수집 (확장자 반영 시 수정하므로 복사본)
+        import copy
+        scenes = copy.deepcopy(store.scenes())
 
         required_assets = {}  # file_path -> {scenes, description, tags, original_name}
         for scene in scenes:
@@ -2868,46 +5899,49 @@ class AssetManager:
             print("❌ Supabase 연결 실패. 로컬 파일만 확인합니다.")
             result = self._check_local_only(required_assets, resolved_assets)
             # scenes.json 업데이트
-            self._update_scenes_with_extensions(scenes_file, scenes, resolved_assets)
+            self._update_scenes_with_extensions(store, scenes, resolved_assets)
             # 프로젝트별 카탈로그 업데이트
             self.update_project_catalog(result.get("available", []), required_assets)
             return result
 
-        # 3. Supabase에서 보유 목록 조회
-        try:
-            result = self.supabase.table("assets").select("file_path, folder, file_name, description, tags").execute()
-            supabase_assets = {item["file_path"]: item for item in result.data}
-            print(f"☁️  Supabase 보유: {len(supabase_assets)}개")
-
-            # Supabase에서도 확장자 찾기
-            for base_path in required_assets.keys():
-                if base_path not in resolved_assets or not (self.ASSETS_DIR / resolved_assets[base_path]).exists():
-                    for ext in [".png", ".svg"]:
-                        full_path = f"{base_path}{ext}"
-                        if full_path in supabase_assets:
-                            resolved_assets[base_path] = full_path
-                            break
-        except Exception as e:
-            print(f"⚠️  Supabase 조회 오류: {e}")
-            supabase_assets = {}
+        # 3. Supabase 보유 목록 (로컬 매니페스트, 오래됐으면 바뀐 행만 조회)
+        supabase_assets = self._remote_assets()
+        print(f"☁️  Supabase 보유: {len(supabase_assets)}개")
+
+        # Supabase에서도 확장자 찾기
+        for base_path in required_assets.keys():
+            if base_path not in resolved_assets or not (self.ASSETS_DIR / resolved_assets[base_path]).exists():
+                for ext in [".png", ".svg"]:
+                    full_path = f"{base_path}{ext}"
+                    if full_path in supabase_assets:
+                        resolved_assets[base_path] = full_path
+                        break
 
         available = []
         missing = []
         downloaded = []
 
-        # 4. 각 에셋 확인 (확장자 포함된 경로로)
+        # 4. Supabase에만 있는 에셋 병렬 다운로드
+        to_download = {}
+        for base_path in required_assets:
+            file_path = resolved_assets.get(base_path, f"{base_path}.png")
+            if file_path in supabase_assets and not (self.ASSETS_DIR / file_path).exists():
+                to_download[file_path] = supabase_assets[file_path]
+        download_results = self._download_assets(to_download)
+
+        # 5. 각 에셋 확인 (확장자 포함된 경로로)
         for base_path, info in required_assets.items():
             file_path = resolved_assets.get(base_path, f"{base_path}.png")
             local_path = self.ASSETS_DIR / file_path
 
             if file_path in supabase_assets:
                 # Supabase에 있음
-                if local_path.exists():
+                if file_path not in to_download:
                     # 로컬에도 있음
                     available.append(file_path)
                 else:
-                    # 로컬에 없음 → 다운로드
-                    if self._download_asset(file_path):
+                    # 로컬에 없음 → 다운로드 결과
+                    if download_results.get(file_path):
                         downloaded.append(file_path)
                         available.append(file_path)
                     else:
@@ -2939,7 +5973,7 @@ class AssetManager:
                         "spec": {"min_size": "500x500", "format": "PNG or SVG", "background": "transparent"}
                     })
 
-        # 5. 결과 출력
+        # 6. 결과 출력
         print(f"\n✅ 사용 가능: {len(available)}개")
         if downloaded:
             print(f"⬇️  다운로드됨: {len(downloaded)}개")
@@ -2967,61 +6001,87 @@ class AssetManager:
             self.state.set("assets.missing", [])
             self.state.update_phase("assets_checked")
 
-        # 6. scenes.json 업데이트 (확장자 반영)
-        self._update_scenes_with_extensions(scenes_file, scenes, resolved_assets)
+        # 7. scenes.json 업데이트 (확장자 반영)
+        self._update_scenes_with_extensions(store, scenes, resolved_assets)
 
-        # 7. 프로젝트별 카탈로그 업데이트
+        # 8. 프로젝트별 카탈로그 업데이트
         self.update_project_catalog(available, required_assets)
 
         return {"available": available, "missing": missing, "downloaded": downloaded}
 
-    def _update_scenes_with_extensions(self, scenes_file: Path, scenes: list, resolved_assets: dict) -> bool:
-        """scenes.json에 실제 파일 확장자를 반영"""
-        updated = False
+    def _update_scenes_with_extensions(self, store: 'SceneStore', scenes: list, resolved_assets: dict) -> bool:
+        """scenes.json과 개별 s*.json에 실제 파일 확장자를 반영
 
+        개별 파일은 각 파일의 에셋 이름만 고칩니다 (scene-editor가 직접 고친 내용, scenes.json에
+        아직 없는 s16b.json 같은 파일도 그대로 유지).
+        """
+        import copy
+
+        updated = False
         for scene in scenes:
-            # 1. required_elements 업데이트
-            elements = scene.get("required_elements", [])
-            for elem in elements:
-                if isinstance(elem, dict) and elem.get("type") == "image":
-                    asset_name = elem.get("asset", "")
-                    if asset_name:
-                        base_name = asset_name.rsplit(".", 1)[0] if "." in asset_name else asset_name
+            if self._apply_extensions(scene, resolved_assets):
+                updated = True
 
-                        # 카테고리 추측
-                        if "stickman" in base_name or "pigou" in base_name:
-                            base_path = f"characters/{base_name}"
-                        elif "_icon" in base_name or base_name in ["question_mark", "exclamation", "lightbulb", "checkmark", "arrow_right", "star", "heart", "clock", "calendar", "battery_low", "server_icon", "algorithm_icon", "amazon_logo", "dollar_sign"]:
-                            base_path = f"icons/{base_name}"
-                        else:
-                            base_path = f"objects/{base_name}"
+        if updated:
+            store.save(scenes)  # 기존 scenes.json 형태 유지
+            print(f"\n📝 scenes.json 업데이트됨 (확장자 반영)")
 
-                        if base_path in resolved_assets:
-                            new_name = resolved_assets[base_path].rsplit("/", 1)[-1]  # 파일명만
-                            if asset_name != new_name:
-                                elem["asset"] = new_name
-                                updated = True
+        patched = []
+        for scene_id in store.all_ids():
+            current = store.scene_file(scene_id)
+            if current is None:
+                continue
+            scene = copy.deepcopy(current)
+            if self._apply_extensions(scene, resolved_assets):
+                store.save_scene_file(scene_id, scene)
+                patched.append(scene_id)
 
-            # 2. required_assets 업데이트
-            assets_list = scene.get("required_assets", [])
-            for asset in assets_list:
-                if isinstance(asset, dict):
-                    category = asset.get("category", "objects")
-                    filename = asset.get("filename", "")
-                    if filename:
-                        base_name = filename.rsplit(".", 1)[0] if "." in filename else filename
-                        base_path = f"{category}/{base_name}"
+        if patched:
+            print(f"📝 개별 씬 파일 {len(patched)}개 업데이트됨 (확장자 반영)")
 
-                        if base_path in resolved_assets:
-                            new_filename = resolved_assets[base_path].rsplit("/", 1)[-1]
-                            if filename != new_filename:
-                                asset["filename"] = new_filename
-                                updated = True
+        return updated or bool(patched)
 
-        if updated:
-            with open(scenes_file, 'w', encoding='utf-8') as f:
-                json.dump(scenes, f, ensure_ascii=False, indent=2)
-            print(f"\n📝 scenes.json 업데이트됨 (확장자 반영)")
+    def _apply_extensions(self, scene: dict, resolved_assets: dict) -> bool:
+        """씬 하나의 에셋 이름에 실제 확장자 반영 (제자리 수정, 바뀌었으면 True)"""
+        updated = False
+
+        # 1. required_elements 업데이트
+        elements = scene.get("required_elements", [])
+        for elem in elements:
+            if isinstance(elem, dict) and elem.get("type") == "image":
+                asset_name = elem.get("asset", "")
+                if asset_name:
+                    base_name = asset_name.rsplit(".", 1)[0] if "." in asset_name else asset_name
+
+                    # 카테고리 추측
+                    if "stickman" in base_name or "pigou" in base_name:
+                        base_path = f"characters/{base_name}"
+                    elif "_icon" in base_name or base_name in ["question_mark", "exclamation", "lightbulb", "checkmark", "arrow_right", "star", "heart", "clock", "calendar", "battery_low", "server_icon", "algorithm_icon", "amazon_logo", "dollar_sign"]:
+                        base_path = f"icons/{base_name}"
+                    else:
+                        base_path = f"objects/{base_name}"
+
+                    if base_path in resolved_assets:
+                        new_name = resolved_assets[base_path].rsplit("/", 1)[-1]  # 파일명만
+                        if asset_name != new_name:
+                            elem["asset"] = new_name
+                            updated = True
+
+        # 2. required_assets 업데이트
+        assets_list = scene.get("required_assets", [])
+        for asset in assets_list:
+            if isinstance(asset, dict):
+                category = asset.get("category", "objects")
+                filename = asset.get("filename", "")
+                if filename:
+                    base_name = filename.rsplit(".", 1)[0] if "." in filename else filename
+                    base_path = f"{category}/{base_name}"
+
+                    if base_path in resolved_assets:
+                        new_filename = resolved_assets[base_path].rsplit("/", 1)[-1]
+                        if filename != new_filename:
+                            asset["filename"] = new_filename
+                            updated = True
 
         return updated
 
@@ -3063,21 +6123,9 @@ class AssetManager:
 
         return {"available": available, "missing": missing, "downloaded": []}
 
-    def _download_asset(self, file_path: str) -> bool:
-        """Supabase Storage에서 에셋 다운로드"""
-        try:
-            local_path = self.ASSETS_DIR / file_path
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-
-            data = self.supabase.storage.from_(self.BUCKET_NAME).download(file_path)
-
-            with open(local_path, 'wb') as f:
-                f.write(data)
-
-            return True
-        except Exception as e:
-            print(f"   ⚠️  다운로드 실패 ({file_path}): {e}")
-            return False
+    def _download_assets(self, items: Dict[str, Dict[str, Any]]) -> Dict[str, bool]:
+        """Supabase Storage에서 에셋 병렬 다운로드 (file_path → DB 메타데이터)"""
+        return AssetDownloader(self.supabase, self.BUCKET_NAME, self.ASSETS_DIR).download_all(items)
 
     def sync_assets(self) -> dict:
         """
@@ -3105,13 +6153,8 @@ class AssetManager:
                 for item in data.get("missing", []):
                     missing_metadata[item["file_path"]] = item
 
-        # Supabase 보유 목록 조회
-        try:
-            result = self.supabase.table("assets").select("file_path").execute()
-            supabase_paths = {item["file_path"] for item in result.data}
-        except Exception as e:
-            print(f"⚠️  Supabase 조회 오류: {e}")
-            supabase_paths = set()
+        # Supabase 보유 목록 (업로드 판단이므로 바뀐 행은 항상 조회)
+        supabase_paths = set(self._remote_assets(max_age=None))
 
         uploaded = []
         failed = []
@@ -3144,7 +6187,7 @@ class AssetManager:
             for fp in failed:
                 print(f"   - {fp}")
 
-        # 업로드 후 다시 체크
+        # 업로드 후 다시 체크 (업로드한 행은 매니페스트에 반영됨 → 재조회 없음)
         if uploaded:
             print("\n🔄 에셋 상태 재확인 중...")
             self.check_assets()
@@ -3162,12 +6205,7 @@ class AssetManager:
             print("⚠️  Supabase 연결 없음. 카탈로그 업데이트 생략.")
             return False
 
-        try:
-            result = self.supabase.table("assets").select("*").execute()
-            assets = result.data
-        except Exception as e:
-            print(f"⚠️  Supabase 조회 오류: {e}")
-            return False
+        assets = list(self._remote_assets().values())
 
         if not assets:
             print("⚠️  Supabase에 에셋이 없습니다.")
@@ -3409,9 +6447,9 @@ class AssetManager:
                             width, height = int(width_match.group(1)), int(height_match.group(1))
                 except:
                     pass
-            elif PIL_AVAILABLE:
+            elif optional_import("pil") is not None:
                 try:
-                    with Image.open(local_path) as img:
+                    with optional_import("pil").open(local_path) as img:
                         width, height = img.size
                 except:
                     pass
@@ -3431,12 +6469,15 @@ class AssetManager:
                 "file_size": file_size,
             }
 
-            self.supabase.table("assets").upsert(
+            result = self.supabase.table("assets").upsert(
                 db_data,
                 on_conflict="folder,file_name"
             ).execute()
             print(f"   [DB] OK")
 
+            # 로컬 매니페스트에 바로 반영 (다음 조회 없이 check_assets에서 보임)
+            self.manifest.upsert(result.data or [dict(db_data, file_path=storage_path)])
+
             return True
         except Exception as e:
             print(f"   [ERROR] {e}")
@@ -3468,17 +6509,14 @@ class ImageManager:
             return None
         
         prompts_dir = project_dir / "6_image_prompts"
-        scenes_file = project_dir / "2_scenes" / "scenes.json"
+        store = SceneStore(project_dir)
         
-        if not scenes_file.exists():
+        if not store.exists():
             print("❌ 씬 파일이 없습니다. 먼저 씬 분할을 진행하세요.")
             return None
         
         # 씬 정보 로드
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        scenes = data if isinstance(data, list) else data.get("scenes", [])
+        scenes = store.scenes()
         if not scenes:
             print("❌ 씬이 없습니다.")
             return None
@@ -3611,19 +6649,15 @@ Negative prompt: text, letters, numbers, words, Korean, Chinese, Japanese, equat
             print("❌ 활성 프로젝트가 없습니다.")
             return {"status": "error", "message": "No active project"}
         
-        scenes_file = project_dir / "2_scenes" / "scenes.json"
+        store = SceneStore(project_dir)
         backgrounds_dir = project_dir / "9_backgrounds"
         
-        if not scenes_file.exists():
+        if not store.exists():
             print("❌ 씬 파일이 없습니다.")
             return {"status": "error", "message": "No scenes file"}
         
         # 씬 정보 로드
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        scenes = data if isinstance(data, list) else data.get("scenes", [])
-        scene_ids = [s.get("scene_id", f"s{i+1}") for i, s in enumerate(scenes)]
+        scene_ids = store.ids()
         
         # 이미지 확인
         found = []
@@ -3694,17 +6728,13 @@ Negative prompt: text, letters, numbers, words, Korean, Chinese, Japanese, equat
         backgrounds_dir = project_dir / "9_backgrounds"
         backgrounds_dir.mkdir(parents=True, exist_ok=True)
         
-        scenes_file = project_dir / "2_scenes" / "scenes.json"
-        if not scenes_file.exists():
+        store = SceneStore(project_dir)
+        if not store.exists():
             print("❌ 씬 파일이 없습니다.")
             return {"status": "error", "imported": 0}
         
         # 씬 정보 로드
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        scenes = data if isinstance(data, list) else data.get("scenes", [])
-        scene_ids = [s.get("scene_id", f"s{i+1}") for i, s in enumerate(scenes)]
+        scene_ids = store.ids()
         
         # 소스 폴더의 이미지 파일들
         image_extensions = {".png", ".jpg", ".jpeg", ".webp"}
@@ -3768,23 +6798,155 @@ Negative prompt: text, letters, numbers, words, Korean, Chinese, Japanese, equat
         }
 
 
+# ============================================================================
+# 렌더링 캐시 클래스
+# ============================================================================
+
+class RenderCache:
+    """내용 기반 렌더링 캐시
+
+    캐시 키 = SHA-256(Manim 코드 + 참조하는 assets/ 파일 + 품질 + Manim 버전 + 투명 배경 여부)
+    - 코드나 에셋이 바뀌면 키가 달라져 항상 다시 렌더링
+    - 바뀌지 않은 씬은 cache/renders/에서 즉시 복원 (clean 이후, 다른 프로젝트 간에도)
+    """
+
+    # ImageMobject("assets/...") / SVGMobject("assets/...") 등 문자열 리터럴의 에셋 경로
+    ASSET_PATTERN = re.compile(r"""["'](assets/[^"'\n]+)["']""")
+
+    _manim_version = None
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir or RENDER_CONFIG["cache_dir"])
+
+    @classmethod
+    def get_manim_version(cls) -> str:
+        """설치된 Manim 버전 (확인 불가 시 'unknown')"""
+        if cls._manim_version is None:
+            try:
+                from importlib.metadata import version, PackageNotFoundError
+                try:
+                    cls._manim_version = version("manim")
+                except PackageNotFoundError:
+                    cls._manim_version = "unknown"
+            except ImportError:
+                cls._manim_version = "unknown"
+        return cls._manim_version
+
+    def find_assets(self, code: str) -> List[str]:
+        """코드에서 참조하는 assets/ 파일 경로 목록 (중복 제거, 정렬)"""
+        return sorted(set(self.ASSET_PATTERN.findall(code)))
+
+    def compute_key(self, code_file: Path, quality: str, transparent: bool = True) -> str:
+        """씬 렌더링 캐시 키 계산"""
+        import hashlib
+
+        code = code_file.read_bytes()
+        h = hashlib.sha256()
+        h.update(b"code\0")
+        h.update(code)
+
+        # 참조 에셋 (경로 + 내용). 없는 파일도 경로를 키에 포함
+        for asset in self.find_assets(code.decode('utf-8', errors='ignore')):
+            asset_path = PROJECT_ROOT / asset
+            h.update(f"\0asset\0{asset}\0".encode('utf-8'))
+            if asset_path.is_file():
+                with open(asset_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        h.update(chunk)
+            else:
+                h.update(b"<missing>")
+
+        h.update(f"\0quality={quality}\0manim={self.get_manim_version()}\0transparent={transparent}".encode('utf-8'))
+        return h.hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2]
+
+    def get(self, key: str) -> Optional[Path]:
+        """캐시된 렌더링 파일 경로 (없으면 None)"""
+        entry_dir = self._entry_dir(key)
+        for ext in (".mov", ".mp4"):
+            cached = entry_dir / f"{key}{ext}"
+            if cached.exists():
+                return cached
+        return None
+
+    def put(self, key: str, source: Path) -> Optional[Path]:
+        """렌더링 결과를 캐시에 저장 (임시 파일 → rename으로 원자적 저장)"""
+        import shutil
+
+        entry_dir = self._entry_dir(key)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        dest = entry_dir / f"{key}{source.suffix}"
+        if dest.exists():
+            return dest
+
+        tmp = dest.with_name(dest.name + f".{os.getpid()}.tmp")
+        try:
+            shutil.copy2(source, tmp)
+            os.replace(tmp, dest)
+        except OSError as e:
+            print(f"   ⚠️ 렌더링 캐시 저장 실패: {e}")
+            tmp.unlink(missing_ok=True)
+            return None
+        return dest
+
+    def restore(self, key: str, dest_base: Path) -> Optional[Path]:
+        """캐시에서 복원 (하드링크 우선, 실패 시 복사)
+
+        Args:
+            dest_base: 확장자를 제외한 대상 경로 (예: 8_renders/s1)
+        """
+        import shutil
+
+        cached = self.get(key)
+        if cached is None:
+            return None
+
+        dest = dest_base.with_suffix(cached.suffix)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        # 다른 확장자의 이전 렌더링 제거 (s1.mp4 ↔ s1.mov)
+        for ext in (".mov", ".mp4"):
+            old = dest_base.with_suffix(ext)
+            if old.exists() or old.is_symlink():
+                old.unlink()
+
+        try:
+            os.link(cached, dest)
+        except OSError:
+            shutil.copy2(cached, dest)
+        return dest
+
+
 # ============================================================================
 # 렌더링 관리 클래스
 # ============================================================================
 
 class RenderManager:
     """Manim 렌더링 관리"""
+
+    _index_lock = None  # render_index.json 동시 갱신 방지 (build 병렬 실행)
     
     def __init__(self, state_manager: StateManager):
         self.state = state_manager
+        self.cache = RenderCache()
+        if RenderManager._index_lock is None:
+            import threading
+            RenderManager._index_lock = threading.Lock()
     
     def render_scene(
         self,
         scene_id: str,
         quality: str = "l",  # l=low, m=medium, h=high, k=4k
-        preview: bool = True
+        preview: bool = True,
+        log_file: Optional[Path] = None
     ) -> bool:
-        """단일 씬 렌더링"""
+        """단일 씬 렌더링
+
+        Args:
+            log_file: 지정하면 Manim 출력을 화면 대신 로그 파일에 기록 (병렬 렌더링용)
+        """
         
         project_dir = OUTPUT_DIR / self.state.get("project_id", "unknown")
         code_file = project_dir / "4_manim_code" / f"{scene_id}_manim.py"
@@ -3795,6 +6957,14 @@ class RenderManager:
         
         # 클래스 이름 추출 (scene_id를 PascalCase로)
         class_name = scene_id.capitalize()
+
+        # 씬별 격리 출력 폴더 (동시 렌더링/다른 프로젝트와 파일이 섞이지 않도록)
+        project_id = self.state.get("project_id", "unknown")
+        media_dir = get_scene_media_dir(project_id, scene_id, quality)
+        manifest_file = media_dir / RENDER_CONFIG["manifest_file"]
+        media_dir.mkdir(parents=True, exist_ok=True)
+        if manifest_file.exists():
+            manifest_file.unlink()  # 이전 결과가 이번 결과로 오인되지 않도록
         
         # Manim 명령어 구성
         cmd = ["manim"]
@@ -3804,16 +6974,31 @@ class RenderManager:
 
         cmd.append(f"-q{quality}")
         cmd.append("--transparent")  # 투명 배경 (배경 이미지 합성용)
+        cmd.extend(["--media_dir", str(media_dir)])
         cmd.append(str(code_file))
         cmd.append(class_name)
         
-        print(f"\n🎬 렌더링: {scene_id}")
-        print(f"   명령어: {' '.join(cmd)}")
+        if log_file is None:
+            print(f"\n🎬 렌더링: {scene_id}")
+            print(f"   명령어: {' '.join(cmd)}")
         
         try:
+            if log_file is not None:
+                # 병렬 렌더링: 출력이 섞이지 않도록 씬별 로그 파일에 기록
+                log_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(log_file, 'w', encoding='utf-8') as log:
+                    log.write(f"$ {' '.join(cmd)}\n\n")
+                    log.flush()
+                    result = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT, text=True)
+                return result.returncode == 0 and self._write_render_manifest(
+                    scene_id, quality, code_file, class_name, media_dir) is not None
+
             result = subprocess.run(cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
+                if self._write_render_manifest(scene_id, quality, code_file, class_name, media_dir) is None:
+                    print(f"   ❌ 렌더링 출력 파일을 찾을 수 없습니다: {media_dir}")
+                    return False
                 print(f"   ✅ 렌더링 성공")
                 return True
             else:
@@ -3829,18 +7014,62 @@ class RenderManager:
             print(f"   ❌ 렌더링 오류: {e}")
             return False
     
+    def _write_render_manifest(
+        self,
+        scene_id: str,
+        quality: str,
+        code_file: Path,
+        class_name: str,
+        media_dir: Path
+    ) -> Optional[Path]:
+        """렌더링 출력 파일을 manifest에 기록
+
+        Manim 출력 경로: {media_dir}/videos/{코드 파일명}/{해상도}/{클래스명}.mov
+        (--transparent는 .mov, 아니면 .mp4)
+
+        Returns:
+            출력 파일 경로 (찾지 못하면 None)
+        """
+        video_dir = media_dir / "videos" / code_file.stem / RENDER_CONFIG["quality_dirs"].get(quality, "")
+        output = None
+        for ext in (".mov", ".mp4"):
+            candidate = video_dir / f"{class_name}{ext}"
+            if candidate.is_file():
+                output = candidate
+                break
+
+        if output is None:
+            return None
+
+        manifest = {
+            "project_id": self.state.get("project_id", "unknown"),
+            "scene_id": scene_id,
+            "quality": quality,
+            "class_name": class_name,
+            "code_file": str(code_file),
+            "output": str(output),
+            "rendered_at": datetime.now().isoformat()
+        }
+        with open(media_dir / RENDER_CONFIG["manifest_file"], 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return output
+
     def render_all(
         self,
         quality: str = "l",
         preview: bool = False,
-        skip_existing: bool = True
+        skip_existing: bool = True,
+        jobs: int = 1
     ) -> Dict[str, bool]:
         """모든 씬 렌더링
 
         Args:
             quality: 렌더링 품질 (l/m/h/k)
             preview: 미리보기 여부
-            skip_existing: True면 이미 렌더링된 씬 건너뛰기 (기본값 True)
+            skip_existing: True면 최신 상태인 씬 건너뛰기 (기본값 True)
+                           코드/에셋/품질이 바뀐 씬은 다시 렌더링하고,
+                           렌더링 캐시에 있는 씬은 즉시 복원
+            jobs: 동시 렌더링 수 (1=순차, 0=자동). CPU 코어 수와 가용 메모리로 상한 제한
         """
 
         # 렌더링 시작 상태 업데이트
@@ -3861,43 +7090,82 @@ class RenderManager:
             print("❌ Manim 코드 파일이 없습니다.")
             return {}
 
-        # 이미 렌더링된 씬 확인
-        existing_renders = set()
-        if skip_existing and renders_dir.exists():
-            for render_file in renders_dir.glob("*.mp4"):
-                # s1.mp4 → s1
-                scene_id = render_file.stem
-                existing_renders.add(scene_id)
+        # 씬별 캐시 키 (코드 + 에셋 + 품질 + Manim 버전)
+        render_index = self._load_render_index(renders_dir)
+        cache_keys = {}
+        for code_file in code_files:
+            scene_id = code_file.stem.replace("_manim", "")
+            cache_keys[scene_id] = self.cache.compute_key(code_file, quality)
+
+        # render_index.json이 없는 이전 프로젝트: 8_renders/의 기존 결과물을 현재 코드 기준으로 등록
+        # (예전처럼 이미 있는 씬은 다시 렌더링하지 않음 → 업그레이드 직후 전체 재렌더링 방지)
+        if skip_existing and not (renders_dir / RENDER_CONFIG["index_file"]).exists():
+            for scene_id, key in cache_keys.items():
+                for ext in (".mov", ".mp4"):
+                    if (renders_dir / f"{scene_id}{ext}").is_file():
+                        render_index[scene_id] = {"key": key, "file": f"{scene_id}{ext}", "quality": quality}
+                        break
+            if render_index:
+                self._save_render_index(renders_dir, render_index)
+                print(f"📥 render_index.json 없음: 8_renders/의 기존 렌더링 {len(render_index)}개를 현재 코드 기준으로 등록")
+                print("   이후 코드를 고친 씬만 다시 렌더링됩니다. 이미 고친 씬은 render-scene <씬ID>로 렌더링하세요.")
 
         # 렌더링 대상 필터링
         scenes_to_render = []
         skipped = []
+        restored = []
         for code_file in sorted(code_files):
             scene_id = code_file.stem.replace("_manim", "")
-            if skip_existing and scene_id in existing_renders:
-                skipped.append(scene_id)
-            else:
-                scenes_to_render.append(scene_id)
+            key = cache_keys[scene_id]
+
+            if skip_existing:
+                # 1) 8_renders/의 결과물이 현재 코드로 만든 것이면 스킵
+                entry = render_index.get(scene_id, {})
+                if entry.get("key") == key and (renders_dir / entry.get("file", "")).is_file():
+                    skipped.append(scene_id)
+                    continue
+
+                # 2) 렌더링 캐시에 있으면 복원
+                dest = self.cache.restore(key, renders_dir / scene_id)
+                if dest is not None:
+                    render_index[scene_id] = {"key": key, "file": dest.name, "quality": quality}
+                    restored.append(scene_id)
+                    continue
+
+            scenes_to_render.append(scene_id)
+
+        if restored:
+            self._save_render_index(renders_dir, render_index)
+            self._register_renders(renders_dir, render_index, restored)
 
         print(f"\n🎬 렌더링 현황")
         print("="*60)
         print(f"   전체 씬: {len(code_files)}개")
         if skip_existing:
-            print(f"   이미 완료: {len(skipped)}개 (스킵)")
+            print(f"   최신 상태: {len(skipped)}개 (스킵)")
+            print(f"   캐시 복원: {len(restored)}개")
             print(f"   렌더링 대상: {len(scenes_to_render)}개")
 
         if not scenes_to_render:
-            print("\n✅ 모든 씬이 이미 렌더링되어 있습니다.")
-            return {s: True for s in skipped}
+            print("\n✅ 모든 씬이 최신 상태입니다.")
+            return {s: True for s in skipped + restored}
+
+        jobs = self._resolve_render_jobs(jobs, quality)
 
         print("\n🎬 렌더링 시작")
+        if jobs > 1:
+            print(f"   병렬 렌더링: {jobs}개 동시 실행")
+            print(f"   로그: {project_dir / RENDER_CONFIG['log_dir']}/")
         print("="*60)
 
-        results = {s: True for s in skipped}  # 스킵된 씬은 성공으로 처리
+        results = {s: True for s in skipped + restored}  # 스킵/복원된 씬은 성공으로 처리
 
-        for scene_id in scenes_to_render:
-            success = self.render_scene(scene_id, quality, preview)
-            results[scene_id] = success
+        if jobs > 1:
+            results.update(self._render_parallel(scenes_to_render, quality, jobs))
+        else:
+            for scene_id in scenes_to_render:
+                success = self.render_scene(scene_id, quality, preview)
+                results[scene_id] = success
 
         print("\n" + "="*60)
         success_count = sum(1 for v in results.values() if v)
@@ -3908,37 +7176,182 @@ class RenderManager:
             print(f"❌ 실패: {failed_count}개 - {', '.join(failed_scenes)}")
             print(f"   재시도: python math_video_pipeline.py render-failed")
 
-        # 렌더링 성공한 것이 있으면 결과물 자동 수집
-        if success_count > 0:
+        # 새로 렌더링한 씬의 결과물 수집 + 캐시 저장
+        rendered = [s for s in scenes_to_render if results.get(s)]
+        if rendered:
             print("\n📦 렌더링 결과물 자동 수집 중...")
-            self.collect_renders()
+            collected = self.collect_renders(scene_ids=rendered, quality=quality)
+
+            for scene_id, dest in collected.items():
+                dest = Path(dest)
+                key = cache_keys[scene_id]
+                self.cache.put(key, dest)
+                render_index[scene_id] = {"key": key, "file": dest.name, "quality": quality}
+            if collected:
+                self._save_render_index(renders_dir, render_index)
 
         return results
 
-    def render_failed(self, quality: str = "l") -> Dict[str, bool]:
-        """실패한 씬만 재렌더링
+    def render_scene_cached(self, scene_id: str, quality: str = "l") -> Optional[Path]:
+        """단일 씬을 캐시 우선으로 렌더링하고 8_renders/에 반영 (build 명령용)
+
+        최신 결과 → 그대로, 캐시 적중 → 복원, 그 외 → 렌더링 + 수집 + 캐시 저장
 
-        8_renders/에 없는 씬만 렌더링합니다.
+        Returns:
+            8_renders/ 안의 결과 파일 (실패 시 None)
         """
-        return self.render_all(quality=quality, preview=False, skip_existing=True)
+        project_dir = OUTPUT_DIR / self.state.get("project_id", "unknown")
+        code_file = project_dir / "4_manim_code" / f"{scene_id}_manim.py"
+        renders_dir = project_dir / "8_renders"
+
+        if not code_file.exists():
+            print(f"❌ 코드 파일이 없습니다: {code_file}")
+            return None
+
+        key = self.cache.compute_key(code_file, quality)
+
+        with self._index_lock:
+            entry = self._load_render_index(renders_dir).get(scene_id, {})
+        current = renders_dir / entry.get("file", "")
+        if entry.get("key") == key and current.is_file():
+            return current
+
+        dest = self.cache.restore(key, renders_dir / scene_id)
+        if dest is None:
+            log_file = project_dir / RENDER_CONFIG["log_dir"] / f"{scene_id}_render.log"
+            if not self.render_scene(scene_id, quality, preview=False, log_file=log_file):
+                print(f"   ❌ {scene_id} 렌더링 실패 - 로그: {log_file}")
+                return None
+            collected = self.collect_renders(scene_ids=[scene_id], quality=quality)
+            if scene_id not in collected:
+                return None
+            dest = Path(collected[scene_id])
+            self.cache.put(key, dest)
+
+        with self._index_lock:
+            index = self._load_render_index(renders_dir)
+            index[scene_id] = {"key": key, "file": dest.name, "quality": quality}
+            self._save_render_index(renders_dir, index)
+            self._register_renders(renders_dir, index, [scene_id])
+        return dest
+
+    def _load_render_index(self, renders_dir: Path) -> Dict[str, Dict]:
+        """8_renders/render_index.json 로드 (씬 → 캐시 키)"""
+        index_file = renders_dir / RENDER_CONFIG["index_file"]
+        if index_file.exists():
+            try:
+                with open(index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass
+        return {}
+
+    def _save_render_index(self, renders_dir: Path, index: Dict[str, Dict]):
+        """8_renders/render_index.json 저장"""
+        renders_dir.mkdir(parents=True, exist_ok=True)
+        index_file = renders_dir / RENDER_CONFIG["index_file"]
+        tmp = index_file.with_suffix(".json.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, index_file)
+
+    def _register_renders(self, renders_dir: Path, index: Dict[str, Dict], scene_ids: List[str]):
+        """캐시에서 복원한 렌더링을 state.json files.renders에 반영"""
+        with self.state.batch():
+            for scene_id in scene_ids:
+                self.state.add_file("renders", str(renders_dir / index[scene_id]["file"]))
+
+    def _resolve_render_jobs(self, jobs: int, quality: str) -> int:
+        """동시 렌더링 수 결정 (CPU 코어 수 + 가용 메모리 기준 상한)"""
+        limit = os.cpu_count() or 1
+
+        per_job = RENDER_CONFIG["memory_per_job_mb"].get(quality, 1024) * 1024 * 1024
+        available = get_available_memory()
+        if available:
+            limit = min(limit, max(1, available // per_job))
 
-    def collect_renders(self) -> Dict[str, str]:
-        """media/videos/ 폴더에서 렌더링 결과물을 수집하여 8_renders/로 복사"""
+        if jobs <= 0:
+            return limit
+        if jobs > limit:
+            print(f"   ⚠️ 요청 {jobs}개 → {limit}개로 제한 (CPU/메모리)")
+        return max(1, min(jobs, limit))
+
+    def _render_parallel(self, scene_ids: List[str], quality: str, jobs: int) -> Dict[str, bool]:
+        """워커 풀로 여러 Manim 프로세스를 동시에 실행
+
+        씬별 출력은 logs/{scene_id}_render.log에 기록하고,
+        화면에는 시작/완료 진행 상황만 표시합니다.
+        """
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         project_dir = OUTPUT_DIR / self.state.get("project_id", "unknown")
+        log_dir = project_dir / RENDER_CONFIG["log_dir"]
+        log_dir.mkdir(parents=True, exist_ok=True)
+
+        total = len(scene_ids)
+        print_lock = threading.Lock()
+        running = []
+
+        def worker(scene_id: str):
+            with print_lock:
+                running.append(scene_id)
+                print(f"   ▶️  {scene_id} 시작 (진행 중: {', '.join(running)})")
+            started = time.time()
+            log_file = log_dir / f"{scene_id}_render.log"
+            success = self.render_scene(scene_id, quality, preview=False, log_file=log_file)
+            with print_lock:
+                running.remove(scene_id)
+            return scene_id, success, time.time() - started, log_file
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(worker, scene_id) for scene_id in scene_ids]
+            for done, future in enumerate(as_completed(futures), 1):
+                scene_id, success, elapsed, log_file = future.result()
+                results[scene_id] = success
+                with print_lock:
+                    if success:
+                        print(f"   ✅ [{done}/{total}] {scene_id} 완료 ({elapsed:.1f}초)")
+                    else:
+                        print(f"   ❌ [{done}/{total}] {scene_id} 실패 ({elapsed:.1f}초) - 로그: {log_file}")
+
+        # 입력 순서대로 반환
+        return {scene_id: results[scene_id] for scene_id in scene_ids}
+
+    def render_failed(self, quality: str = "l", jobs: int = 1) -> Dict[str, bool]:
+        """실패한 씬만 재렌더링
+
+        렌더링 캐시(8_renders/render_index.json의 캐시 키) 기준으로 최신이 아닌 씬만 렌더링합니다.
+        실패한 씬은 인덱스에 기록되지 않으므로 다시 렌더링되고, 코드/에셋/품질이 바뀐 씬도 포함됩니다.
+        render_index.json이 없는 이전 프로젝트는 8_renders/의 기존 파일을 먼저 등록합니다 (render_all 참고).
+        """
+        return self.render_all(quality=quality, preview=False, skip_existing=True, jobs=jobs)
+
+    def collect_renders(self, scene_ids: Optional[List[str]] = None, quality: Optional[str] = None) -> Dict[str, str]:
+        """씬별 렌더링 manifest를 읽어 결과물을 8_renders/로 복사
+
+        Args:
+            scene_ids: 수집할 씬 목록 (None이면 전체)
+            quality: 수집할 품질 (None이면 씬별로 가장 높은 품질)
+        """
+
+        project_id = self.state.get("project_id", "unknown")
+        project_dir = OUTPUT_DIR / project_id
         renders_dir = project_dir / "8_renders"
         renders_dir.mkdir(parents=True, exist_ok=True)
 
-        # Manim 기본 출력 폴더
-        media_dir = Path("media/videos")
+        # 씬별 격리 출력 폴더
+        media_dir = Path(RENDER_CONFIG["media_dir"]) / project_id
 
         if not media_dir.exists():
-            print(f"❌ media/videos 폴더가 없습니다.")
+            print(f"❌ 렌더링 출력 폴더가 없습니다: {media_dir}")
             return {}
 
         # 프로젝트의 씬 ID 목록 가져오기
         scenes = self.state.get("scenes", {})
-        completed_scenes = scenes.get("completed", [])
+        completed_scenes = list(scene_ids) if scene_ids is not None else scenes.get("completed", [])
 
         if not completed_scenes:
             # 코드 파일에서 씬 ID 추출
@@ -3957,41 +7370,38 @@ class RenderManager:
         missing = []
 
         for scene_id in completed_scenes:
-            # 씬별 폴더 찾기 (예: s1_manim, s2_manim 등)
-            scene_folder_pattern = f"{scene_id}_manim"
-            scene_folders = list(media_dir.glob(scene_folder_pattern))
-
-            if not scene_folders:
-                missing.append(scene_id)
-                continue
-
-            scene_folder = scene_folders[0]
-
-            # 품질 폴더 찾기 (480p15, 720p30, 1080p60 등)
-            quality_folders = [d for d in scene_folder.iterdir() if d.is_dir()]
-
-            if not quality_folders:
-                missing.append(scene_id)
-                continue
-
-            # 가장 최근 폴더 사용 (보통 하나뿐)
-            quality_folder = sorted(quality_folders, key=lambda x: x.stat().st_mtime, reverse=True)[0]
-
-            # 비디오 파일 찾기 (.mov 또는 .mp4)
-            video_files = list(quality_folder.glob("*.mov")) + list(quality_folder.glob("*.mp4"))
+            # manifest에 기록된 정확한 출력 파일 사용
+            manifest = load_render_manifest(project_id, scene_id, quality)
+
+            if manifest is None:
+                # render_all.sh 등으로 직접 렌더링한 경우: 정해진 출력 경로 확인 후 manifest 생성
+                code_file = project_dir / "4_manim_code" / f"{scene_id}_manim.py"
+                for q in ([quality] if quality else ["k", "h", "m", "l"]):
+                    scene_media_dir = get_scene_media_dir(project_id, scene_id, q)
+                    if scene_media_dir.exists() and self._write_render_manifest(
+                            scene_id, q, code_file, scene_id.capitalize(), scene_media_dir):
+                        manifest = load_render_manifest(project_id, scene_id, q)
+                        break
 
-            if not video_files:
+            if manifest is None:
                 missing.append(scene_id)
                 continue
 
-            # 가장 최근 파일 사용
-            source_file = sorted(video_files, key=lambda x: x.stat().st_mtime, reverse=True)[0]
+            source_file = Path(manifest["output"])
 
             # 대상 파일명 (scene_id.확장자)
             dest_file = renders_dir / f"{scene_id}{source_file.suffix}"
 
-            # 복사
+            # 다른 확장자의 이전 렌더링 제거 (s1.mp4 ↔ s1.mov)
+            for ext in (".mov", ".mp4"):
+                old = renders_dir / f"{scene_id}{ext}"
+                if old != dest_file and old.exists():
+                    old.unlink()
+
+            # 복사 (캐시 하드링크를 덮어쓰지 않도록 기존 파일 먼저 제거)
             import shutil
+            if dest_file.exists():
+                dest_file.unlink()
             shutil.copy2(source_file, dest_file)
 
             collected[scene_id] = str(dest_file)
@@ -4003,12 +7413,13 @@ class RenderManager:
         if missing:
             print(f"⚠️  누락: {len(missing)}개 - {', '.join(missing)}")
 
-        # state.json 업데이트
+        # state.json 업데이트 (기존 목록에 병합)
         if collected:
-            state_data = self.state.load()
-            state_data.setdefault("files", {})["renders"] = list(collected.values())
-            state_data["current_phase"] = "rendered"
-            self.state.save()
+            with self.state.batch():
+                for path in collected.values():
+                    self.state.add_file("renders", path)
+                self.state.set("current_phase", "rendered")
+                self.state.save()
             print(f"\n📝 state.json 업데이트 완료")
             print(f"   current_phase: rendered")
             print(f"   files.renders: {len(collected)}개 파일")
@@ -4045,12 +7456,14 @@ class RenderManager:
         for code_file in code_files:
             scene_id = code_file.stem.replace("_manim", "")
             class_name = scene_id.capitalize()
+            media_dir = get_scene_media_dir(self.state.get("project_id", "unknown"), scene_id, "l")
             
             lines.append(f'echo "렌더링: {scene_id}..."')
-            lines.append(f'manim -pql "{code_file}" {class_name}')
+            lines.append(f'manim -pql --transparent --media_dir "{media_dir}" "{code_file}" {class_name}')
             lines.append("")
         
         lines.append('echo "모든 씬 렌더링 완료!"')
+        lines.append('python math_video_pipeline.py render-collect')
         
         with open(script_file, 'w', encoding='utf-8') as f:
             f.write("\n".join(lines))
@@ -4109,31 +7522,20 @@ class SceneSplitter:
             print("❌ 활성 프로젝트가 없습니다.")
             return
 
-        scenes_path = Path(f"output/{project_id}/2_scenes/scenes.json")
-        if not scenes_path.exists():
-            print(f"❌ scenes.json이 없습니다: {scenes_path}")
+        store = SceneStore.for_project(project_id)
+        if not store.exists():
+            print(f"❌ scenes.json이 없습니다: {store.scenes_file}")
             return
 
-        # scenes.json 읽기
-        with open(scenes_path, "r", encoding="utf-8") as f:
-            scenes = json.load(f)
-
+        scenes = store.scenes()
         if not scenes:
             print("❌ scenes.json이 비어있습니다.")
             return
 
-        # 개별 파일로 저장
-        output_dir = scenes_path.parent
-        saved_count = 0
-
-        for scene in scenes:
-            scene_id = scene.get("scene_id", "unknown")
-            scene_file = output_dir / f"{scene_id}.json"
-
-            with open(scene_file, "w", encoding="utf-8") as f:
-                json.dump(scene, f, ensure_ascii=False, indent=2)
-
-            saved_count += 1
+        # 개별 파일로 저장 (내용이 바뀐 씬만 다시 씀)
+        output_dir = store.scenes_dir
+        store.save(scenes, sync_files=True)
+        saved_count = len(scenes)
 
         print(f"✅ {saved_count}개 씬을 개별 파일로 분할했습니다.")
         print(f"   위치: {output_dir}/")
@@ -4172,17 +7574,8 @@ class SceneMerger:
                 all_scenes.extend(scenes)
                 print(f"   {part_file}: {len(scenes)}개 씬")
 
-        # scenes.json 저장
-        scenes_path = scenes_dir / "scenes.json"
-        with open(scenes_path, "w", encoding="utf-8") as f:
-            json.dump(all_scenes, f, ensure_ascii=False, indent=2)
-
-        # 개별 파일 저장
-        for scene in all_scenes:
-            scene_id = scene.get("scene_id", "unknown")
-            scene_file = scenes_dir / f"{scene_id}.json"
-            with open(scene_file, "w", encoding="utf-8") as f:
-                json.dump(scene, f, ensure_ascii=False, indent=2)
+        # scenes.json + 개별 파일 저장
+        SceneStore(scenes_dir.parent).save(all_scenes, sync_files=True)
 
         print(f"\n✅ 병합 완료: scenes.json ({len(all_scenes)}개 씬)")
         print(f"✅ 개별 파일: s1.json ~ s{len(all_scenes)}.json")
@@ -4209,40 +7602,30 @@ class NarrationExtractor:
             print("❌ 활성 프로젝트가 없습니다.")
             return
 
-        scenes_path = Path(f"output/{project_id}/2_scenes")
-        if not scenes_path.exists():
-            print(f"❌ 씬 폴더가 없습니다: {scenes_path}")
+        store = SceneStore.for_project(project_id)
+        if not store.scenes_dir.exists():
+            print(f"❌ 씬 폴더가 없습니다: {store.scenes_dir}")
             return
 
-        # 씬 파일 목록 가져오기
-        if scene_ids:
-            scene_files = [scenes_path / f"{sid}.json" for sid in scene_ids]
-            scene_files = [f for f in scene_files if f.exists()]
-        else:
-            scene_files = sorted(scenes_path.glob("s*.json"),
-                               key=lambda x: self._scene_sort_key(x.stem))
+        # 씬 목록 (개별 s*.json 우선, 없으면 scenes.json 항목)
+        scenes = [(sid, store.get(sid)) for sid in (scene_ids or store.all_ids())]
+        scenes = [(sid, scene) for sid, scene in scenes if scene]
 
-        if not scene_files:
+        if not scenes:
             print("❌ 씬 파일이 없습니다.")
             return
 
         # narration_display 추출
         extractions = []
-        for scene_file in scene_files:
-            try:
-                with open(scene_file, "r", encoding="utf-8") as f:
-                    scene_data = json.load(f)
+        for sid, scene_data in scenes:
+            scene_id = scene_data.get("scene_id", sid)
+            narration_display = scene_data.get("narration_display", "")
 
-                scene_id = scene_data.get("scene_id", scene_file.stem)
-                narration_display = scene_data.get("narration_display", "")
-
-                if narration_display:
-                    extractions.append({
-                        "scene_id": scene_id,
-                        "narration_display": narration_display
-                    })
-            except Exception as e:
-                print(f"  ⚠️ {scene_file.name} 로드 실패: {e}")
+            if narration_display:
+                extractions.append({
+                    "scene_id": scene_id,
+                    "narration_display": narration_display
+                })
 
         # 결과 출력 (Claude가 읽어서 Narration Designer에게 전달)
         print(f"\n📝 나레이션 추출 완료: {len(extractions)}개 씬")
@@ -4252,14 +7635,6 @@ class NarrationExtractor:
         print(f"\n💡 위 내용을 Narration Designer에게 전달하세요.")
         print(f"   출력 위치: output/{project_id}/2_narration/")
 
-    def _scene_sort_key(self, scene_id: str):
-        """씬 ID 정렬 키 (s1, s2, ..., s10, s11, ...)"""
-        import re
-        match = re.match(r's(\d+)([a-z]*)', scene_id)
-        if match:
-            return (int(match.group(1)), match.group(2))
-        return (0, scene_id)
-
     def save_narration(self, scene_id: str, subtitle_display: str, narration_tts: str):
         """Narration Designer가 생성한 나레이션을 저장
 
@@ -4295,12 +7670,10 @@ class NarrationExtractor:
         if not project_id:
             return {"error": "활성 프로젝트가 없습니다."}
 
-        scenes_path = Path(f"output/{project_id}/2_scenes")
         narration_path = Path(f"output/{project_id}/2_narration")
 
         # 씬 목록
-        scene_files = list(scenes_path.glob("s*.json")) if scenes_path.exists() else []
-        scene_ids = [f.stem for f in scene_files]
+        scene_ids = SceneStore.for_project(project_id).all_ids()
 
         # 나레이션 파일 목록
         narration_files = list(narration_path.glob("*_narration.json")) if narration_path.exists() else []
@@ -4325,6 +7698,312 @@ class NarrationExtractor:
         return result
 
 
+# ============================================================================
+# 자막 정렬 (subtitle_display ↔ Whisper 단어 타임스탬프)
+# ============================================================================
+
+class SubtitleAligner:
+    """subtitle_display 문장(;; 분리)을 Whisper 단어 타임스탬프에 정렬
+
+    대본 문자열과 Whisper 인식 문자열을 문자 단위 DP(전역 정렬)로 맞춘 뒤,
+    각 문장의 첫/마지막 문자에 대응되는 인식 문자의 시각으로 문장 경계를 정함.
+
+    - 한글 음절은 초성/중성/종성 불일치 비율만큼 부분 비용
+      → "탄력성" → "팔력성" 같은 오인식도 근접 매칭으로 흡수
+    - DP는 행 단위 numpy 벡터 연산 (행 내 삽입 연쇄는 누적 최소값으로 처리)
+    - 오프라인 동작 (API 호출 없음, timing.json만 사용)
+    - 정렬할 수 없으면 None 반환 → 호출 측에서 균등 분배
+    """
+
+    HANGUL_BASE = 0xAC00
+    HANGUL_LAST = 0xD7A3
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or SUBTITLE_ALIGN_CONFIG
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """비교용 정규화 (NFC, 소문자, 공백/구두점 제거)"""
+        import unicodedata
+
+        text = unicodedata.normalize("NFC", text or "").lower()
+        return "".join(ch for ch in text if ch.isalnum())
+
+    def _char_features(self, chars: str):
+        """문자별 (코드, 한글 여부, 초성, 중성, 종성) 배열"""
+        codes = np.array([ord(ch) for ch in chars], dtype=np.int64)
+        is_hangul = (codes >= self.HANGUL_BASE) & (codes <= self.HANGUL_LAST)
+        offset = np.where(is_hangul, codes - self.HANGUL_BASE, 0)
+        return codes, is_hangul, offset // 588, (offset % 588) // 28, offset % 28
+
+    def _cost(self, a, b, i: int, j: int) -> float:
+        """대본 i번째 문자와 인식 j번째 문자의 치환 비용 (역추적용)"""
+        if a[0][i] == b[0][j]:
+            return 0.0
+        if a[1][i] and b[1][j]:
+            # numpy bool끼리 더하면 논리합이 되므로 int로 변환 (_cost_row와 같은 값이어야 역추적이 맞음)
+            return (int(a[2][i] != b[2][j]) + int(a[3][i] != b[3][j]) + int(a[4][i] != b[4][j])) / 3.0
+        return 1.0
+
+    def _cost_row(self, a, b, i: int):
+        """대본 i번째 문자와 인식 문자 전체의 치환 비용 (0 ~ 1)"""
+        codes_a, hangul_a, cho_a, jung_a, jong_a = a
+        codes_b, hangul_b, cho_b, jung_b, jong_b = b
+
+        cost = (codes_b != codes_a[i]).astype(np.float64)
+        if hangul_a[i]:
+            jamo = ((cho_b != cho_a[i]).astype(np.float64)
+                    + (jung_b != jung_a[i])
+                    + (jong_b != jong_a[i])) / 3.0
+            cost = np.where(hangul_b, jamo, cost)
+        return cost
+
+    def align_chars(self, display: str, recognized: str) -> Optional[List[Optional[int]]]:
+        """문자 단위 전역 정렬
+
+        Returns:
+            대본 문자별 대응 인식 문자 인덱스 리스트 (삭제된 문자는 None)
+            정렬 품질이 낮거나 계산할 수 없으면 None
+        """
+        n, m = len(display), len(recognized)
+        if not has_optional("numpy") or n == 0 or m == 0:
+            return None
+        if (n + 1) * (m + 1) > self.config["max_cells"]:
+            return None
+
+        gap = self.config["gap_cost"]
+        a = self._char_features(display)
+        b = self._char_features(recognized)
+
+        # D[i, j] = display[:i] 와 recognized[:j] 의 최소 편집 비용
+        ramp = np.arange(m + 1, dtype=np.float64) * gap
+        D = np.empty((n + 1, m + 1), dtype=np.float64)
+        D[0] = ramp
+        for i in range(1, n + 1):
+            prev = D[i - 1]
+            row = np.empty(m + 1, dtype=np.float64)
+            row[0] = prev[0] + gap
+            row[1:] = np.minimum(prev[:-1] + self._cost_row(a, b, i - 1), prev[1:] + gap)
+            # 행 내 삽입(왼쪽 이동): D[i, j] = min_k(row[k] + (j - k) * gap)
+            D[i] = np.minimum.accumulate(row - ramp) + ramp
+
+        # 역추적
+        mapping: List[Optional[int]] = [None] * n
+        matched = 0
+        i, j = n, m
+        while i > 0 and j > 0:
+            sub = self._cost(a, b, i - 1, j - 1)
+            if abs(D[i, j] - (D[i - 1, j - 1] + sub)) < 1e-9:
+                mapping[i - 1] = j - 1
+                if sub < 1.0:
+                    matched += 1
+                i, j = i - 1, j - 1
+            elif abs(D[i, j] - (D[i - 1, j] + gap)) < 1e-9:
+                i -= 1
+            else:
+                j -= 1
+
+        if matched / n < self.config["min_match_ratio"]:
+            return None
+        return mapping
+
+    def align(
+        self,
+        display_sentences: List[str],
+        words: List[dict],
+        total_duration: float
+    ) -> Optional[List[tuple]]:
+        """문장별 (text, start, end) 계산
+
+        Args:
+            display_sentences: subtitle_display를 ;; 기준으로 분리한 문장들
+            words: [{"text", "start", "end"}, ...] Whisper 단어 (없으면 segments도 가능)
+            total_duration: 씬 오디오 길이
+
+        Returns:
+            List of (sentence_text, start_time, end_time), 정렬 실패 시 None
+        """
+        if not display_sentences or not words or total_duration <= 0:
+            return None
+
+        # 대본 문자열 + 문장 시작 문자 위치
+        display_chars = []
+        sentence_spans = []
+        for sentence in display_sentences:
+            chars = self.normalize(sentence)
+            start = len(display_chars)
+            display_chars.extend(chars)
+            sentence_spans.append((start, len(display_chars)))
+
+        # 인식 문자열 + 문자별 시각 (단어 구간을 글자 수로 나눔)
+        recognized_chars = []
+        char_start = []
+        char_end = []
+        for word in words:
+            chars = self.normalize(word.get("text", ""))
+            if not chars:
+                continue
+            w_start = float(word.get("start", 0))
+            w_end = max(float(word.get("end", w_start)), w_start)
+            step = (w_end - w_start) / len(chars)
+            for k, ch in enumerate(chars):
+                recognized_chars.append(ch)
+                char_start.append(w_start + k * step)
+                char_end.append(w_start + (k + 1) * step)
+
+        mapping = self.align_chars("".join(display_chars), "".join(recognized_chars))
+        if mapping is None:
+            return None
+
+        # 문장별 발화 구간 (대응 문자가 없으면 None)
+        spoken = []
+        for start, end in sentence_spans:
+            indices = [mapping[k] for k in range(start, end) if mapping[k] is not None]
+            if indices:
+                spoken.append((char_start[min(indices)], char_end[max(indices)]))
+            else:
+                spoken.append(None)
+
+        # 대응 문자 위치 → 시각 보간용 앵커
+        anchor_pos = [0.0]
+        anchor_time = [0.0]
+        for k, j in enumerate(mapping):
+            if j is not None:
+                anchor_pos.append(k + 0.5)
+                anchor_time.append((char_start[j] + char_end[j]) / 2)
+        anchor_pos.append(float(len(display_chars)))
+        anchor_time.append(total_duration)
+        anchor_time = np.maximum.accumulate(np.array(anchor_time, dtype=np.float64))
+
+        # 문장 경계: 앞 문장 끝과 다음 문장 시작 사이 (쉼 구간 중간)
+        boundaries = [0.0]
+        for k in range(1, len(display_sentences)):
+            prev_spoken, next_spoken = spoken[k - 1], spoken[k]
+            if prev_spoken and next_spoken and next_spoken[0] >= prev_spoken[1]:
+                boundaries.append((prev_spoken[1] + next_spoken[0]) / 2)
+            elif next_spoken:
+                boundaries.append(next_spoken[0])
+            else:
+                pos = float(sentence_spans[k][0])
+                boundaries.append(float(np.interp(pos, anchor_pos, anchor_time)))
+        boundaries.append(total_duration)
+
+        boundaries = np.clip(np.maximum.accumulate(np.array(boundaries)), 0.0, total_duration)
+        return [
+            (sentence, float(boundaries[k]), float(boundaries[k + 1]))
+            for k, sentence in enumerate(display_sentences)
+        ]
+
+
+# ============================================================================
+# 씬 분할 지점 제안 (섹션 오디오 → split_points_{section}.json)
+# ============================================================================
+
+class SplitPointSuggester:
+    """섹션 오디오의 무음 구간과 Whisper 정렬로 씬 분할 지점 계산
+
+    1. 예상 경계: 씬별 narration_tts를 섹션 Whisper 단어에 문자 단위 정렬 (SubtitleAligner)
+    2. 쉼 후보: 프레임 에너지(dB)로 무음 구간 검출 (바닥 소음/음성 레벨 기준 적응형 임계값)
+    3. 스냅: 예상 경계 근처(snap_window)의 쉼 중심으로 이동 (가깝고 긴 쉼 우선)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, ffmpeg_path: Optional[str] = None):
+        self.config = config or SPLIT_SUGGEST_CONFIG
+        self.aligner = SubtitleAligner()
+        self.decoder = AudioAssembler(
+            ffmpeg_path, config={**AUDIO_ASSEMBLY_CONFIG, "sample_rate": self.config["sample_rate"]}
+        )
+
+    def find_pauses(self, buffer: 'np.ndarray') -> List[tuple]:
+        """무음 구간 [(start, end), ...] (초)"""
+        sample_rate = self.config["sample_rate"]
+        hop = max(1, int(sample_rate * self.config["frame"]))
+        count = len(buffer) // hop
+        if count == 0:
+            return []
+
+        frames = buffer[:count * hop].reshape(count, hop)
+        db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+        floor, speech = np.percentile(db, 10), np.percentile(db, 90)
+        silent = db < floor + (speech - floor) * self.config["threshold_ratio"]
+
+        # 무음 구간 경계 (양 끝은 음성으로 감싸서 계산)
+        edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        keep = (ends - starts) * self.config["frame"] >= self.config["min_pause"]
+        return [(s * self.config["frame"], e * self.config["frame"]) for s, e in zip(starts[keep], ends[keep])]
+
+    def expected_boundaries(self, scene_texts: List[str], timestamps: Dict[str, Any], duration: float) -> List[float]:
+        """씬 텍스트 정렬로 예상 경계 (씬 수 - 1개)"""
+        words = timestamps.get("words") or timestamps.get("segments") or []
+        aligned = self.aligner.align(scene_texts, words, duration)
+        if aligned:
+            return [start for _, start, _ in aligned[1:]]
+
+        # 정렬 실패: 글자 수 비례
+        lengths = [max(1, len(SubtitleAligner.normalize(t))) for t in scene_texts]
+        recognized = sum(len(SubtitleAligner.normalize(w.get("text", ""))) for w in words)
+        if (sum(lengths) + 1) * (recognized + 1) > self.aligner.config["max_cells"]:
+            # 섹션이 너무 길면 DP 행렬 한도(max_cells)로 정렬을 건너뜀 → 경계 정확도 낮음
+            print(f"  ⚠️  정렬 행렬 한도 초과 ({sum(lengths)} x {recognized}자 > max_cells "
+                  f"{self.aligner.config['max_cells']:,}), 글자 수 비례 경계 사용")
+        total = sum(lengths)
+        bounds, acc = [], 0
+        for length in lengths[:-1]:
+            acc += length
+            bounds.append(duration * acc / total)
+        return bounds
+
+    def snap(self, expected: List[float], pauses: List[tuple]) -> List[float]:
+        """예상 경계 → 근처 쉼 중심 (없으면 그대로), 단조 증가 유지"""
+        snapped = []
+        previous = 0.0
+        for boundary in expected:
+            best, best_score = boundary, None
+            for start, end in pauses:
+                center = (start + end) / 2
+                distance = abs(center - boundary)
+                if distance > self.config["snap_window"] or center <= previous:
+                    continue
+                score = distance - self.config["pause_bonus"] * (end - start)
+                if best_score is None or score < best_score:
+                    best, best_score = center, score
+            best = max(best, previous)
+            snapped.append(best)
+            previous = best
+        return snapped
+
+    def suggest(self, audio_file: Path, scenes: List[tuple], timestamps: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """섹션 하나의 분할 지점
+
+        Args:
+            audio_file: 섹션 오디오 (hook.mp3 등)
+            scenes: [(scene_id, narration_tts), ...] 섹션 내 씬 순서대로
+            timestamps: {section}_timestamps.json 내용
+
+        Returns:
+            {"splits": [{"scene_id", "start", "end"}, ...], "pauses": N} 또는 None
+        """
+        buffer = self.decoder.decode(audio_file)
+        if buffer is None or not scenes:
+            return None
+        duration = len(buffer) / self.config["sample_rate"]
+
+        pauses = self.find_pauses(buffer)
+        expected = self.expected_boundaries([text for _, text in scenes], timestamps, duration)
+        bounds = [0.0] + self.snap(expected, pauses) + [duration]
+
+        return {
+            "splits": [
+                {"scene_id": scene_id, "start": round(bounds[i], 3), "end": round(bounds[i + 1], 3)}
+                for i, (scene_id, _) in enumerate(scenes)
+            ],
+            "pauses": len(pauses),
+            "duration": duration
+        }
+
+
 # ============================================================================
 # 영상 합성 및 자막 관리
 # ============================================================================
@@ -4336,6 +8015,8 @@ class ComposerManager:
         self.state = state
         self.ffmpeg_path = self._find_ffmpeg()
         self.ffprobe_path = self._find_ffprobe()
+        self.media_probe = get_media_probe(self.ffprobe_path)
+        self.subtitle_aligner = SubtitleAligner()
 
     def _find_ffmpeg(self) -> str:
         """FFmpeg 경로 찾기"""
@@ -4376,18 +8057,11 @@ class ComposerManager:
         return "ffprobe"
 
     def _get_duration(self, file_path: Path) -> Optional[float]:
-        """오디오/비디오 파일 길이 확인 (ffprobe 사용)"""
-        try:
-            result = subprocess.run([
-                self.ffprobe_path, "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "csv=p=0", str(file_path)
-            ], capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
-                return float(result.stdout.strip())
-        except Exception as e:
-            print(f"  ⚠️ 길이 확인 실패: {e}")
-        return None
+        """오디오/비디오 파일 길이 확인 (MediaProbe 캐시)"""
+        duration = self.media_probe.duration(file_path)
+        if duration is None:
+            print(f"  ⚠️ 길이 확인 실패: {Path(file_path).name}")
+        return duration
 
     def _get_project_paths(self) -> Dict[str, Path]:
         """프로젝트 경로들 반환"""
@@ -4448,12 +8122,12 @@ class ComposerManager:
             2. 2_scenes/{scene_id}.json의 subtitle_display (fallback)
             3. 2_scenes/{scene_id}.json의 narration_display (fallback)
 
-        타이밍 소스: timing.json의 sentences 배열 (Whisper segments)
+        타이밍 소스: timing.json의 words 배열 (Whisper 단어 타임스탬프)
 
         방식:
-        1. subtitle_display를 ;; 또는 .?! 기준으로 문장 분리 → 텍스트
-        2. timing.json의 sentences 배열에서 타이밍 추출 → start/end
-        3. 문장 수 일치하면 1:1 매핑, 불일치하면 균등 분배
+        1. subtitle_display를 ;; 기준으로 문장 분리 → 텍스트
+        2. 문장들을 Whisper 단어에 문자 단위 정렬 → start/end (SubtitleAligner)
+        3. 단어 정보가 없거나 정렬 실패 시 균등 분배
         """
         paths = self._get_project_paths()
         if not paths:
@@ -4462,7 +8136,6 @@ class ComposerManager:
 
         audio_path = paths["audio"]
         subtitle_path = paths["subtitles"]
-        scenes_path = paths["scenes"]
         project_dir = paths["base"]
 
         # 자막 폴더 생성
@@ -4481,26 +8154,19 @@ class ComposerManager:
 
         # scenes.json에서 자막 텍스트 로드
         # 우선순위: narration#.json > subtitle_display > narration_display
+        store = SceneStore(project_dir)
         scene_texts = {}
-        for scene_file in scenes_path.glob("s*.json"):
-            try:
-                with open(scene_file, 'r', encoding='utf-8') as f:
-                    scene_data = json.load(f)
-                    scene_id = scene_data.get('scene_id', scene_file.stem)
-                    # subtitle_display 가져오기 (narration#.json 우선)
-                    subtitle_text = self._get_subtitle_display(project_dir, scene_id, scene_data)
-                    scene_texts[scene_id] = subtitle_text
-            except Exception as e:
-                print(f"  ⚠️ {scene_file.name} 로드 실패: {e}")
+        for sid in store.all_ids():
+            scene_data = store.get(sid)
+            if not scene_data:
+                continue
+            scene_id = scene_data.get('scene_id', sid)
+            # subtitle_display 가져오기 (narration#.json 우선)
+            scene_texts[scene_id] = self._get_subtitle_display(project_dir, scene_id, scene_data)
 
         # timing 파일 찾기 (s32a 같은 ID도 지원)
         def scene_sort_key(path):
-            scene_id = path.stem.split("_")[0][1:]  # "s32a" -> "32a"
-            import re
-            match = re.match(r'(\d+)([a-z]*)', scene_id)
-            if match:
-                return (int(match.group(1)), match.group(2))
-            return (0, scene_id)
+            return SceneStore.natural_key(path.stem.split("_")[0])  # "s32a_timing" -> "s32a"
 
         timing_files = sorted(audio_path.glob("*_timing.json"), key=scene_sort_key)
 
@@ -4537,9 +8203,10 @@ class ComposerManager:
                 generated.append(scene_id)
                 continue
 
-            # 타이밍 계산: sentences 배열 타이밍 + narration_display 텍스트
+            # 타이밍 계산: Whisper 단어 타이밍 + narration_display 텍스트
             sentence_timings = self._calculate_sentence_timings_from_segments(
-                display_sentences, timing_sentences, total_duration
+                display_sentences, timing_sentences, total_duration,
+                words=timing_data.get('words')
             )
 
             # SRT 생성 - 문장 단위
@@ -4563,7 +8230,7 @@ class ComposerManager:
 
         print(f"\n✅ 자막 생성 완료: {len(generated)}개 파일")
         print(f"   위치: {subtitle_path}")
-        print(f"   ℹ️  텍스트: narration_display, 타이밍: Whisper segments")
+        print(f"   ℹ️  텍스트: narration_display, 타이밍: Whisper 단어 정렬")
 
         return True
 
@@ -4576,20 +8243,16 @@ class ComposerManager:
 
         audio_path = paths["audio"]
         subtitle_path = paths["subtitles"]
-        scenes_path = paths["scenes"]
         project_dir = paths["base"]
 
         subtitle_path.mkdir(parents=True, exist_ok=True)
 
-        # 씬 파일에서 데이터 로드
-        scene_file = scenes_path / f"{scene_id}.json"
-        if not scene_file.exists():
-            print(f"❌ 씬 파일을 찾을 수 없습니다: {scene_file}")
+        # 씬 데이터 로드 (개별 s*.json 우선, 없으면 scenes.json 항목)
+        scene_data = SceneStore(project_dir).get(scene_id)
+        if not scene_data:
+            print(f"❌ 씬을 찾을 수 없습니다: {scene_id}")
             return False
 
-        with open(scene_file, 'r', encoding='utf-8') as f:
-            scene_data = json.load(f)
-
         # subtitle_display 가져오기 (narration#.json 우선)
         original_text = self._get_subtitle_display(project_dir, scene_id, scene_data)
 
@@ -4616,7 +8279,8 @@ class ComposerManager:
             return True
 
         sentence_timings = self._calculate_sentence_timings_from_segments(
-            display_sentences, timing_sentences, total_duration
+            display_sentences, timing_sentences, total_duration,
+            words=timing_data.get('words')
         )
 
         # SRT 생성
@@ -4661,43 +8325,53 @@ class ComposerManager:
         self,
         display_sentences: List[str],
         timing_sentences: List[dict],
-        total_duration: float
+        total_duration: float,
+        words: Optional[List[dict]] = None
     ) -> List[tuple]:
-        """문장별 타이밍 계산 (균등 분배 방식)
+        """문장별 타이밍 계산 (Whisper 단어 정렬, 실패 시 균등 분배)
 
         ============================================================
-        [자막 타이밍 계산 로직] - 균등 분배
+        [자막 타이밍 계산 로직]
         ============================================================
 
         Whisper의 한계:
-        - segments: 발화 단위(pause 기준)이지 문장 단위(.?!)가 아님
+        - segments: 발화 단위(pause 기준)이지 문장 단위(;;)가 아님
         - words: 텍스트 오인식 많음 ("탄력성" → "팔력성")
 
-        따라서 균등 분배 사용:
-        - 텍스트: narration_display에서 .?! 기준 분리 (정확함)
-        - 타이밍: total_duration / 문장수 (근사치)
-
-        예시 (s16, 14.35초, 5문장):
-        - 문장1: 0.00 ~ 2.87초
-        - 문장2: 2.87 ~ 5.74초
-        - 문장3: 5.74 ~ 8.61초
-        - 문장4: 8.61 ~ 11.48초
-        - 문장5: 11.48 ~ 14.35초
+        따라서 텍스트는 대본, 타이밍만 Whisper에서 가져옴:
+        - 텍스트: subtitle_display에서 ;; 기준 분리 (정확함)
+        - 타이밍: 대본 문자열을 Whisper 단어 문자열에 문자 단위 DP 정렬
+          → 오인식 글자도 위치로 매칭되어 문장 시작/끝 시각 확보
+        - words가 없으면 segments(sentences 배열)를 단어 대신 사용
+        - 정렬 실패 시: total_duration / 문장수 (균등 분배)
         ============================================================
 
         Args:
             display_sentences: narration_display에서 분리한 문장들 (텍스트용)
-            timing_sentences: timing.json의 sentences 배열 (현재 미사용)
+            timing_sentences: timing.json의 sentences 배열 (words 없을 때 사용)
             total_duration: 전체 오디오 길이
+            words: timing.json의 words 배열 (Whisper 단어 타임스탬프)
 
         Returns:
             List of (sentence_text, start_time, end_time)
         """
-        n_display = len(display_sentences)
+        aligned = self.subtitle_aligner.align(
+            display_sentences, words or timing_sentences or [], total_duration
+        )
+        if aligned:
+            return aligned
+        return self._uniform_sentence_timings(display_sentences, total_duration)
+
+    def _uniform_sentence_timings(self, display_sentences: List[str], total_duration: float) -> List[tuple]:
+        """균등 분배: total_duration / 문장수
 
-        # ============================================================
-        # 균등 분배: total_duration / 문장수
-        # ============================================================
+        예시 (s16, 14.35초, 5문장):
+        - 문장1: 0.00 ~ 2.87초
+        - 문장2: 2.87 ~ 5.74초
+        - ...
+        - 문장5: 11.48 ~ 14.35초
+        """
+        n_display = len(display_sentences)
         duration_per_sentence = total_duration / n_display
         result = []
         for i, sentence in enumerate(display_sentences):
@@ -4709,13 +8383,139 @@ class ComposerManager:
             result.append((sentence, start, end))
         return result
 
+    def benchmark_subtitle_sync(self, project_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """자막 싱크 오차 벤치마크 (균등 분배 vs 단어 정렬)
+
+        기준값: timing.json의 sentences(Whisper segments) 수가 ;; 문장 수와 같은 씬만 사용
+        (segments는 쉼 기준 발화 구간이므로 개수가 같으면 문장과 1:1 대응)
+        오차: 문장 경계(앞 문장 끝 ~ 다음 문장 시작의 중간)와의 절대 차이
+
+        Args:
+            project_ids: 대상 프로젝트 목록 (None이면 output/ 전체)
+
+        Returns:
+            {"scenes": N, "uniform": {...}, "aligned": {...}, "fallback": N, "align_ms": ...}
+        """
+        import time
+
+        if project_ids:
+            project_dirs = [OUTPUT_DIR / pid for pid in project_ids]
+        else:
+            project_dirs = sorted(d for d in OUTPUT_DIR.iterdir() if d.is_dir()) if OUTPUT_DIR.exists() else []
+
+        errors = {"uniform": [], "aligned": []}
+        scenes = 0
+        fallback = 0
+        align_seconds = 0.0
+
+        print(f"\n📏 자막 싱크 벤치마크")
+        print("=" * 60)
+
+        for project_dir in project_dirs:
+            audio_dir = project_dir / "0_audio"
+            scenes_dir = project_dir / "2_scenes"
+            if not audio_dir.exists() or not scenes_dir.exists():
+                continue
+
+            project_scenes = 0
+            project_errors = {"uniform": [], "aligned": []}
+
+            for timing_file in sorted(audio_dir.glob("*_timing.json")):
+                scene_id = timing_file.stem.replace("_timing", "")
+                scene_file = scenes_dir / f"{scene_id}.json"
+                if not scene_file.exists():
+                    continue
+
+                try:
+                    with open(timing_file, 'r', encoding='utf-8') as f:
+                        timing_data = json.load(f)
+                    with open(scene_file, 'r', encoding='utf-8') as f:
+                        scene_data = json.load(f)
+                except Exception:
+                    continue
+
+                display_sentences = self._split_sentences(
+                    self._get_subtitle_display(project_dir, scene_id, scene_data)
+                )
+                reference = timing_data.get('sentences', [])
+                words = timing_data.get('words', [])
+                total_duration = timing_data.get('total_duration', 0)
+
+                if len(display_sentences) < 2 or len(reference) != len(display_sentences):
+                    continue
+                if not words or total_duration <= 0:
+                    continue
+
+                ref_bounds = [
+                    (reference[k - 1].get('end', 0) + reference[k].get('start', 0)) / 2
+                    for k in range(1, len(reference))
+                ]
+
+                started = time.perf_counter()
+                aligned = self.subtitle_aligner.align(display_sentences, words, total_duration)
+                align_seconds += time.perf_counter() - started
+                if not aligned:
+                    fallback += 1
+                    aligned = self._uniform_sentence_timings(display_sentences, total_duration)
+                uniform = self._uniform_sentence_timings(display_sentences, total_duration)
+
+                for name, timings in (("uniform", uniform), ("aligned", aligned)):
+                    diffs = [abs(timings[k][1] - ref_bounds[k - 1]) for k in range(1, len(timings))]
+                    project_errors[name].extend(diffs)
+                    errors[name].extend(diffs)
+                project_scenes += 1
+
+            if project_scenes:
+                scenes += project_scenes
+                u = sum(project_errors["uniform"]) / len(project_errors["uniform"])
+                a = sum(project_errors["aligned"]) / len(project_errors["aligned"])
+                print(f"   📂 {project_dir.name}: {project_scenes}개 씬 | 균등 {u:.2f}초 → 정렬 {a:.2f}초")
+
+        def summarize(values: List[float]) -> Dict[str, float]:
+            if not values:
+                return {"mean": 0.0, "p90": 0.0, "max": 0.0}
+            ordered = sorted(values)
+            return {
+                "mean": sum(ordered) / len(ordered),
+                "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+                "max": ordered[-1]
+            }
+
+        result = {
+            "scenes": scenes,
+            "boundaries": len(errors["aligned"]),
+            "uniform": summarize(errors["uniform"]),
+            "aligned": summarize(errors["aligned"]),
+            "fallback": fallback,
+            "align_ms": (align_seconds * 1000 / scenes) if scenes else 0.0
+        }
+
+        print("=" * 60)
+        if not scenes:
+            print("⚠️ 비교할 씬이 없습니다. (문장별 timing.json + words 필요)")
+            return result
+
+        print(f"   씬 {scenes}개, 문장 경계 {result['boundaries']}개")
+        for name, label in (("uniform", "균등 분배"), ("aligned", "단어 정렬")):
+            stats = result[name]
+            print(f"   {label}: 평균 {stats['mean']:.3f}초 | p90 {stats['p90']:.3f}초 | 최대 {stats['max']:.3f}초")
+        print(f"   정렬 실패(균등 분배 사용): {fallback}개 씬")
+        print(f"   정렬 시간: 씬당 {result['align_ms']:.1f}ms")
+
+        return result
+
     def _merge_audio(self, scene_id: str) -> Optional[Path]:
         """씬의 오디오 파일 반환 (새 방식: 단일 파일 / 구 방식: 병합)"""
         paths = self._get_project_paths()
         audio_path = paths["audio"]
 
         # 1. 새 방식: 단일 파일 (s1.mp3) 확인
+        #    tts-split --wav로 만든 무손실 WAV가 있으면 우선 사용
+        #    (MP3를 다시 만들 때 이전 WAV는 삭제됨)
         single_file = audio_path / f"{scene_id}.mp3"
+        wav_file = audio_path / f"{scene_id}.wav"
+        if wav_file.exists():
+            return wav_file
         if single_file.exists():
             return single_file
 
@@ -4736,7 +8536,7 @@ class ComposerManager:
         if len(audio_files) == 1:
             return audio_files[0]
 
-        merged_file = audio_path / f"{scene_id}_merged.mp3"
+        merged_file = audio_path / f"{scene_id}_merged.wav" if has_optional("numpy") else audio_path / f"{scene_id}_merged.mp3"
 
         # 이미 병합된 파일이 있고 최신이면 재사용
         if merged_file.exists():
@@ -4744,6 +8544,16 @@ class ComposerManager:
             if all(f.stat().st_mtime < merged_time for f in audio_files):
                 return merged_file
 
+        # 샘플 단위 병합 (기존 timing.json과 맞도록 gap/무음 제거/정규화 없이 이어붙임)
+        if has_optional("numpy"):
+            assembler = AudioAssembler(self.ffmpeg_path)
+            assembled = assembler.assemble(audio_files, gap=0, trim=False, normalize=False)
+            if assembled is None:
+                print(f"  ❌ {scene_id}: 오디오 병합 실패")
+                return None
+            return assembler.write_wav(assembled[0], merged_file)
+
+        # numpy가 없으면 FFmpeg concat (MP3 프레임 경계 오차 있음)
         # concat 파일 생성
         concat_file = audio_path / f"{scene_id}_concat.txt"
         with open(concat_file, 'w', encoding='utf-8') as f:
@@ -4770,28 +8580,21 @@ class ComposerManager:
 
     def _find_manim_render(self, scene_id: str) -> Optional[Path]:
         """Manim 렌더링 결과 찾기"""
-        # media/videos/{scene_id}_manim 폴더에서 찾기
-        media_path = Path("media/videos") / f"{scene_id}_manim"
-
-        if media_path.exists():
-            # 품질별 폴더 확인 (높은 품질 우선)
-            for quality in ["1080p60", "1080p30", "720p30", "480p15"]:
-                quality_path = media_path / quality
-                if quality_path.exists():
-                    # Scene*.mov 또는 Scene*.mp4 찾기
-                    for ext in ["mov", "mp4"]:
-                        scene_files = list(quality_path.glob(f"Scene*.{ext}"))
-                        if scene_files:
-                            return scene_files[0]
-
-        # 8_renders 폴더에서도 찾기
+        # 8_renders/{scene_id}.mov|mp4 (render-all이 수집/캐시 복원한 결과)
         paths = self._get_project_paths()
         renders_path = paths.get("renders")
-        if renders_path and renders_path.exists():
+        if renders_path:
             for ext in ["mov", "mp4"]:
-                render_files = list(renders_path.glob(f"{scene_id}*.{ext}"))
-                if render_files:
-                    return render_files[0]
+                render_file = renders_path / f"{scene_id}.{ext}"
+                if render_file.exists():
+                    return render_file
+
+        # 아직 수집되지 않았으면 씬별 manifest에서 (높은 품질 우선)
+        project_id = self.state.get("project_id")
+        if project_id:
+            manifest = load_render_manifest(project_id, scene_id)
+            if manifest:
+                return Path(manifest["output"])
 
         return None
 
@@ -4810,7 +8613,8 @@ class ComposerManager:
 
         return None
 
-    def compose_scene(self, scene_id: str, with_subtitle: bool = True, end_padding: float = 1.0, force: bool = False) -> Optional[Path]:
+    def compose_scene(self, scene_id: str, with_subtitle: bool = True, end_padding: float = 1.0, force: bool = False,
+                      threads: Optional[int] = None) -> Optional[Path]:
         """단일 씬 합성 (배경 + Manim + 오디오 + 자막)
 
         Args:
@@ -4818,6 +8622,10 @@ class ComposerManager:
             with_subtitle: 자막 포함 여부
             end_padding: 씬 끝에 추가할 무음 패딩 (초). 마지막 프레임 유지됨.
             force: True면 기존 파일 무시하고 재합성
+            threads: FFmpeg -threads 값 (None이면 FFmpeg 기본값)
+
+        Raises:
+            FFmpegSystemError: FFmpeg 실행 불가/디스크 부족 등 환경 오류
         """
         paths = self._get_project_paths()
         if not paths:
@@ -4887,6 +8695,10 @@ class ComposerManager:
                 f"Outline=2,Shadow=1,MarginV=15,MarginL=20,MarginR=20'"
             )
 
+        # 공통 규격 (해상도/fps/픽셀 포맷/오디오) - merge-final의 concat -c copy 전제
+        width, height = get_mezzanine_size(self.state.get("settings.aspect_ratio", "16:9"))
+        fps = MEZZANINE_PROFILE["fps"]
+
         # FFmpeg 합성 명령 구성 (배경 + Manim + 오디오 + 자막 한 번에)
         # eof_action=repeat: Manim 영상 끝나면 마지막 프레임 유지
         # apad: 오디오 끝에 무음 패딩 추가 (씬 간 여유)
@@ -4896,9 +8708,9 @@ class ComposerManager:
             if with_subtitle and subtitle_file and subtitle_file.exists():
                 srt_path_fc = str(subtitle_file).replace("\\", "/").replace(":", "\\:")
                 filter_complex = (
-                    f"[0:v]scale=1920:1080:force_original_aspect_ratio=decrease,"
-                    f"pad=1920:1080:(ow-iw)/2:(oh-ih)/2[bg];"
-                    f"[1:v]scale=1920:1080:force_original_aspect_ratio=decrease,format=rgba[fg];"
+                    f"[0:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                    f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2[bg];"
+                    f"[1:v]scale={width}:{height}:force_original_aspect_ratio=decrease,format=rgba[fg];"
                     f"[bg][fg]overlay=(W-w)/2:(H-h)/2:eof_action=repeat[ov];"
                     f"[ov]subtitles='{srt_path_fc}':"
                     f"force_style='FontName=Malgun Gothic,FontSize=20,"
@@ -4908,46 +8720,55 @@ class ComposerManager:
                 )
             else:
                 filter_complex = (
-                    f"[0:v]scale=1920:1080:force_original_aspect_ratio=decrease,"
-                    f"pad=1920:1080:(ow-iw)/2:(oh-ih)/2[bg];"
-                    f"[1:v]scale=1920:1080:force_original_aspect_ratio=decrease,format=rgba[fg];"
+                    f"[0:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                    f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2[bg];"
+                    f"[1:v]scale={width}:{height}:force_original_aspect_ratio=decrease,format=rgba[fg];"
                     f"[bg][fg]overlay=(W-w)/2:(H-h)/2:eof_action=repeat[outv];"
                     f"[2:a]apad=pad_dur={end_padding}[outa]"
                 )
 
             cmd = [
                 self.ffmpeg_path,
-                "-loop", "1", "-i", str(bg_file),
+                "-framerate", str(fps), "-loop", "1", "-i", str(bg_file),
                 "-i", str(manim_file),
                 "-i", str(audio_file),
                 "-filter_complex", filter_complex,
                 "-map", "[outv]", "-map", "[outa]",
-                "-c:v", "libx264", "-preset", "fast", "-crf", "23",
-                "-c:a", "aac", "-b:a", "192k",
+                *get_mezzanine_output_args(),
                 "-t", str(total_duration),
                 "-y", str(output_file)
             ]
         else:
             # Manim만 사용 (배경 없음) + 자막
             # tpad: Manim 끝나면 마지막 프레임 유지
-            video_filter = f"scale=1920:1080,tpad=stop_mode=clone:stop_duration={total_duration}{subtitle_filter_part}"
+            video_filter = f"scale={width}:{height},tpad=stop_mode=clone:stop_duration={total_duration}{subtitle_filter_part}"
             cmd = [
                 self.ffmpeg_path,
                 "-i", str(manim_file),
                 "-i", str(audio_file),
                 "-vf", video_filter,
                 "-af", f"apad=pad_dur={end_padding}",
-                "-c:v", "libx264", "-preset", "fast", "-crf", "23",
-                "-c:a", "aac", "-b:a", "192k",
+                *get_mezzanine_output_args(),
                 "-t", str(total_duration),
                 "-y", str(output_file)
             ]
 
+        # 병렬 합성 시 전체 스레드 수가 CPU를 넘지 않도록 제한
+        if threads:
+            cmd[-2:-2] = ["-threads", str(threads)]
+
         # 합성 실행
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        except OSError as e:
+            raise FFmpegSystemError(f"FFmpeg 실행 실패: {e}")
 
         if result.returncode != 0:
-            print(f"  ❌ 합성 실패: {result.stderr[:200]}")
+            stderr = result.stderr or ""
+            for marker in COMPOSE_CONFIG["systemic_errors"]:
+                if marker in stderr:
+                    raise FFmpegSystemError(f"{marker} ({scene_id})")
+            print(f"  ❌ 합성 실패: {stderr[:200]}")
             return None
 
         if with_subtitle and subtitle_file and subtitle_file.exists():
@@ -4956,44 +8777,50 @@ class ComposerManager:
         print(f"  ✅ 합성 완료: {output_file.name}")
         return output_file
 
-    def compose_all(self, with_subtitle: bool = True) -> List[Path]:
-        """모든 씬 합성"""
+    def compose_all(self, with_subtitle: bool = True, jobs: int = 1, threads: int = 0) -> List[Path]:
+        """모든 씬 합성
+
+        Args:
+            with_subtitle: 자막 포함 여부
+            jobs: 동시 합성 수 (FFmpeg 프로세스 수, 0=CPU 코어 수)
+            threads: FFmpeg 1개당 -threads (0=자동: CPU 코어 수 / jobs)
+        """
         paths = self._get_project_paths()
         if not paths:
             print("❌ 활성 프로젝트가 없습니다.")
             return []
 
         # scenes.json에서 씬 목록 가져오기
-        scenes_file = paths["scenes"] / "scenes.json"
-        if not scenes_file.exists():
+        store = SceneStore(paths["base"])
+        if not store.exists():
             print("❌ scenes.json 파일이 없습니다.")
             return []
 
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            scenes = json.load(f)
+        scene_ids = store.ids()
 
-        scene_ids = [s["scene_id"] for s in scenes]
+        cpu_count = os.cpu_count() or 1
+        jobs = max(1, min(jobs if jobs > 0 else cpu_count, len(scene_ids)))
+        if jobs > 1 and threads <= 0:
+            threads = max(1, cpu_count // jobs)
 
         print(f"\n🎬 전체 씬 합성 시작 ({len(scene_ids)}개)")
+        if jobs > 1:
+            print(f"   병렬 합성: {jobs}개 동시 실행 (FFmpeg당 {threads} 스레드)")
         print("=" * 50)
 
-        composed = []
-        failed = []
-
-        for i, scene_id in enumerate(scene_ids, 1):
-            print(f"\n[{i}/{len(scene_ids)}] {scene_id}")
-
-            result = self.compose_scene(scene_id, with_subtitle=with_subtitle)
+        results = self._compose_scenes(scene_ids, with_subtitle, jobs, threads or None)
 
-            if result:
-                composed.append(result)
-            else:
-                failed.append(scene_id)
+        # 씬 순서대로 정리
+        composed = [results[s] for s in scene_ids if results.get(s)]
+        failed = [s for s in scene_ids if s in results and not results[s]]
+        not_started = [s for s in scene_ids if s not in results]
 
         print("\n" + "=" * 50)
         print(f"✅ 합성 완료: {len(composed)}개")
         if failed:
             print(f"❌ 실패: {len(failed)}개 ({', '.join(failed)})")
+        if not_started:
+            print(f"⏹️  중단으로 미실행: {len(not_started)}개 ({', '.join(not_started)})")
 
         # state.json 업데이트
         if composed:
@@ -5007,6 +8834,55 @@ class ComposerManager:
 
         return composed
 
+    def _compose_scenes(self, scene_ids: List[str], with_subtitle: bool, jobs: int,
+                        threads: Optional[int]) -> Dict[str, Optional[Path]]:
+        """씬 합성 실행 (jobs개 FFmpeg 동시 실행)
+
+        FFmpegSystemError가 나면 새 씬은 시작하지 않고 실행 중인 씬만 마무리합니다.
+        그 밖의 예외는 해당 씬만 실패(None)로 기록하고 계속 진행합니다.
+
+        Returns:
+            {scene_id: 결과 파일 또는 None} (시작하지 않은 씬은 제외)
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        results: Dict[str, Optional[Path]] = {}
+        queue = list(scene_ids)
+        total = len(scene_ids)
+        stop_reason = None
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            running = {}
+            while queue or running:
+                # 작업 수를 jobs개로 유지 (중단 시 새 작업 제출 안 함)
+                while queue and len(running) < jobs and stop_reason is None:
+                    scene_id = queue.pop(0)
+                    print(f"\n[{total - len(queue)}/{total}] {scene_id}")
+                    future = pool.submit(self.compose_scene, scene_id, with_subtitle=with_subtitle, threads=threads)
+                    running[future] = scene_id
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    scene_id = running.pop(future)
+                    try:
+                        results[scene_id] = future.result()
+                    except FFmpegSystemError as e:
+                        results[scene_id] = None
+                        if stop_reason is None:
+                            stop_reason = str(e)
+                            print(f"\n🛑 FFmpeg 환경 오류로 합성 중단: {e}")
+                            if running:
+                                print(f"   실행 중인 {len(running)}개 씬만 마무리합니다.")
+                    except Exception as e:
+                        # 씬 하나의 오류(JSON, 자막, 파일 등)로 전체 합성과 결과를 잃지 않음
+                        results[scene_id] = None
+                        print(f"  ❌ {scene_id} 합성 오류: {type(e).__name__}: {e}")
+
+        return results
+
     def transition_generate(self) -> bool:
         """섹션 전환 클립 생성 + concat_list.txt 생성"""
         paths = self._get_project_paths()
@@ -5042,12 +8918,9 @@ class ComposerManager:
         }
         colors = style_colors.get(style, style_colors["cyberpunk"])
 
-        # 해상도 설정
-        aspect = self.state.get("settings.aspect_ratio", "16:9")
-        if aspect == "16:9":
-            width, height = 1920, 1080
-        else:  # 9:16
-            width, height = 1080, 1920
+        # 해상도/fps/오디오: 씬 영상과 같은 공통 규격
+        width, height = get_mezzanine_size(self.state.get("settings.aspect_ratio", "16:9"))
+        fps = MEZZANINE_PROFILE["fps"]
 
         final_path = paths["final"]
         final_path.mkdir(parents=True, exist_ok=True)
@@ -5069,7 +8942,6 @@ class ComposerManager:
             escaped_text = text.replace("'", "\\'").replace(":", "\\:")
 
             # 비디오 필터: 텍스트 + 페이드인/아웃
-            # 25fps로 통일 (씬 파일들과 일치)
             vf_filter = (
                 f"drawtext=text='{escaped_text}':"
                 f"fontfile='{font_path}':"
@@ -5083,17 +8955,12 @@ class ComposerManager:
             cmd = [
                 self.ffmpeg_path,
                 "-f", "lavfi",
-                "-i", f"color=c={colors['bg']}:s={width}x{height}:d={duration}:r=25",
+                "-i", f"color=c={colors['bg']}:s={width}x{height}:d={duration}:r={fps}",
                 "-f", "lavfi",
-                "-i", f"anullsrc=r=44100:cl=stereo",
+                "-i", f"anullsrc=r={MEZZANINE_PROFILE['sample_rate']}:cl={MEZZANINE_PROFILE['channel_layout']}",
                 "-t", str(duration),
                 "-vf", vf_filter,
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-crf", "23",
-                "-c:a", "aac",
-                "-b:a", "128k",
-                "-pix_fmt", "yuv420p",
+                *get_mezzanine_output_args(),
                 "-y", str(output_file)
             ]
 
@@ -5114,16 +8981,13 @@ class ComposerManager:
     def _generate_concat_list(self, paths: Dict[str, Path], transition_scenes: List[str]) -> bool:
         """concat_list.txt 생성 (전환 클립 포함)"""
         final_path = paths["final"]
-        scenes_file = paths["scenes"] / "scenes.json"
+        store = SceneStore(paths["base"])
 
-        if not scenes_file.exists():
+        if not store.exists():
             print("❌ scenes.json이 없습니다.")
             return False
 
-        with open(scenes_file, 'r', encoding='utf-8') as f:
-            scenes = json.load(f)
-
-        scene_ids = [s["scene_id"] for s in scenes]
+        scene_ids = store.ids()
         transition_set = set(transition_scenes)
 
         concat_lines = []
@@ -5138,32 +9002,129 @@ class ComposerManager:
                     if transition_file.exists():
                         concat_lines.append(f"file 't_after_{scene_id}.mp4'")
 
-        # subscribe.mp4가 있으면 맨 끝에 추가
-        subscribe_file = Path(__file__).parent / "subscribe.mp4"
-        if subscribe_file.exists():
-            concat_lines.append(f"file '{subscribe_file.resolve()}'")
-            print("🔔 subscribe.mp4 추가됨 (영상 끝)")
+        # subscribe.mp4가 있으면 공통 규격으로 변환해 맨 끝에 추가
+        subscribe_file = Path(__file__).parent / "subscribe.mp4"
+        if subscribe_file.exists():
+            normalized = self._normalize_clip(subscribe_file, final_path)
+            if normalized:
+                concat_lines.append(f"file '{normalized.name}'")
+                print("🔔 subscribe.mp4 추가됨 (영상 끝)")
+            else:
+                print("⚠️ subscribe.mp4 변환 실패, 제외합니다.")
+
+        concat_file = final_path / "concat_list.txt"
+        with open(concat_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(concat_lines))
+
+        print(f"📝 concat_list.txt 생성: {len(concat_lines)}개 항목")
+        return True
+
+    def _normalize_clip(self, source: Path, dest_dir: Path) -> Optional[Path]:
+        """외부 클립을 공통 규격으로 변환 (원본이 바뀌지 않았으면 재사용)
+
+        Returns:
+            dest_dir/{원본명}_{width}x{height}.mp4 (실패 시 None)
+        """
+        width, height = get_mezzanine_size(self.state.get("settings.aspect_ratio", "16:9"))
+        dest = dest_dir / f"{source.stem}_{width}x{height}.mp4"
+
+        if dest.exists() and dest.stat().st_mtime >= source.stat().st_mtime:
+            return dest
+
+        # 오디오 트랙이 없는 클립은 무음 트랙을 붙여 규격 통일
+        extra_inputs = []
+        audio_map = ["-map", "0:a"]
+        if not self._has_audio(source):
+            extra_inputs = [
+                "-f", "lavfi",
+                "-i", f"anullsrc=r={MEZZANINE_PROFILE['sample_rate']}:cl={MEZZANINE_PROFILE['channel_layout']}"
+            ]
+            audio_map = ["-map", "1:a", "-shortest"]
+
+        cmd = [
+            self.ffmpeg_path,
+            "-i", str(source),
+            *extra_inputs,
+            "-vf",
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1",
+            "-map", "0:v",
+            *audio_map,
+            *get_mezzanine_output_args(),
+            "-y", str(dest)
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0 or not dest.exists():
+            return None
+        return dest
 
-        concat_file = final_path / "concat_list.txt"
-        with open(concat_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(concat_lines))
+    def _has_audio(self, file_path: Path) -> bool:
+        """오디오 스트림 존재 여부"""
+        return self.media_probe.has_audio(file_path)
 
-        print(f"📝 concat_list.txt 생성: {len(concat_lines)}개 항목")
+    def _probe_stream_profile(self, file_path: Path) -> Optional[tuple]:
+        """concat -c copy 호환성 비교용 스트림 규격 (코덱/해상도/fps/timebase/픽셀/오디오)"""
+        info = self.media_probe.probe(file_path)
+        if info is None:
+            return None
+        streams = info.get("streams", [])
+
+        keys = ["codec_type", "codec_name", "profile", "width", "height", "pix_fmt",
+                "r_frame_rate", "time_base", "sample_rate", "channels"]
+        return tuple(sorted(
+            tuple(str(st.get(k, "")) for k in keys) for st in streams
+            if st.get("codec_type") in ("video", "audio")
+        ))
+
+    def _clips_match_profile(self, video_files: List[str], work_dir: Path) -> bool:
+        """모든 클립의 스트림 규격이 같은지 확인 (다르면 concat -c copy 불가)"""
+        paths = [Path(vf) if Path(vf).is_absolute() else work_dir / vf for vf in video_files]
+        self.media_probe.probe_many(paths)
+
+        reference = None
+        for path in paths:
+            profile = self._probe_stream_profile(path)
+            if profile is None:
+                return False
+            if reference is None:
+                reference = profile
+            elif profile != reference:
+                print(f"  ⚠️ 규격이 다른 클립: {path.name} (이전 버전으로 합성된 파일)")
+                return False
         return True
 
-    def _merge_with_filter_complex(self, video_files: List[str], output_file: Path, work_dir: Path) -> subprocess.CompletedProcess:
-        """filter_complex를 사용하여 영상 병합 (전환 클립 포함 시)"""
+    def _merge_with_filter_complex(self, video_files: List[str], output_file: Path, work_dir: Path,
+                                   bgm_file: Optional[Path] = None) -> subprocess.CompletedProcess:
+        """filter_complex를 사용하여 영상 병합 (규격이 다른 클립이 섞여 있을 때)
+
+        Args:
+            bgm_file: 지정하면 같은 그래프에서 BGM 믹싱
+        """
         # 입력 파일 인자 구성 (work_dir 기준 상대경로)
         input_args = []
         for vf in video_files:
             input_args.extend(["-i", vf])
 
         # filter_complex 구성
+        # concat 필터는 입력끼리 해상도/SAR/샘플레이트/채널 구성이 같아야 하므로 입력마다 공통 규격으로 변환
+        width, height = get_mezzanine_size(self.state.get("settings.aspect_ratio", "16:9"))
+        p = MEZZANINE_PROFILE
         n = len(video_files)
         filter_parts = []
         for i in range(n):
-            filter_parts.append(f"[{i}:v][{i}:a]")
-        filter_str = "".join(filter_parts) + f"concat=n={n}:v=1:a=1[outv][outa]"
+            filter_parts.append(
+                f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={p['fps']},format={p['pix_fmt']}[v{i}];"
+                f"[{i}:a]aresample={p['sample_rate']},"
+                f"aformat=sample_fmts=fltp:channel_layouts={p['channel_layout']}[a{i}];"
+            )
+        filter_str = ("".join(filter_parts) + "".join(f"[v{i}][a{i}]" for i in range(n))
+                      + f"concat=n={n}:v=1:a=1[outv][outa]")
+
+        if bgm_file:
+            input_args.extend(["-stream_loop", "-1", "-i", str(bgm_file.resolve())])
+            filter_str = filter_str.replace("[outa]", "[narr]") + ";" + self._bgm_mix_filter("[narr]", f"[{n}:a]", "[outa]")
 
         # 출력 파일을 절대 경로로 변환
         output_abs = output_file.resolve() if hasattr(output_file, 'resolve') else Path(output_file).resolve()
@@ -5174,11 +9135,7 @@ class ComposerManager:
             "-filter_complex", filter_str,
             "-map", "[outv]",
             "-map", "[outa]",
-            "-c:v", "libx264",
-            "-preset", "fast",
-            "-crf", "23",
-            "-c:a", "aac",
-            "-b:a", "128k",
+            *get_mezzanine_output_args(),
             "-y", str(output_abs)
         ]
 
@@ -5222,92 +9179,96 @@ class ComposerManager:
 
         return result
 
-    def _add_bgm_to_video(self, video_path: Path, video_duration: float = 0) -> Optional[Path]:
-        """최종 영상에 BGM 추가 (랜덤 선택, 작은 볼륨)
+    def _find_bgm_dir(self) -> Path:
+        """BGM 폴더 (환경변수 BGM_DIR > settings.bgm_dir > 프로젝트 루트/BGM)"""
+        configured = BGM_CONFIG["dir"] or self.state.get("settings.bgm_dir")
+        return Path(configured) if configured else BGM_CONFIG["default_dir"]
 
-        Args:
-            video_path: 원본 영상 경로
-            video_duration: 영상 길이 (초), 0이면 자동 감지
+    def _select_bgm(self) -> Optional[Path]:
+        """프로젝트별로 고정된 BGM 선택
 
-        Returns:
-            BGM이 추가된 영상 경로, 실패 시 None
+        settings.bgm에 파일명이 있으면 그 파일, 없으면 project_id 해시로 선택
+        (같은 프로젝트는 다시 병합해도 같은 BGM)
         """
-        import random
+        import hashlib
 
-        # BGM 폴더 확인
-        bgm_dir = Path("C:/PROJECT/Math-Video-Maker/BGM")
+        bgm_dir = self._find_bgm_dir()
         if not bgm_dir.exists():
-            print("   ⚠️ BGM 폴더가 없습니다. BGM 없이 진행합니다.")
+            print(f"   ⚠️ BGM 폴더가 없습니다 ({bgm_dir}). BGM 없이 진행합니다.")
             return None
 
-        # BGM 파일 목록
-        bgm_files = list(bgm_dir.glob("*.mp3"))
+        bgm_files = sorted(
+            f for f in bgm_dir.iterdir()
+            if f.is_file() and f.suffix.lower() in BGM_CONFIG["extensions"]
+        )
         if not bgm_files:
             print("   ⚠️ BGM 파일이 없습니다. BGM 없이 진행합니다.")
             return None
 
-        # 랜덤 BGM 선택
-        bgm_file = random.choice(bgm_files)
-        print(f"\n🎵 BGM 추가 중...")
-        print(f"   선택된 BGM: {bgm_file.name}")
-
-        # 영상 길이 확인
-        if video_duration <= 0:
-            probe_cmd = [
-                self.ffprobe_path,
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "json",
-                str(video_path)
-            ]
-            probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-            if probe_result.returncode == 0:
-                info = json.loads(probe_result.stdout)
-                video_duration = float(info.get("format", {}).get("duration", 0))
-
-        if video_duration <= 0:
-            print("   ⚠️ 영상 길이를 확인할 수 없습니다.")
-            return None
-
-        # 출력 파일 경로
-        output_path = video_path.parent / f"{video_path.stem}_bgm.mp4"
+        pinned = self.state.get("settings.bgm")
+        if pinned:
+            for f in bgm_files:
+                if f.name == pinned:
+                    return f
+            print(f"   ⚠️ settings.bgm 파일이 없습니다: {pinned} (자동 선택)")
+
+        project_id = self.state.get("project_id") or ""
+        index = int(hashlib.sha256(project_id.encode('utf-8')).hexdigest(), 16) % len(bgm_files)
+        return bgm_files[index]
+
+    def _bgm_mix_filter(self, narration: str, bgm: str, output: str) -> str:
+        """나레이션 + BGM 믹싱 필터 (나레이션 길이 기준)"""
+        return (
+            f"{bgm}volume={BGM_CONFIG['volume']}[bgm];"
+            f"{narration}[bgm]amix=inputs=2:duration=first:dropout_transition=2{output}"
+        )
 
-        # FFmpeg로 BGM 믹싱
-        # -stream_loop -1: BGM 무한 루프
-        # volume=0.08: 원본의 8% 볼륨 (매우 작게)
-        # amix: 오디오 믹싱
-        cmd = [
-            self.ffmpeg_path,
-            "-y",
-            "-i", str(video_path),
-            "-stream_loop", "-1",
-            "-i", str(bgm_file),
-            "-filter_complex",
-            f"[1:a]volume=0.03[bgm];[0:a][bgm]amix=inputs=2:duration=first:dropout_transition=2[aout]",
-            "-map", "0:v",
-            "-map", "[aout]",
-            "-c:v", "copy",
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-t", str(video_duration),
-            str(output_path)
-        ]
+    def _merge_clips(self, video_files: List[str], concat_file: Path, output_file: Path,
+                     final_path: Path, bgm_file: Optional[Path]):
+        """클립 병합 FFmpeg 실행 (bgm_file이 있으면 같은 패스에서 믹싱)"""
+        # 씬/전환 클립은 공통 규격으로 인코딩되므로 concat demuxer로 재인코딩 없이 병합
+        # (규격이 다른 이전 클립이 섞여 있으면 filter_complex로 재인코딩)
+        if not self._clips_match_profile(video_files, final_path):
+            print("  병합 중 (filter_complex, 재인코딩)...")
+            print("  💡 이전 규격 씬 파일을 지우고 compose-all을 다시 실행하면 재인코딩 없이 병합됩니다.")
+            result = self._merge_with_filter_complex(video_files, output_file, final_path, bgm_file)
+        else:
+            concat_file_relative = concat_file.name
+            cmd = [
+                self.ffmpeg_path,
+                "-f", "concat",
+                "-safe", "0",
+                "-i", concat_file_relative
+            ]
+            if bgm_file:
+                # 비디오는 복사, 오디오만 BGM과 믹싱하여 1회 인코딩
+                # -stream_loop -1: BGM 무한 루프 (나레이션 길이에서 종료)
+                cmd += [
+                    "-stream_loop", "-1",
+                    "-i", str(bgm_file.resolve()),
+                    "-filter_complex", self._bgm_mix_filter("[0:a]", "[1:a]", "[aout]"),
+                    "-map", "0:v",
+                    "-map", "[aout]",
+                    "-c:v", "copy",
+                    "-c:a", MEZZANINE_PROFILE["audio_codec"],
+                    "-b:a", MEZZANINE_PROFILE["audio_bitrate"],
+                    "-ar", str(MEZZANINE_PROFILE["sample_rate"])
+                ]
+            else:
+                cmd += ["-c", "copy"]
+            cmd += ["-y", str(output_file)]
+            print("  병합 중...")
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(final_path))
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        return result
 
-        if result.returncode == 0 and output_path.exists():
-            # 원본 삭제하고 BGM 버전으로 교체
-            video_path.unlink()
-            output_path.rename(video_path)
-            print(f"   ✅ BGM 추가 완료 (볼륨: 3%)")
-            return video_path
-        else:
-            print(f"   ⚠️ BGM 추가 실패, 원본 유지")
-            if result.stderr:
-                error_lines = [l for l in result.stderr.split('\n') if 'error' in l.lower()]
-                if error_lines:
-                    print(f"      {error_lines[0][:100]}")
-            return None
+    @staticmethod
+    def _print_ffmpeg_error(result) -> None:
+        """FFmpeg 버전 정보가 아닌 실제 오류 줄만 출력"""
+        if result.stderr:
+            error_lines = [l for l in result.stderr.split('\n') if 'error' in l.lower() or 'Error' in l]
+            if error_lines:
+                print(f"     {error_lines[0][:200]}")
 
     def merge_final(self) -> Optional[Path]:
         """모든 씬을 하나의 최종 영상으로 병합"""
@@ -5330,16 +9291,14 @@ class ComposerManager:
         else:
             # 기존 방식: scenes.json에서 순서 가져오기
             scene_files = []
-            scenes_file = paths["scenes"] / "scenes.json"
-            if scenes_file.exists():
-                with open(scenes_file, 'r', encoding='utf-8') as f:
-                    scenes = json.load(f)
-                scene_ids = [s["scene_id"] for s in scenes]
+            store = SceneStore(paths["base"])
+            if store.exists():
+                scene_ids = store.ids()
             else:
                 # 파일명에서 추출
                 all_files = list(final_path.glob("*_final*.mp4"))
                 scene_ids = sorted(set(f.stem.split("_")[0] for f in all_files),
-                                 key=lambda x: int(x[1:]) if x[1:].isdigit() else 0)
+                                 key=SceneStore.natural_key)
 
             for scene_id in scene_ids:
                 scene_file = final_path / f"{scene_id}_final.mp4"
@@ -5368,51 +9327,29 @@ class ComposerManager:
             video_files = [line.strip().replace("file '", "").replace("'", "")
                           for line in f.readlines() if line.strip()]
 
-        has_transitions = any('t_after_' in f for f in video_files)
+        # BGM (병합과 같은 FFmpeg 그래프에서 믹싱 → 한 번에 출력)
+        bgm_file = self._select_bgm()
+        if bgm_file:
+            print(f"🎵 BGM: {bgm_file.name} (볼륨: {BGM_CONFIG['volume'] * 100:.0f}%)")
 
-        if has_transitions:
-            # filter_complex 방식 사용 (전환 클립 포함 시)
-            print("  병합 중 (filter_complex)...")
-            # 모든 파일을 한번에 처리 (FFmpeg는 많은 입력 처리 가능)
-            result = self._merge_with_filter_complex(video_files, output_file, final_path)
-        else:
-            # 전환 없으면 빠른 concat demuxer 사용
-            concat_file_relative = concat_file.name
-            cmd = [
-                self.ffmpeg_path,
-                "-f", "concat",
-                "-safe", "0",
-                "-i", concat_file_relative,
-                "-c", "copy",
-                "-y", str(output_file)
-            ]
-            print("  병합 중...")
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(final_path))
+        result = self._merge_clips(video_files, concat_file, output_file, final_path, bgm_file)
+        if bgm_file and (result.returncode != 0 or not output_file.exists()):
+            # BGM 파일 손상/코덱 문제로 전체 병합이 실패하지 않도록 BGM 없이 한 번 더
+            print(f"  ⚠️  BGM 믹싱 포함 병합 실패, BGM 없이 다시 병합합니다.")
+            self._print_ffmpeg_error(result)
+            result = self._merge_clips(video_files, concat_file, output_file, final_path, None)
 
         if result.returncode != 0 or not output_file.exists():
             print(f"  ❌ 병합 실패")
-            if result.stderr:
-                # FFmpeg 버전 정보가 아닌 실제 오류만 출력
-                error_lines = [l for l in result.stderr.split('\n') if 'error' in l.lower() or 'Error' in l]
-                if error_lines:
-                    print(f"     {error_lines[0][:200]}")
+            self._print_ffmpeg_error(result)
             return None
 
         # 파일 정보 출력
-        probe_cmd = [
-            self.ffprobe_path,
-            "-v", "error",
-            "-show_entries", "format=duration,size",
-            "-of", "json",
-            str(output_file)
-        ]
+        info = self.media_probe.probe(output_file)
 
-        probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-
-        if probe_result.returncode == 0:
-            info = json.loads(probe_result.stdout)
-            duration = float(info.get("format", {}).get("duration", 0))
-            size = int(info.get("format", {}).get("size", 0))
+        if info and info.get("duration") is not None:
+            duration = float(info["duration"])
+            size = int(info.get("size", 0))
 
             mins = int(duration // 60)
             secs = int(duration % 60)
@@ -5422,15 +9359,8 @@ class ComposerManager:
             print(f"   📁 파일: {output_file}")
             print(f"   ⏱️  길이: {mins}분 {secs}초")
             print(f"   💾 크기: {size_mb:.1f} MB")
-            video_duration = duration
         else:
             print(f"\n✅ 최종 영상 생성 완료: {output_file}")
-            video_duration = 0
-
-        # BGM 추가
-        bgm_result = self._add_bgm_to_video(output_file, video_duration)
-        if bgm_result:
-            output_file = bgm_result
 
         # state.json 업데이트
         self.state.set("current_phase", "completed")
@@ -5440,6 +9370,502 @@ class ComposerManager:
         return output_file
 
 
+# ============================================================================
+# 증분 빌드 (build 명령)
+# ============================================================================
+# 각 산출물(노드)이 자신의 입력을 선언하고, 입력 내용 해시가 바뀐 노드만 재생성
+#
+#   audio:{sid}       → 0_audio/{sid}.mp3 + {sid}_timing.json   (narration_tts, 음성)
+#   srt:{sid}         → 7_subtitles/{sid}.srt                   (timing.json, subtitle_display)
+#   render:{sid}      → 8_renders/{sid}.mov                     (Manim 코드, assets/, 품질)
+#   scene_final:{sid} → 10_scene_final/{sid}_final.mp4          (render, audio, srt, 배경)
+#   transitions       → t_after_*.mp4 + concat_list.txt         (transitions.json, 씬 순서)
+#   final_video       → final_video.mp4                         (scene_final 전체, transitions)
+#
+# 배경 이미지(9_backgrounds/{sid}_bg.*)는 외부에서 준비하는 소스 파일이라 입력으로만 사용
+# ============================================================================
+
+BUILD_CONFIG = {
+    "db_file": "build_db.json",  # 프로젝트 폴더 기준 빌드 기록
+    # 종류별 동시 실행 상한 (render는 CPU/메모리 기준 자동 계산)
+    "kind_limits": {
+        "audio": 4,  # OpenAI API 동시 요청
+        "scene_final": None,
+        "render": None
+    },
+    # 타깃 별칭 (timing.json은 audio 노드가 함께 생성)
+    "aliases": {
+        "timing": "audio",
+        "subtitle": "srt",
+        "compose": "scene_final",
+        "final": "final_video"
+    }
+}
+
+
+class BuildNode:
+    """빌드 그래프 노드 (산출물 + 입력 선언 + 생성 작업)"""
+
+    def __init__(
+        self,
+        node_id: str,
+        outputs: List[Path],
+        action,
+        file_inputs: Optional[List[Path]] = None,
+        values=None,
+        deps: Optional[List[str]] = None
+    ):
+        self.node_id = node_id
+        self.kind = node_id.split(":")[0]
+        self.outputs = outputs
+        self.action = action                    # () -> bool
+        self.file_inputs = file_inputs or []    # 없는 파일도 허용 (없음 자체가 입력 상태)
+        self.values = values or {}              # 파일이 아닌 입력 (dict 또는 dict를 반환하는 함수)
+        self.deps = deps or []                  # 먼저 처리해야 하는 노드 ID
+
+    def outputs_exist(self) -> bool:
+        return all(p.exists() for p in self.outputs)
+
+
+class BuildDB:
+    """빌드 기록 (output/{project_id}/build_db.json)
+
+    - nodes: 노드별 마지막 빌드 당시 입력 서명
+    - hashes: 파일 내용 해시 캐시 ((size, mtime_ns)가 같으면 재계산 안 함)
+    """
+
+    def __init__(self, db_file: Path):
+        import threading
+
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self.data = {"version": 1, "nodes": {}, "hashes": {}}
+
+        if db_file.exists():
+            try:
+                with open(db_file, 'r', encoding='utf-8') as f:
+                    loaded = json.load(f)
+                if loaded.get("version") == 1:
+                    self.data = loaded
+            except (json.JSONDecodeError, OSError):
+                print(f"⚠️  {db_file.name} 파싱 오류. 빌드 기록을 새로 만듭니다.")
+
+    def file_hash(self, path: Path) -> str:
+        """파일 내용 해시 (없으면 '<missing>')"""
+        import hashlib
+
+        try:
+            st = path.stat()
+        except OSError:
+            return "<missing>"
+
+        key = str(path)
+        with self._lock:
+            cached = self.data["hashes"].get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+
+        with self._lock:
+            self.data["hashes"][key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def signature(self, node: BuildNode) -> str:
+        """노드 입력 서명 (입력 파일 내용 + 값)"""
+        import hashlib
+
+        h = hashlib.sha256()
+        for path in sorted(node.file_inputs, key=str):
+            h.update(f"f\0{path}\0{self.file_hash(path)}\n".encode('utf-8'))
+
+        values = node.values() if callable(node.values) else node.values
+        h.update(json.dumps(values, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8'))
+        return h.hexdigest()
+
+    def get(self, node_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.data["nodes"].get(node_id)
+
+    def record(self, node_id: str, signature: str, adopted: bool = False):
+        with self._lock:
+            self.data["nodes"][node_id] = {
+                "signature": signature,
+                "built_at": datetime.now().isoformat(),
+                "adopted": adopted
+            }
+
+    def save(self):
+        with self._lock:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.db_file.with_suffix(".json.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.db_file)
+
+
+class PipelineBuilder:
+    """make 스타일 증분 빌드
+
+    - 출력이 있고 입력 서명이 기록과 같으면 스킵
+    - 기록이 없는 기존 출력은 다시 만들지 않고 현재 입력으로 기록 (기존 프로젝트 채택)
+    - 재생성한 출력의 내용이 같으면 하위 노드는 스킵 (내용 해시 비교)
+    - 의존성이 끝난 노드끼리는 병렬 실행
+    """
+
+    def __init__(self, state: StateManager, quality: str = "l", with_subtitle: bool = True, end_padding: float = 1.0):
+        self.state = state
+        self.quality = quality
+        self.with_subtitle = with_subtitle
+        self.end_padding = end_padding
+
+        self.project_id = state.get("project_id")
+        self.project_dir = OUTPUT_DIR / (self.project_id or "unknown")
+        self.db = BuildDB(self.project_dir / BUILD_CONFIG["db_file"])
+        self.scene_store = SceneStore(self.project_dir)
+
+        self.tts = TTSGenerator(state)
+        self.renderer = RenderManager(state)
+        self.composer = ComposerManager(state)
+
+        self.nodes: Dict[str, BuildNode] = {}
+
+    def _load_scenes(self) -> List[Dict[str, Any]]:
+        return self.scene_store.scenes()
+
+    def _load_scene_data(self, scene_id: str, fallback: Dict[str, Any]) -> Dict[str, Any]:
+        """개별 씬 파일 우선, 없으면 scenes.json 항목"""
+        return self.scene_store.get(scene_id) or fallback
+
+    def build_graph(self) -> bool:
+        """scenes.json 기준으로 빌드 그래프 구성"""
+        if not self.project_id:
+            print("❌ 활성 프로젝트가 없습니다.")
+            return False
+
+        scenes = self._load_scenes()
+        if not scenes:
+            print(f"❌ 씬 파일이 없습니다: {self.project_dir / '2_scenes' / 'scenes.json'}")
+            return False
+
+        d = self.project_dir
+        audio_dir = d / "0_audio"
+        subtitle_dir = d / "7_subtitles"
+        renders_dir = d / "8_renders"
+        bg_dir = d / "9_backgrounds"
+        final_dir = d / "10_scene_final"
+        code_dir = d / "4_manim_code"
+        voice = self.tts._extract_voice_name(self.state.get("settings.voice", "alloy"))
+
+        scene_ids = []
+        for i, scene in enumerate(scenes, 1):
+            sid = scene.get("scene_id", f"s{i}")
+            scene_ids.append(sid)
+            scene_data = self._load_scene_data(sid, scene)
+
+            audio_file = audio_dir / f"{sid}.mp3"
+            timing_file = audio_dir / f"{sid}_timing.json"
+            srt_file = subtitle_dir / f"{sid}.srt"
+            code_file = code_dir / f"{sid}_manim.py"
+            final_file = final_dir / f"{sid}_final.mp4"
+
+            # 이전 방식(.mp4)으로 수집된 렌더링도 인정
+            render_file = renders_dir / f"{sid}.mov"
+            if not render_file.exists() and (renders_dir / f"{sid}.mp4").exists():
+                render_file = renders_dir / f"{sid}.mp4"
+
+            # audio (+ timing.json): narration_tts 텍스트와 음성 설정
+            narration_tts = self.tts._get_narration_tts(d, sid, scene_data)
+            self.nodes[f"audio:{sid}"] = BuildNode(
+                f"audio:{sid}",
+                outputs=[audio_file, timing_file],
+                action=lambda sid=sid, text=narration_tts: bool(text) and self.tts.generate(sid, text) is not None,
+                values={"narration_tts": narration_tts, "voice": voice, "model": TTS_CONFIG["model"]}
+            )
+
+            # srt: timing.json + subtitle_display
+            subtitle_display = self.composer._get_subtitle_display(d, sid, scene_data)
+            self.nodes[f"srt:{sid}"] = BuildNode(
+                f"srt:{sid}",
+                outputs=[srt_file],
+                action=lambda sid=sid: self.composer.generate_subtitle_for_scene(sid),
+                file_inputs=[timing_file],
+                values={"subtitle_display": subtitle_display},
+                deps=[f"audio:{sid}"]
+            )
+
+            # render: Manim 코드 + 참조 에셋 + 품질 + Manim 버전
+            asset_files = []
+            if code_file.exists():
+                code = code_file.read_text(encoding='utf-8', errors='ignore')
+                asset_files = [PROJECT_ROOT / a for a in self.renderer.cache.find_assets(code)]
+            self.nodes[f"render:{sid}"] = BuildNode(
+                f"render:{sid}",
+                outputs=[render_file],
+                action=lambda sid=sid: self.renderer.render_scene_cached(sid, self.quality) is not None,
+                file_inputs=[code_file] + asset_files,
+                values={"quality": self.quality, "manim": RenderCache.get_manim_version()}
+            )
+
+            # scene_final: render + audio(tts-split --wav의 WAV 포함) + srt + 배경 (배경은 소스 파일)
+            bg_files = [bg_dir / f"{sid}_bg.{ext}" for ext in ["png", "jpg", "jpeg", "webp"]]
+            self.nodes[f"scene_final:{sid}"] = BuildNode(
+                f"scene_final:{sid}",
+                outputs=[final_file],
+                action=lambda sid=sid: self._compose_action(sid),
+                file_inputs=[render_file, audio_file, audio_dir / f"{sid}.wav"]
+                            + ([srt_file] if self.with_subtitle else []) + bg_files,
+                values={"with_subtitle": self.with_subtitle, "end_padding": self.end_padding},
+                deps=[f"render:{sid}", f"audio:{sid}"] + ([f"srt:{sid}"] if self.with_subtitle else [])
+            )
+
+        # transitions: 전환 클립 + concat_list.txt (씬 영상 내용과는 무관, 존재 여부/순서만)
+        transitions_file = d / "2_scenes" / "transitions.json"
+        transition_outputs = [final_dir / "concat_list.txt"]
+        if transitions_file.exists():
+            try:
+                with open(transitions_file, 'r', encoding='utf-8') as f:
+                    for t in json.load(f) or []:
+                        transition_outputs.append(final_dir / f"t_after_{t['after_scene']}.mp4")
+            except (json.JSONDecodeError, OSError, KeyError, TypeError):
+                pass
+        subscribe_file = PROJECT_ROOT / "subscribe.mp4"
+        self.nodes["transitions"] = BuildNode(
+            "transitions",
+            outputs=transition_outputs,
+            action=self.composer.transition_generate,
+            file_inputs=[transitions_file],
+            values=lambda: {
+                "scenes": [s for s in scene_ids if (final_dir / f"{s}_final.mp4").exists()],
+                "style": self.state.get("settings.style", "cyberpunk"),
+                "aspect_ratio": self.state.get("settings.aspect_ratio", "16:9"),
+                "subscribe": subscribe_file.exists()
+            },
+            deps=[f"scene_final:{s}" for s in scene_ids]
+        )
+
+        # final_video: 모든 scene_final + 전환 클립 + concat_list.txt
+        self.nodes["final_video"] = BuildNode(
+            "final_video",
+            outputs=[d / "final_video.mp4"],
+            action=lambda: self.composer.merge_final() is not None,
+            file_inputs=[final_dir / f"{s}_final.mp4" for s in scene_ids] + transition_outputs + [subscribe_file],
+            deps=["transitions"] + [f"scene_final:{s}" for s in scene_ids]
+        )
+
+        return True
+
+    def _compose_action(self, scene_id: str) -> bool:
+        """scene_final 노드 액션: 환경 오류(FFmpegSystemError)도 해당 노드 실패로 처리"""
+        try:
+            return self.composer.compose_scene(
+                scene_id, with_subtitle=self.with_subtitle, end_padding=self.end_padding, force=True) is not None
+        except FFmpegSystemError as e:
+            print(f"  ❌ 합성 실패: {e}")
+            return False
+
+    def select(self, targets: List[str]) -> List[str]:
+        """타깃과 그 의존성 노드 ID (위상 정렬 순서)
+
+        타깃 형식: final_video / render (종류 전체) / render:s3 (단일 노드)
+        """
+        roots = []
+        for target in targets:
+            kind, _, scene_id = target.partition(":")
+            kind = BUILD_CONFIG["aliases"].get(kind, kind)
+            node_id = f"{kind}:{scene_id}" if scene_id else kind
+            if node_id in self.nodes:
+                roots.append(node_id)
+            else:
+                matched = [n for n, node in self.nodes.items() if node.kind == kind]
+                if not matched:
+                    print(f"⚠️  알 수 없는 타깃: {target}")
+                roots.extend(matched)
+
+        order = []
+        visited = set()
+
+        def visit(node_id: str):
+            if node_id in visited:
+                return
+            visited.add(node_id)
+            for dep in self.nodes[node_id].deps:
+                visit(dep)
+            order.append(node_id)
+
+        for root in roots:
+            visit(root)
+        return order
+
+    def _check(self, node: BuildNode) -> tuple:
+        """노드 상태 판정 → (상태, 서명)
+
+        상태: fresh (최신) / adopt (기록 없는 기존 출력) / missing (출력 없음) / changed (입력 변경)
+        """
+        signature = self.db.signature(node)
+        record = self.db.get(node.node_id)
+        if not node.outputs_exist():
+            return "missing", signature
+        if record is None:
+            return "adopt", signature
+        if record.get("signature") != signature:
+            return "changed", signature
+        return "fresh", signature
+
+    def _process(self, node: BuildNode, limits: Dict[str, Any]) -> str:
+        """노드 하나 처리 → built / fresh / adopted / failed"""
+        status, signature = self._check(node)
+
+        if status == "fresh":
+            return "fresh"
+        if status == "adopt":
+            self.db.record(node.node_id, signature, adopted=True)
+            self.db.save()
+            return "adopted"
+
+        limiter = limits.get(node.kind)
+        if limiter:
+            limiter.acquire()
+        try:
+            success = bool(node.action())
+        except Exception as e:
+            print(f"   ❌ {node.node_id}: {e}")
+            success = False
+        finally:
+            if limiter:
+                limiter.release()
+
+        if not success or not node.outputs_exist():
+            return "failed"
+
+        self.db.record(node.node_id, signature)
+        self.db.save()
+        return "built"
+
+    def dry_run(self, order: List[str]) -> Dict[str, str]:
+        """실행 없이 재생성 대상 표시 (입력으로 쓰는 상위 노드가 바뀌면 하위도 대상으로 간주)"""
+        reasons = {
+            "missing": "출력 없음",
+            "changed": "입력 변경",
+            "upstream": "상위 노드 재생성"
+        }
+        plan = {}
+        for node_id in order:
+            node = self.nodes[node_id]
+            status, _ = self._check(node)
+            inputs = set(node.file_inputs)
+            if status == "fresh" and any(
+                    plan.get(dep) in reasons and inputs.intersection(self.nodes[dep].outputs)
+                    for dep in node.deps):
+                status = "upstream"
+            plan[node_id] = status
+
+        print(f"\n🔍 빌드 계획 (dry-run)")
+        print("=" * 60)
+        for node_id, status in plan.items():
+            if status in reasons:
+                print(f"   🔨 {node_id}  ({reasons[status]})")
+            elif status == "adopt":
+                print(f"   📥 {node_id}  (기존 출력 채택)")
+        fresh = sum(1 for s in plan.values() if s == "fresh")
+        rebuild = sum(1 for s in plan.values() if s in reasons)
+        print("=" * 60)
+        print(f"   재생성: {rebuild}개 / 최신: {fresh}개 / 전체: {len(plan)}개")
+        return plan
+
+    def run(self, targets: Optional[List[str]] = None, jobs: int = 0, dry_run: bool = False) -> Dict[str, str]:
+        """빌드 실행
+
+        Args:
+            targets: 빌드 타깃 (기본: final_video)
+            jobs: 동시 실행 노드 수 (0=CPU 코어 수)
+            dry_run: True면 재생성 대상만 표시
+        """
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        if not self.build_graph():
+            return {}
+
+        order = self.select(targets or ["final_video"])
+        if not order:
+            return {}
+
+        if dry_run:
+            return self.dry_run(order)
+
+        jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+
+        # 종류별 동시 실행 상한
+        limits = {}
+        for kind, limit in BUILD_CONFIG["kind_limits"].items():
+            if kind == "render" and limit is None:
+                limit = self.renderer._resolve_render_jobs(0, self.quality)
+            if limit:
+                limits[kind] = threading.BoundedSemaphore(limit)
+
+        print(f"\n🏗️  증분 빌드: {self.project_id}")
+        print(f"   대상 노드: {len(order)}개, 동시 실행: {jobs}")
+        print("=" * 60)
+
+        results: Dict[str, str] = {}
+        pending = list(order)
+        running = {}
+        started = time.time()
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            while pending or running:
+                # 의존성이 모두 끝난 노드 제출
+                for node_id in list(pending):
+                    deps = self.nodes[node_id].deps
+                    if any(results.get(dep) in ("failed", "blocked") for dep in deps):
+                        results[node_id] = "blocked"
+                        pending.remove(node_id)
+                        print(f"   ⛔ {node_id} (상위 노드 실패)")
+                    elif all(dep in results for dep in deps):
+                        pending.remove(node_id)
+                        running[pool.submit(self._process, self.nodes[node_id], limits)] = node_id
+
+                if not running:
+                    continue
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_id = running.pop(future)
+                    try:
+                        results[node_id] = future.result()
+                    except Exception as e:
+                        print(f"   ❌ {node_id}: {e}")
+                        results[node_id] = "failed"
+
+                    status = results[node_id]
+                    if status == "built":
+                        print(f"   🔨 {node_id} 재생성 완료")
+                    elif status == "adopted":
+                        print(f"   📥 {node_id} 기존 출력 채택")
+                    elif status == "failed":
+                        print(f"   ❌ {node_id} 실패")
+
+        counts = {}
+        for status in results.values():
+            counts[status] = counts.get(status, 0) + 1
+
+        print("\n" + "=" * 60)
+        print(f"✅ 빌드 완료 ({time.time() - started:.1f}초)")
+        print(f"   재생성: {counts.get('built', 0)}개 / 최신: {counts.get('fresh', 0)}개 / "
+              f"채택: {counts.get('adopted', 0)}개")
+        if counts.get("failed") or counts.get("blocked"):
+            failed = [n for n, s in results.items() if s == "failed"]
+            print(f"❌ 실패: {', '.join(failed)} (중단된 하위 노드 {counts.get('blocked', 0)}개)")
+
+        return results
+
+
 # ============================================================================
 # 유틸리티 함수
 # ============================================================================
@@ -5915,6 +10341,9 @@ def print_help():
 
   list          모든 프로젝트 목록 조회
                 output/ 폴더 내 프로젝트 목록과 크기 표시
+                (cache/projects.db 인덱스 사용, 바뀐 폴더만 다시 계산)
+
+  reindex       프로젝트 인덱스를 디스크에서 전체 재생성
 
   delete        프로젝트 삭제
                 <project_id>       삭제할 프로젝트 ID (필수)
@@ -5936,19 +10365,35 @@ def print_help():
 
   tts-all       모든 씬 TTS 생성 (기존 방식 - 씬별)
                 (텍스트 소스: 2_narration/ 우선, 없으면 scenes.json)
+                --start-from 14    s14부터 시작 (한도 초과 후 재개)
+                --jobs 4           최대 동시 TTS 요청 수 (429 시 자동 감소)
+                --whisper local    로컬 faster-whisper로 타임스탬프 추출
 
   ─── 섹션별 TTS 파이프라인 (권장 - 톤 일관성 보장) ───
   tts-sections  섹션별 TTS 생성 (Step 4a)
                 reading_script.json → hook.mp3, analysis.mp3, core.mp3, ...
+                --jobs N      동시에 생성할 섹션 수 (기본: 4)
 
   tts-timestamps Whisper 타임스탬프 추출 (Step 4b)
                 섹션별 MP3 → hook_timestamps.json, ...
+                --whisper local  로컬 faster-whisper 사용 (네트워크 불필요)
+                ※ 같은 오디오의 전사 결과는 cache/transcripts/에서 재사용
 
   tts-pipeline  섹션별 TTS + 타임스탬프 한번에 실행 (Step 4a+4b)
+                섹션별로 TTS가 끝나는 즉시 Whisper 분석 (섹션 단위 병렬)
+                --jobs N      동시에 처리할 섹션 수 (기본: 4)
+                --whisper local  로컬 faster-whisper 사용
+
+  tts-split-suggest  씬 분할 지점 자동 계산 (Step 4c)
+                섹션 MP3 무음 구간 + Whisper 정렬 → split_points_{section}.json
+                --force       기존 split_points 파일 덮어쓰기
+                --bench       파일을 쓰지 않고 기존 split_points와 오차 비교
 
   tts-split     씬별 오디오 분할 (Step 4d)
                 split_points_*.json → s1.mp3, s2.mp3, ...
-                ⚠️ audio-splitter 에이전트 실행 후 호출
+                섹션당 FFmpeg 1회 (한 번 디코딩으로 모든 씬 출력)
+                --wav         합성용 무손실 WAV(s1.wav, ...)도 함께 출력
+                ⚠️ tts-split-suggest 또는 audio-splitter 에이전트 실행 후 호출
 
   narration-extract  씬에서 narration_display 추출 (Narration Designer용)
                      --scenes s1,s2,s3  추출할 씬 ID (쉼표 구분, 생략시 전체)
@@ -5972,19 +10417,30 @@ def print_help():
 
   render-all    모든 씬 렌더링
                 --quality l        품질 (l/m/h/k)
+                --jobs 4           동시 렌더링 수 (0=자동, CPU/메모리 기준 제한)
+                                   씬별 로그: logs/{scene_id}_render.log
+                                   코드/에셋이 바뀐 씬만 렌더링, 나머지는
+                                   cache/renders/에서 복원
 
   render-failed 실패한 씬만 재렌더링
                 --quality l        품질 (l/m/h/k)
-                8_renders/에 없는 씬만 렌더링
+                --jobs 4           동시 렌더링 수
+                렌더링 캐시(8_renders/render_index.json) 기준 최신이 아닌 씬만 렌더링
+                (실패/코드 변경 씬, 인덱스 없는 이전 프로젝트는 기존 8_renders/ 파일을 등록)
 
   render-collect 렌더링 결과물 수집
-                media/videos/에서 8_renders/로 파일 복사
+                media/{project_id}/{scene_id}/{quality}/의 manifest 기준으로
+                8_renders/로 파일 복사
                 state.json에 files.renders 업데이트
 
   render-script 렌더링 스크립트 생성
 
   subtitle-generate  모든 씬 SRT 자막 생성
                      → 7_subtitles/ 폴더에 s1.srt, s2.srt, ... 생성
+                     → 문장 타이밍: Whisper 단어 타임스탬프에 문자 단위 정렬
+
+  subtitle-bench     자막 싱크 오차 비교 (균등 분배 vs 단어 정렬)
+                     --project ID       대상 프로젝트 (반복 가능, 기본: output/ 전체)
 
   compose       단일 씬 합성 (배경+Manim+오디오+자막)
                 --scene s1         씬 ID (필수)
@@ -5992,15 +10448,41 @@ def print_help():
 
   compose-all   모든 씬 합성
                 --no-subtitle      자막 없이 합성
+                --jobs 4           동시 합성 수 (0=CPU 코어 수)
+                --threads 4        FFmpeg 1개당 스레드 (기본: CPU 코어 수 / jobs)
+                FFmpeg 환경 오류(디스크 부족 등) 시 새 작업 중단
 
   merge-final   모든 씬을 최종 영상으로 병합
                 → final_video.mp4 생성
+                BGM: BGM_DIR 환경변수 또는 BGM/ 폴더 (프로젝트별 고정 선택,
+                     settings.bgm에 파일명 지정 가능)
+
+  build         증분 빌드 (입력이 바뀐 산출물만 재생성, 병렬 실행)
+                audio → srt → render → scene_final → transitions → final_video
+                --target final_video   타깃 (종류: audio/srt/render/scene_final/
+                                       transitions/final_video, 단일: render:s3)
+                --jobs 4           동시 실행 노드 수 (기본 0=CPU 코어 수)
+                --quality l        렌더링 품질 (l/m/h/k)
+                --no-subtitle      자막 없이 합성
+                --dry-run          재생성 대상만 표시
+                빌드 기록: output/{project_id}/build_db.json
 
   convert       텍스트를 TTS용으로 변환
                 --text "9×9=81"    변환할 텍스트
 
   files         프로젝트 파일 목록
 
+  serve         상주 서버 실행 (로컬 HTTP API, 명령마다 프로세스 시작 비용 없음)
+                --port 8765        포트 (기본 8765, 127.0.0.1 전용)
+                GET /health, GET /state, POST /run {"argv": ["status"]}
+                --print-token      시작 시 토큰 출력 (video_maker_ui.html 연결용)
+                (/state, /run은 cache/serve.json의 token을 X-Pipeline-Token 헤더로)
+
+  client        실행 중인 서버에 명령 전달 (서버가 없으면 직접 실행)
+                예: client status / client tts-scene s3
+                python -m math_video_pipeline client ... 로 실행하면 바이트코드 캐시를
+                사용해 시작이 더 빠름 (스크립트 직접 실행은 매번 소스 컴파일)
+
   help          이 도움말 표시
 
 🎤 TTS 음성 옵션 (gpt-4o-mini-tts):
@@ -6083,12 +10565,278 @@ def print_help():
     print(help_text)
 
 
+# ============================================================================
+# 파이프라인 서버 (serve / client)
+# ============================================================================
+
+class PipelineServer:
+    """기존 CLI 명령을 하나의 상주 프로세스에서 실행하는 로컬 HTTP 서버
+
+    명령마다 새 파이썬 프로세스를 띄우면 import, state.json 파싱, API 클라이언트 초기화를
+    매번 반복합니다. serve 모드는 이것들을 한 번만 하고 요청을 같은 프로세스에서 처리합니다.
+
+    API (127.0.0.1 전용, JSON):
+        GET  /health          → {"ok": true, "pid": ...}
+        GET  /state           → state.json 내용 (저널 반영)
+        POST /run             {"argv": ["status"]} → {"exit_code", "output", "elapsed"}
+
+    보안 (웹 페이지가 로컬 서버로 delete/tts-all 등을 보내는 것 차단):
+        - /state, /run은 X-Pipeline-Token 헤더 필수 (cache/serve.json, 0600에 저장된 임의 토큰)
+        - Host는 127.0.0.1:<port>만, POST는 Content-Type: application/json만 허용
+        - Origin 헤더가 있으면 null(file://로 연 video_maker_ui.html)만 허용
+        - UI용 토큰은 serve --print-token으로 시작 시 출력 (video_maker_ui.html에 붙여넣기)
+
+    명령은 stdout/상태를 공유하므로 한 번에 하나씩 순서대로 실행합니다.
+    """
+
+    BLOCKED_COMMANDS = {"serve", "client"}
+    TOKEN_HEADER = "X-Pipeline-Token"
+    ALLOWED_ORIGINS = {"null"}
+
+    def __init__(self, host: str = None, port: int = None, print_token: bool = False):
+        import secrets
+        import threading
+
+        self.host = host if host is not None else SERVE_CONFIG["host"]
+        self.port = port if port is not None else SERVE_CONFIG["port"]
+        self.token = secrets.token_urlsafe(32)
+        self.print_token = print_token
+        self.state = StateManager()
+        self.parser = build_parser()
+        self._run_lock = threading.Lock()
+
+    def execute(self, argv: List[str]) -> Dict[str, Any]:
+        """CLI 인자 목록 하나를 실행하고 출력을 모아 반환"""
+        import time
+        import traceback
+        from contextlib import redirect_stdout, redirect_stderr
+
+        buffer = io.StringIO()
+        exit_code = 0
+        start = time.perf_counter()
+
+        with self._run_lock, redirect_stdout(buffer), redirect_stderr(buffer):
+            try:
+                args = self.parser.parse_args(argv)
+                if args.command in self.BLOCKED_COMMANDS:
+                    print(f"❌ 서버에서 실행할 수 없는 명령어: {args.command}")
+                    exit_code = 2
+                elif not args.command:
+                    print_help()
+                else:
+                    # 다른 프로세스(에이전트, 렌더 워커)가 바꾼 state.json 반영
+                    self.state.reload()
+                    try:
+                        run_command(args, self.state)
+                    finally:
+                        # 상주 프로세스는 atexit이 돌지 않으므로 명령마다 저널 합치기 + 미디어 캐시 저장
+                        self.state.compact()
+                        if _media_probe is not None:
+                            _media_probe.flush()
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+
+        return {
+            "exit_code": exit_code,
+            "output": buffer.getvalue(),
+            "elapsed": round(time.perf_counter() - start, 3)
+        }
+
+    def _make_handler(self):
+        from http.server import BaseHTTPRequestHandler
+
+        server = self
+
+        import hmac
+
+        class Handler(BaseHTTPRequestHandler):
+            def _cors_headers(self) -> None:
+                # video_maker_ui.html (file://, Origin: null)에서만 호출 가능
+                origin = self.headers.get("Origin")
+                if origin in server.ALLOWED_ORIGINS:
+                    self.send_header("Access-Control-Allow-Origin", origin)
+                    self.send_header("Vary", "Origin")
+
+            def _send_json(self, status: int, payload: Any) -> None:
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self._cors_headers()
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _reject(self, require_token: bool = True) -> Optional[str]:
+                """요청 검증 (통과하면 None, 아니면 거부 사유)"""
+                if self.headers.get("Host") != f"{server.host}:{server.port}":
+                    return "허용되지 않은 Host"
+                origin = self.headers.get("Origin")
+                if origin is not None and origin not in server.ALLOWED_ORIGINS:
+                    return "허용되지 않은 Origin"
+                if require_token:
+                    token = self.headers.get(server.TOKEN_HEADER, "")
+                    if not hmac.compare_digest(token.encode('utf-8'), server.token.encode('utf-8')):
+                        return "토큰이 없거나 일치하지 않습니다"
+                return None
+
+            def do_OPTIONS(self):
+                if self._reject(require_token=False):
+                    self._send_json(403, {"error": "forbidden"})
+                    return
+                self.send_response(204)
+                self._cors_headers()
+                self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+                self.send_header("Access-Control-Allow-Headers", f"Content-Type, {server.TOKEN_HEADER}")
+                self.end_headers()
+
+            def do_GET(self):
+                reason = self._reject(require_token=self.path != "/health")
+                if reason:
+                    self._send_json(403, {"error": reason})
+                elif self.path == "/health":
+                    self._send_json(200, {"ok": True, "pid": os.getpid()})
+                elif self.path == "/state":
+                    with server._run_lock:
+                        self._send_json(200, server.state.reload())
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                if self.path != "/run":
+                    self._send_json(404, {"error": "not found"})
+                    return
+                reason = self._reject()
+                if reason:
+                    self._send_json(403, {"error": reason})
+                    return
+                content_type = self.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+                if content_type != "application/json":
+                    self._send_json(415, {"error": "Content-Type: application/json만 허용"})
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    payload = json.loads(self.rfile.read(length).decode('utf-8') or "{}")
+                    argv = payload.get("argv")
+                    if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+                        raise ValueError("argv는 문자열 목록이어야 합니다")
+                except (ValueError, UnicodeDecodeError) as e:
+                    self._send_json(400, {"error": str(e)})
+                    return
+                self._send_json(200, server.execute(argv))
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 콘솔 출력하지 않음
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        """서버 실행 (Ctrl+C로 종료)"""
+        from http.server import ThreadingHTTPServer
+
+        httpd = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self.port = httpd.server_address[1]  # --port 0이면 실제 할당된 포트 (Host 검증에 사용)
+
+        # 토큰이 들어 있으므로 소유자만 읽을 수 있게 (0600)
+        info_file = SERVE_CONFIG["info_file"]
+        info_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            info_file.unlink()
+        except OSError:
+            pass
+        fd = os.open(info_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"host": self.host, "port": self.port, "pid": os.getpid(), "token": self.token,
+                       "started_at": datetime.now().isoformat()}, f)
+
+        print(f"🚀 파이프라인 서버 실행: http://{self.host}:{httpd.server_address[1]}")
+        print("   명령 실행: python math_video_pipeline.py client <명령어> [옵션]")
+        if self.print_token:
+            print(f"   UI 토큰: {self.token}")
+            print(f"   video_maker_ui.html을 파일로 열고 포트({self.port})/토큰을 입력하세요")
+        else:
+            print(f"   UI 토큰: serve --print-token 또는 {info_file}의 token")
+        print("   종료: Ctrl+C")
+
+        # SIGTERM도 Ctrl+C처럼 정리 후 종료 (serve.json 삭제)
+        import signal
+
+        def _terminate(signum, frame):
+            raise KeyboardInterrupt
+
+        try:
+            signal.signal(signal.SIGTERM, _terminate)
+        except ValueError:
+            pass  # 메인 스레드가 아닌 경우
+
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n🛑 서버 종료")
+        finally:
+            httpd.server_close()
+            try:
+                info_file.unlink()
+            except OSError:
+                pass
+
+
+def run_remote(argv: List[str]) -> Optional[int]:
+    """실행 중인 serve 프로세스에 명령 전달 (서버가 없으면 None)
+
+    urllib/http.client는 import만으로 ssl까지 불러와 수십 ms가 걸리므로 소켓으로 직접 요청합니다.
+    """
+    import socket
+
+    # 토큰은 serve.json에만 있으므로 파일이 없으면 서버도 없는 것으로 봄
+    info_file = SERVE_CONFIG["info_file"]
+    try:
+        with open(info_file, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        host, port, token = info["host"], info["port"], info["token"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    body = json.dumps({"argv": argv}).encode('utf-8')
+    request = (
+        f"POST /run HTTP/1.0\r\nHost: {host}:{port}\r\n"
+        f"{PipelineServer.TOKEN_HEADER}: {token}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode('ascii') + body
+
+    try:
+        with socket.create_connection((host, port), timeout=SERVE_CONFIG["connect_timeout"]) as sock:
+            sock.settimeout(SERVE_CONFIG["client_timeout"])
+            sock.sendall(request)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+
+    head, _, payload = b"".join(chunks).partition(b"\r\n\r\n")
+    status_line = head.split(b"\r\n", 1)[0].decode('ascii', 'replace')
+    if " 200 " not in f"{status_line} ":
+        print(f"❌ 서버 응답 오류: {status_line}")
+        return 1
+    result = json.loads(payload.decode('utf-8'))
+
+    sys.stdout.write(result.get("output", ""))
+    sys.stdout.flush()
+    return result.get("exit_code", 0)
+
+
 # ============================================================================
 # CLI 메인
 # ============================================================================
 
-def main():
-    """메인 함수"""
+def build_parser() -> argparse.ArgumentParser:
+    """CLI 인자 파서 (main과 serve 모드가 공유)"""
     
     parser = argparse.ArgumentParser(
         description="수학 교육 영상 제작 파이프라인 v6.1",
@@ -6120,6 +10868,9 @@ def main():
     # list 명령어 (프로젝트 목록)
     subparsers.add_parser("list", help="모든 프로젝트 목록 조회")
 
+    # reindex 명령어 (프로젝트 인덱스 재생성)
+    subparsers.add_parser("reindex", help="프로젝트 인덱스(cache/projects.db) 전체 재생성")
+
     # delete 명령어 (프로젝트 삭제)
     delete_parser = subparsers.add_parser("delete", help="프로젝트 삭제")
     delete_parser.add_argument("project_id", help="삭제할 프로젝트 ID (예: P20250110_143000)")
@@ -6155,21 +10906,37 @@ def main():
     tts_all_parser = subparsers.add_parser("tts-all", help="모든 씬 TTS 생성")
     tts_all_parser.add_argument("--start-from", "-f", type=int, default=1,
                                help="시작할 씬 번호 (예: 14면 s14부터 시작)")
+    tts_all_parser.add_argument("--jobs", "-j", type=int, default=None,
+                               help=f"최대 동시 TTS 요청 수 (기본 {TTS_CONFIG['concurrency']['max']}, 429 시 자동 감소)")
+    tts_all_parser.add_argument("--whisper", choices=["openai", "local"],
+                               help="Whisper 백엔드 (openai: whisper-1 API / local: faster-whisper)")
 
     # tts-export 명령어 (외부 녹음용 텍스트 내보내기)
     subparsers.add_parser("tts-export", help="외부 녹음용 텍스트 JSON 내보내기")
 
     # 섹션별 TTS 파이프라인 명령어들
-    subparsers.add_parser("tts-sections", help="섹션별 TTS 생성 (Step 4a)")
-    subparsers.add_parser("tts-timestamps", help="Whisper 타임스탬프 추출 (Step 4b)")
-    subparsers.add_parser("tts-pipeline", help="섹션별 TTS + 타임스탬프 한번에 (Step 4a+4b)")
-    subparsers.add_parser("tts-split", help="씬별 오디오 분할 (Step 4d)")
+    tts_sections_parser = subparsers.add_parser("tts-sections", help="섹션별 TTS 생성 (Step 4a)")
+    tts_sections_parser.add_argument("--jobs", "-j", type=int, default=None,
+                                     help="동시에 생성할 섹션 수 (기본: TTS 최대 동시 요청 수)")
+    tts_timestamps_parser = subparsers.add_parser("tts-timestamps", help="Whisper 타임스탬프 추출 (Step 4b)")
+    tts_timestamps_parser.add_argument("--whisper", choices=["openai", "local"],
+                                       help="Whisper 백엔드 (openai: whisper-1 API / local: faster-whisper)")
+    tts_pipeline_parser = subparsers.add_parser("tts-pipeline", help="섹션별 TTS + 타임스탬프 한번에 (Step 4a+4b)")
+    tts_pipeline_parser.add_argument("--jobs", "-j", type=int, default=None,
+                                     help="동시에 처리할 섹션 수 (기본: TTS 최대 동시 요청 수)")
+    tts_pipeline_parser.add_argument("--whisper", choices=["openai", "local"],
+                                     help="Whisper 백엔드 (openai: whisper-1 API / local: faster-whisper)")
+    tts_suggest_parser = subparsers.add_parser("tts-split-suggest", help="씬 분할 지점 자동 계산 (Step 4c)")
+    tts_suggest_parser.add_argument("--force", action="store_true", help="기존 split_points 파일 덮어쓰기")
+    tts_suggest_parser.add_argument("--bench", action="store_true", help="기존 split_points와 경계 오차 비교 (파일 쓰지 않음)")
+    tts_split_parser = subparsers.add_parser("tts-split", help="씬별 오디오 분할 (Step 4d)")
+    tts_split_parser.add_argument("--wav", action="store_true", help="합성용 무손실 WAV도 함께 출력")
 
     # audio-check 명령어 (외부 녹음 파일 확인)
     subparsers.add_parser("audio-check", help="외부 녹음 파일 누락 확인")
 
     # audio-process 명령어 (외부 녹음 파일 처리)
-    subparsers.add_parser("audio-process", help="외부 녹음 파일 Whisper 분석 + timing.json 생성")
+    subparsers.add_parser("audio-process", help="외부 녹음 파일 → 씬 WAV 조립 + timing.json 생성")
 
     # asset-check 명령어 (Supabase 에셋 체크)
     subparsers.add_parser("asset-check", help="에셋 체크 (Supabase 조회 + 다운로드 + 누락 목록)")
@@ -6180,6 +10947,10 @@ def main():
     # catalog-update 명령어 (Supabase → asset-catalog.md)
     subparsers.add_parser("catalog-update", help="에셋 카탈로그 업데이트 (Supabase에서 목록 가져오기)")
 
+    # asset-index 명령어 (Supabase assets → cache/assets.db)
+    asset_index_parser = subparsers.add_parser("asset-index", help="에셋 매니페스트(cache/assets.db) 동기화 (바뀐 행만)")
+    asset_index_parser.add_argument("--full", action="store_true", help="전체 다시 가져오기 (삭제된 에셋 반영)")
+
     # render 명령어
     render_parser = subparsers.add_parser("render", help="단일 씬 렌더링")
     render_parser.add_argument("--scene", "-s", required=True, help="씬 ID")
@@ -6194,18 +10965,22 @@ def main():
     render_all_parser.add_argument("--quality", "-q", default="l",
                                    choices=["l", "m", "h", "k"],
                                    help="렌더링 품질")
+    render_all_parser.add_argument("--jobs", "-j", type=int, default=1,
+                                   help="동시 렌더링 수 (기본 1=순차, 0=자동: CPU/메모리 기준)")
     
     # render-failed 명령어
-    render_failed_parser = subparsers.add_parser("render-failed", help="실패한 씬만 재렌더링 (8_renders/에 없는 씬)")
+    render_failed_parser = subparsers.add_parser("render-failed", help="실패한 씬만 재렌더링 (렌더링 캐시 기준 최신이 아닌 씬)")
     render_failed_parser.add_argument("--quality", "-q", default="l",
                                       choices=["l", "m", "h", "k"],
                                       help="렌더링 품질")
+    render_failed_parser.add_argument("--jobs", "-j", type=int, default=1,
+                                      help="동시 렌더링 수 (기본 1=순차, 0=자동)")
 
     # render-script 명령어
     subparsers.add_parser("render-script", help="렌더링 스크립트 생성")
 
     # render-collect 명령어
-    subparsers.add_parser("render-collect", help="media/videos/에서 렌더링 결과물 수집하여 8_renders/로 복사")
+    subparsers.add_parser("render-collect", help="씬별 렌더링 결과물(manifest) 수집하여 8_renders/로 복사")
 
     # prompts-export 명령어
     subparsers.add_parser("prompts-export", help="모든 이미지 프롬프트를 하나의 파일로 내보내기")
@@ -6234,6 +11009,11 @@ def main():
     subtitle_scene_parser = subparsers.add_parser("subtitle-scene", help="단일 씬 SRT 자막 생성")
     subtitle_scene_parser.add_argument("scene_id", help="씬 ID (예: s7)")
 
+    # subtitle-bench 명령어 (자막 싱크 오차 벤치마크)
+    subtitle_bench_parser = subparsers.add_parser("subtitle-bench", help="자막 싱크 오차 비교 (균등 분배 vs 단어 정렬)")
+    subtitle_bench_parser.add_argument("--project", action="append", dest="projects",
+                                       help="대상 프로젝트 ID (반복 가능, 기본: output/ 전체)")
+
     # tts-scene 명령어 (개별 씬 TTS 재생성 - scenes.json에서 텍스트 자동 로드)
     tts_scene_parser = subparsers.add_parser("tts-scene", help="단일 씬 TTS 재생성 (scenes.json에서 텍스트 로드)")
     tts_scene_parser.add_argument("scene_id", help="씬 ID (예: s7)")
@@ -6256,6 +11036,10 @@ def main():
     # compose-all 명령어
     compose_all_parser = subparsers.add_parser("compose-all", help="모든 씬 합성")
     compose_all_parser.add_argument("--no-subtitle", action="store_true", help="자막 없이 합성")
+    compose_all_parser.add_argument("--jobs", "-j", type=int, default=1,
+                                    help="동시 합성 수 (기본 1=순차, 0=CPU 코어 수)")
+    compose_all_parser.add_argument("--threads", type=int, default=0,
+                                    help="FFmpeg 1개당 스레드 수 (기본 0=자동: CPU 코어 수 / jobs)")
 
     # transition-generate 명령어
     subparsers.add_parser("transition-generate", help="섹션 전환 클립 생성 + concat_list.txt")
@@ -6263,6 +11047,18 @@ def main():
     # merge-final 명령어
     subparsers.add_parser("merge-final", help="모든 씬을 최종 영상으로 병합")
 
+    # build 명령어 (증분 빌드)
+    build_cmd_parser = subparsers.add_parser("build", help="증분 빌드 (입력이 바뀐 산출물만 재생성)")
+    build_cmd_parser.add_argument("--target", "-t", action="append",
+                              help="빌드 타깃 (여러 번 지정 가능, 기본: final_video)")
+    build_cmd_parser.add_argument("--jobs", "-j", type=int, default=0,
+                              help="동시 실행 노드 수 (기본 0=CPU 코어 수)")
+    build_cmd_parser.add_argument("--quality", "-q", default="l",
+                              choices=["l", "m", "h", "k"],
+                              help="렌더링 품질")
+    build_cmd_parser.add_argument("--no-subtitle", action="store_true", help="자막 없이 합성")
+    build_cmd_parser.add_argument("--dry-run", action="store_true", help="재생성 대상만 표시")
+
     # split-scenes 명령어
     subparsers.add_parser("split-scenes", help="scenes.json을 개별 씬 파일로 분할 (토큰 절약)")
 
@@ -6276,6 +11072,24 @@ def main():
     # narration-check 명령어 (나레이션 파일 상태 확인)
     subparsers.add_parser("narration-check", help="나레이션 파일 상태 확인")
 
+    # serve 명령어 (상주 서버)
+    serve_parser = subparsers.add_parser("serve", help="상주 서버 실행 (로컬 HTTP API, 명령 지연 단축)")
+    serve_parser.add_argument("--host", default=SERVE_CONFIG["host"], help="바인드 주소 (기본: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=SERVE_CONFIG["port"], help="포트 (0이면 자동)")
+    serve_parser.add_argument("--print-token", action="store_true",
+                              help="시작 시 API 토큰 출력 (video_maker_ui.html에 입력)")
+
+    # client 명령어 (서버에 명령 전달)
+    client_parser = subparsers.add_parser("client", help="실행 중인 서버에 명령 전달 (서버가 없으면 직접 실행)")
+    client_parser.add_argument("argv", nargs=argparse.REMAINDER, help="전달할 명령어와 옵션")
+
+    return parser
+
+
+def main():
+    """메인 함수"""
+    
+    parser = build_parser()
     args = parser.parse_args()
     
     # 명령어 없으면 도움말
@@ -6283,9 +11097,30 @@ def main():
         print_help()
         return
     
+    if args.command == "serve":
+        PipelineServer(host=args.host, port=args.port, print_token=args.print_token).serve_forever()
+        return
+    
+    if args.command == "client":
+        exit_code = run_remote(args.argv)
+        if exit_code is None:
+            print("⚠️  실행 중인 서버가 없습니다. 직접 실행합니다. (서버: python math_video_pipeline.py serve)")
+            args = parser.parse_args(args.argv)
+            if not args.command or args.command in PipelineServer.BLOCKED_COMMANDS:
+                print_help()
+                return
+        else:
+            sys.exit(exit_code)
+    
     # 상태 관리자 초기화
     state = StateManager()
     
+    run_command(args, state)
+
+
+def run_command(args: argparse.Namespace, state: StateManager) -> None:
+    """파싱된 명령어 실행 (CLI와 serve 모드 공용)"""
+    
     # 명령어 실행
     if args.command == "help":
         print_help()
@@ -6309,6 +11144,10 @@ def main():
         project = ProjectManager(state)
         project.list_projects()
 
+    elif args.command == "reindex":
+        project = ProjectManager(state)
+        project.reindex_projects()
+
     elif args.command == "delete":
         project = ProjectManager(state)
         project.delete_project(args.project_id, force=args.force)
@@ -6344,8 +11183,10 @@ def main():
     
     elif args.command == "tts-all":
         tts = TTSGenerator(state)
+        if args.whisper:
+            tts.whisper_backend = args.whisper
         start_from = getattr(args, 'start_from', 1)
-        tts.generate_all_from_scenes(start_from=start_from)
+        tts.generate_all_from_scenes(start_from=start_from, jobs=args.jobs)
 
     elif args.command == "tts-export":
         tts = TTSGenerator(state)
@@ -6353,19 +11194,27 @@ def main():
 
     elif args.command == "tts-sections":
         tts = TTSGenerator(state)
-        tts.generate_section_tts()
+        tts.generate_section_tts(jobs=args.jobs)
 
     elif args.command == "tts-timestamps":
         tts = TTSGenerator(state)
+        if args.whisper:
+            tts.whisper_backend = args.whisper
         tts.extract_timestamps()
 
     elif args.command == "tts-pipeline":
         tts = TTSGenerator(state)
-        tts.run_tts_pipeline()
+        if args.whisper:
+            tts.whisper_backend = args.whisper
+        tts.run_tts_pipeline(jobs=args.jobs)
+
+    elif args.command == "tts-split-suggest":
+        tts = TTSGenerator(state)
+        tts.suggest_split_points(force=args.force, bench=args.bench)
 
     elif args.command == "tts-split":
         tts = TTSGenerator(state)
-        tts.split_audio_by_scenes()
+        tts.split_audio_by_scenes(wav=args.wav)
 
     elif args.command == "audio-check":
         tts = TTSGenerator(state)
@@ -6387,6 +11236,10 @@ def main():
         assets = AssetManager(state)
         assets.update_catalog()
 
+    elif args.command == "asset-index":
+        assets = AssetManager(state)
+        assets.sync_manifest(full=args.full)
+
     elif args.command == "render":
         renderer = RenderManager(state)
         renderer.render_scene(
@@ -6397,11 +11250,11 @@ def main():
     
     elif args.command == "render-all":
         renderer = RenderManager(state)
-        renderer.render_all(quality=args.quality, preview=False)
+        renderer.render_all(quality=args.quality, preview=False, jobs=args.jobs)
 
     elif args.command == "render-failed":
         renderer = RenderManager(state)
-        renderer.render_failed(quality=args.quality)
+        renderer.render_failed(quality=args.quality, jobs=args.jobs)
 
     elif args.command == "render-script":
         renderer = RenderManager(state)
@@ -6449,6 +11302,10 @@ def main():
         composer = ComposerManager(state)
         composer.generate_subtitle_for_scene(args.scene_id)
 
+    elif args.command == "subtitle-bench":
+        composer = ComposerManager(state)
+        composer.benchmark_subtitle_sync(args.projects)
+
     elif args.command == "tts-scene":
         tts = TTSGenerator(state)
         tts.generate_for_scene(args.scene_id)
@@ -6460,17 +11317,23 @@ def main():
     elif args.command == "compose-scene":
         composer = ComposerManager(state)
         with_subtitle = not getattr(args, 'no_subtitle', False)
-        composer.compose_scene(args.scene_id, with_subtitle=with_subtitle)
+        try:
+            composer.compose_scene(args.scene_id, with_subtitle=with_subtitle)
+        except FFmpegSystemError as e:
+            print(f"❌ 합성 실패: {e}")
 
     elif args.command == "compose":
         composer = ComposerManager(state)
         with_subtitle = not getattr(args, 'no_subtitle', False)
-        composer.compose_scene(args.scene, with_subtitle=with_subtitle)
+        try:
+            composer.compose_scene(args.scene, with_subtitle=with_subtitle)
+        except FFmpegSystemError as e:
+            print(f"❌ 합성 실패: {e}")
 
     elif args.command == "compose-all":
         composer = ComposerManager(state)
         with_subtitle = not getattr(args, 'no_subtitle', False)
-        composer.compose_all(with_subtitle=with_subtitle)
+        composer.compose_all(with_subtitle=with_subtitle, jobs=args.jobs, threads=args.threads)
 
     elif args.command == "transition-generate":
         composer = ComposerManager(state)
@@ -6480,6 +11343,10 @@ def main():
         composer = ComposerManager(state)
         composer.merge_final()
 
+    elif args.command == "build":
+        builder = PipelineBuilder(state, quality=args.quality, with_subtitle=not args.no_subtitle)
+        builder.run(targets=args.target, jobs=args.jobs, dry_run=args.dry_run)
+
     elif args.command == "split-scenes":
         scene_splitter = SceneSplitter(state)
         scene_splitter.split()
@@ -20,6 +20,33 @@ class ProjectSelector:
     """output 폴더에서 프로젝트 선택"""
     
     OUTPUT_DIR = Path("output")
+    INDEX_DB = Path(__file__).parent / "cache" / "projects.db"  # math_video_pipeline.py list/reindex가 생성
+    
+    @classmethod
+    def load_index(cls) -> Dict[str, Dict]:
+        """프로젝트 인덱스(SQLite)에서 제목/씬 수/분량 조회 (없으면 빈 dict)"""
+        if not cls.INDEX_DB.exists():
+            return {}
+        
+        import sqlite3
+        try:
+            conn = sqlite3.connect(f"file:{cls.INDEX_DB.as_posix()}?mode=ro", uri=True)
+            try:
+                rows = conn.execute("SELECT id, title, scenes_total, duration FROM projects").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return {}
+        
+        return {
+            pid: {
+                "title": title,
+                "scenes": {"count": scenes if scenes is not None else '?'},
+                "config": {"duration": duration if duration is not None else '?'}
+            }
+            for pid, title, scenes, duration in rows
+            if title
+        }
     
     @classmethod
     def list_projects(cls) -> List[str]:
@@ -47,15 +74,20 @@ class ProjectSelector:
         print("📁 렌더링할 프로젝트 선택")
         print("="*70)
         
+        indexed = cls.load_index()
+        
         for i, proj in enumerate(projects, 1):
             proj_path = cls.OUTPUT_DIR / proj
             summary_file = proj_path / "project_summary.json"
             
-            # 프로젝트 정보 표시
-            if summary_file.exists():
+            # 프로젝트 정보 표시 (인덱스 우선, 없으면 project_summary.json)
+            if proj in indexed or summary_file.exists():
                 try:
-                    with open(summary_file, 'r', encoding='utf-8') as f:
-                        summary = json.load(f)
+                    if proj in indexed:
+                        summary = indexed[proj]
+                    else:
+                        with open(summary_file, 'r', encoding='utf-8') as f:
+                            summary = json.load(f)
                     
                     title = summary.get('title', '제목 없음')
                     scene_count = summary.get('scenes', {}).get('count', '?')
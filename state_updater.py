@@ -3,25 +3,42 @@
 # math_video_pipeline.py에 추가할 코드
 # ============================================================
 
-import json
 import os
 from datetime import datetime
+from pathlib import Path
 
 STATE_FILE = "state.json"
 
+# state.json은 math_video_pipeline.StateManager가 스냅샷 + 저널(state.journal)로 관리하므로
+# 직접 읽고 쓰면 저널 변경분을 놓치거나 다른 프로세스의 기록을 덮어씀 → StateManager 경유
+_state_manager = None
+
+
+def _manager():
+    """StateManager (파일 잠금 + 저널 반영, 지연 import)"""
+    global _state_manager
+    if _state_manager is None:
+        from math_video_pipeline import StateManager
+        _state_manager = StateManager(Path(STATE_FILE))
+    return _state_manager
+
+
 def load_state():
-    """state.json 로드"""
-    if os.path.exists(STATE_FILE):
-        with open(STATE_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return None
+    """state.json 로드 (저널 반영된 최신 상태)"""
+    if not os.path.exists(STATE_FILE) and not os.path.exists(Path(STATE_FILE).with_suffix(".journal")):
+        return None
+    return _manager().reload()
 
 def save_state(state):
-    """state.json 저장"""
-    state['last_updated'] = datetime.now().isoformat()
-    with open(STATE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
-    print(f"✅ state.json 업데이트됨: {state['current_phase']}")
+    """state.json 저장 (잠금 안에서 최신 상태에 변경분만 병합 후 원자적 교체)"""
+    manager = _manager()
+    current = manager.load()
+    if current is not state:
+        current.clear()
+        current.update(state)
+    current['last_updated'] = datetime.now().isoformat()
+    manager.save()
+    print(f"✅ state.json 업데이트됨: {current['current_phase']}")
 
 # ============================================================
 # 단계별 업데이트 함수
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+에셋 매니페스트 오프라인 테스트 (LocalSupabaseClient, 네트워크/Supabase 불필요)
+- 전체 동기화 → 증분 동기화 (워터마크 이후 행만)
+- check_assets: 매니페스트로 보유 여부 판단 + 병렬 다운로드 + 크기 검증
+- 일시 오류는 증분 모드를 끄지 않고, 컬럼 없음(42703)은 전체 조회로 대체
+- 두 번째 check_assets는 Supabase 조회 0회
+
+실행:
+    python test_asset_manifest.py
+    python -m pytest test_asset_manifest.py
+"""
+
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if __name__ == "__main__" and sys.stdout.encoding != 'utf-8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent.resolve()))
+import math_video_pipeline as mvp  # noqa: E402
+
+REMOTE_ASSETS = {
+    "objects/apple.png": b"\x89PNG apple" * 300,
+    "characters/stickman_happy.png": b"\x89PNG stickman" * 500,
+    "icons/star.svg": b"<svg viewBox='0 0 300 300'></svg>",
+}
+
+
+def _seed_remote(client, bucket: str) -> None:
+    """로컬 대체 Supabase에 Storage 파일 + assets 행 등록"""
+    for file_path, data in REMOTE_ASSETS.items():
+        folder, file_name = file_path.split("/")
+        client.storage.from_(bucket).upload(path=file_path, file=data)
+        client.table("assets").upsert(
+            {"file_name": file_name, "folder": folder, "storage_path": file_path, "file_size": len(data)},
+            on_conflict="folder,file_name"
+        ).execute()
+
+
+class _CountingClient:
+    """table() 호출 수를 세고 조회된 행을 기록하는 래퍼 (Supabase 왕복 횟수 확인용)
+
+    fail에 예외를 넣으면 다음 table() 호출 한 번에서 그 예외를 던집니다.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.storage = client.storage
+        self.queries = 0
+        self.pulled = []
+        self.fail = None
+
+    def table(self, name):
+        self.queries += 1
+        fail, self.fail = self.fail, None
+        if fail:
+            raise fail
+        query = self.client.table(name)
+        execute = query.execute
+
+        def record():
+            response = execute()
+            self.pulled.extend(response.data or [])
+            return response
+
+        query.execute = record
+        return query
+
+
+class _MissingColumnError(Exception):
+    """postgrest APIError 형태 (code 속성 + dict 인자)"""
+
+    def __init__(self, payload):
+        super().__init__(payload)
+        self.code = payload.get("code")
+
+
+def _pulled_paths(client) -> list:
+    paths = sorted(mvp.AssetManifest.row_path(r) for r in client.pulled)
+    client.pulled = []
+    return paths
+
+
+def _incremental_flag(manifest):
+    return manifest._get_meta(manifest._connect(), "incremental")
+
+
+def check_asset_manifest_offline(root: Path) -> None:
+    root = Path(root)
+    remote = mvp.LocalSupabaseClient(root / "remote")
+    _seed_remote(remote, mvp.AssetManager.BUCKET_NAME)
+    client = _CountingClient(remote)
+
+    # 1. 전체 동기화 (작은 페이지로 페이지 나눔까지 확인)
+    page_size = mvp.ASSET_MANIFEST_CONFIG["page_size"]
+    mvp.ASSET_MANIFEST_CONFIG["page_size"] = 2
+    try:
+        manifest = mvp.AssetManifest(root / "cache" / "assets.db")
+        assert manifest.sync(client) == len(REMOTE_ASSETS)
+        assert set(manifest.assets()) == set(REMOTE_ASSETS)
+
+        assert _pulled_paths(client) == sorted(REMOTE_ASSETS)
+
+        # 2. 증분 동기화: 새 행 + 워터마크 경계 행만
+        seeded = remote.table("assets").select("*").execute().data
+        watermark = max(r["updated_at"] for r in seeded)
+        boundary = [mvp.AssetManifest.row_path(r) for r in seeded if r["updated_at"] >= watermark]
+        remote.table("assets").upsert(
+            {"file_name": "pear.png", "folder": "objects", "storage_path": "objects/pear.png", "file_size": 1},
+            on_conflict="folder,file_name"
+        ).execute()
+        assert manifest.sync(client) == len(boundary) + 1
+        assert _pulled_paths(client) == sorted(boundary + ["objects/pear.png"])
+        assert "objects/pear.png" in manifest.assets()
+
+        # 일시 오류: 예외는 호출 측으로, 증분 모드/사본은 그대로
+        client.fail = ConnectionError("timed out")
+        try:
+            manifest.sync(client)
+            raise AssertionError("일시 오류가 삼켜짐")
+        except ConnectionError:
+            pass
+        assert _incremental_flag(manifest) != "0"
+        assert len(manifest.assets()) == len(REMOTE_ASSETS) + 1
+        latest = remote.table("assets").select("*").execute().data
+        watermark = max(r["updated_at"] for r in latest)
+        boundary = sorted(mvp.AssetManifest.row_path(r) for r in latest if r["updated_at"] >= watermark)
+        client.pulled = []
+        manifest.sync(client)
+        assert _pulled_paths(client) == boundary
+
+        # 워터마크 컬럼 없음(42703): 이번만 전체 조회, 결과에 컬럼이 있으니 증분 모드 유지
+        client.fail = _MissingColumnError({"code": "42703", "message": "column assets.updated_at does not exist"})
+        assert manifest.sync(client) == len(REMOTE_ASSETS) + 1
+        assert _pulled_paths(client) == sorted(list(REMOTE_ASSETS) + ["objects/pear.png"])
+        assert _incremental_flag(manifest) == "1"
+
+        # max_age 안이면 조회 생략
+        assert manifest.sync(client, max_age=300) is None
+    finally:
+        mvp.ASSET_MANIFEST_CONFIG["page_size"] = page_size
+
+    # 3. check_assets: 빈 assets/ 폴더에서 다운로드
+    output_dir = mvp.OUTPUT_DIR
+    project_index = mvp._project_index
+    mvp.OUTPUT_DIR = root / "output"
+    mvp._project_index = mvp.ProjectIndex(root / "cache" / "projects.db", mvp.OUTPUT_DIR)
+    try:
+        state = mvp.StateManager(root / "state.json")
+        state.set("project_id", "P_TEST")
+        scenes_dir = mvp.OUTPUT_DIR / "P_TEST" / "2_scenes"
+        scenes_dir.mkdir(parents=True)
+        with open(scenes_dir / "scenes.json", 'w', encoding='utf-8') as f:
+            json.dump({"project_id": "P_TEST", "scenes": [{
+                "scene_id": "s1",
+                "required_elements": [
+                    {"type": "image", "asset": "apple"},
+                    {"type": "image", "asset": "stickman_happy"},
+                    {"type": "icon", "asset": "star"},
+                    {"type": "image", "asset": "banana"},
+                ]
+            }]}, f)
+
+        assets = mvp.AssetManager.__new__(mvp.AssetManager)
+        assets.state = state
+        assets.supabase = client
+        assets.manifest = manifest
+        assets.ASSETS_DIR = root / "assets"
+
+        client.queries = 0
+        result = assets.check_assets()
+        assert client.queries == 0, f"매니페스트가 최신인데 Supabase 조회 {client.queries}회"
+        assert sorted(result["downloaded"]) == sorted(REMOTE_ASSETS), result["downloaded"]
+        assert [m["file_path"] for m in result["missing"]] == ["objects/banana.png"]
+        for file_path, data in REMOTE_ASSETS.items():
+            assert (assets.ASSETS_DIR / file_path).read_bytes() == data
+        assert not list(assets.ASSETS_DIR.rglob("*.part"))
+
+        # scenes.json 형태 유지 + 확장자 반영
+        with open(scenes_dir / "scenes.json", 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        assert saved["project_id"] == "P_TEST"
+        assert saved["scenes"][0]["required_elements"][0]["asset"] == "apple.png"
+
+        # 4. 다시 체크: 다운로드/조회 없음
+        result = assets.check_assets()
+        assert result["downloaded"] == [] and client.queries == 0
+    finally:
+        mvp.OUTPUT_DIR = output_dir
+        mvp._project_index = project_index
+
+
+def test_asset_manifest_offline(tmp_path):
+    check_asset_manifest_offline(tmp_path)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 에셋 매니페스트 오프라인 테스트")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        check_asset_manifest_offline(Path(tmp))
+    print("\n✅ 전체/증분 동기화, 다운로드, 조회 생략 확인")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+math_video_pipeline import 시간 예산 테스트
+- 모듈 로드 시 선택 의존성(openai, google, supabase, PIL, numpy)을 import하지 않는지 확인
+- import 시간이 예산(IMPORT_BUDGET_MS) 안인지 확인 (3회 중 최소값)
+
+실행:
+    python test_import_time.py
+    python -m pytest test_import_time.py
+"""
+
+import json
+import subprocess
+import sys
+import io
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if __name__ == "__main__" and sys.stdout.encoding != 'utf-8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.resolve()
+IMPORT_BUDGET_MS = 150  # status/list 같은 가벼운 명령의 시작 시간 상한
+RUNS = 3
+LAZY_MODULES = ["openai", "google.cloud.texttospeech", "google.genai", "supabase", "PIL", "numpy", "sqlite3"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import math_video_pipeline
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"ms": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (LAZY_MODULES,)
+
+
+def measure_import() -> dict:
+    """새 프로세스에서 import 1회 측정"""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=str(PROJECT_ROOT), capture_output=True, text=True, encoding="utf-8"
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def check_import_time() -> float:
+    """선택 의존성 지연 로드 + import 시간 예산 (최소 import 시간 ms 반환)"""
+    runs = [measure_import() for _ in range(RUNS)]
+    best = min(r["ms"] for r in runs)
+
+    assert not runs[0]["loaded"], f"import 시 로드된 선택 의존성: {runs[0]['loaded']}"
+    assert best <= IMPORT_BUDGET_MS, f"import {best:.1f}ms > 예산 {IMPORT_BUDGET_MS}ms"
+    return best
+
+
+def test_import_time_budget():
+    check_import_time()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("⏱️  math_video_pipeline import 시간 테스트")
+    print("=" * 60)
+    best = check_import_time()
+    print(f"✅ import {best:.1f}ms (예산 {IMPORT_BUDGET_MS}ms), 선택 의존성 미로드")
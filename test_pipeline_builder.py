@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분 빌드 테스트 (BuildDB + PipelineBuilder, 스텁 액션 - Manim/FFmpeg/API 불필요)
+- 첫 빌드는 전체 생성, 두 번째는 전체 최신
+- 씬 하나의 입력을 바꾸면 그 씬과 하위 노드(final_video)만 재생성
+- 내용이 같은 파일 touch는 재생성 없음, 재생성 출력이 같으면 하위 노드 스킵
+- build_db.json이 없는 기존 출력은 다시 만들지 않고 채택
+
+실행:
+    python test_pipeline_builder.py
+    python -m pytest test_pipeline_builder.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Windows 콘솔 UTF-8 설정
+if __name__ == "__main__" and sys.stdout.encoding != 'utf-8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent.resolve()))
+import math_video_pipeline as mvp  # noqa: E402
+
+SCENE_IDS = ["s1", "s2"]
+
+
+def _make_builder(root: Path, calls: list) -> 'mvp.PipelineBuilder':
+    """TTS/렌더/합성 관리자 없이 스텁 노드로 구성한 빌더
+
+    render:{sid}      code/{sid}.py (주석 줄 제외) → renders/{sid}.mov
+    scene_final:{sid} renders/{sid}.mov → final/{sid}_final.mp4
+    final_video       final/*_final.mp4 → final_video.mp4
+    """
+    builder = mvp.PipelineBuilder.__new__(mvp.PipelineBuilder)
+    builder.project_id = "P_TEST"
+    builder.project_dir = root
+    builder.quality = "l"
+    builder.db = mvp.BuildDB(root / mvp.BUILD_CONFIG["db_file"])
+    builder.renderer = SimpleNamespace(_resolve_render_jobs=lambda jobs, quality: 2)
+    builder.nodes = {}
+    builder.build_graph = lambda: True
+
+    def stub(node_id: str, source: Path, output: Path, transform):
+        def action():
+            calls.append(node_id)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(transform(source.read_text(encoding='utf-8')), encoding='utf-8')
+            return True
+        return action
+
+    def strip_comments(text: str) -> str:
+        return "\n".join(line for line in text.splitlines() if not line.startswith("#"))
+
+    finals = []
+    for sid in SCENE_IDS:
+        code = root / "code" / f"{sid}.py"
+        render = root / "renders" / f"{sid}.mov"
+        final = root / "final" / f"{sid}_final.mp4"
+        finals.append(final)
+        builder.nodes[f"render:{sid}"] = mvp.BuildNode(
+            f"render:{sid}", outputs=[render], action=stub(f"render:{sid}", code, render, strip_comments),
+            file_inputs=[code], values={"quality": builder.quality}
+        )
+        builder.nodes[f"scene_final:{sid}"] = mvp.BuildNode(
+            f"scene_final:{sid}", outputs=[final],
+            action=stub(f"scene_final:{sid}", render, final, lambda text: f"[final]{text}"),
+            file_inputs=[render], deps=[f"render:{sid}"]
+        )
+
+    final_video = root / "final_video.mp4"
+
+    def merge():
+        calls.append("final_video")
+        final_video.write_text("".join(p.read_text(encoding='utf-8') for p in finals), encoding='utf-8')
+        return True
+
+    builder.nodes["final_video"] = mvp.BuildNode(
+        "final_video", outputs=[final_video], action=merge, file_inputs=finals,
+        deps=[f"scene_final:{sid}" for sid in SCENE_IDS]
+    )
+    return builder
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+
+def _build(root: Path, **kwargs) -> tuple:
+    calls = []
+    results = _make_builder(root, calls).run(jobs=2, **kwargs)
+    return results, sorted(calls)
+
+
+def check_pipeline_builder(root: Path) -> None:
+    root = Path(root)
+    for sid in SCENE_IDS:
+        _write(root / "code" / f"{sid}.py", f"# {sid}\nclass {sid.upper()}: pass\n")
+    all_nodes = sorted(["final_video", "render:s1", "render:s2", "scene_final:s1", "scene_final:s2"])
+
+    # 1. 첫 빌드: 전체 생성 / 두 번째: 전체 최신
+    results, calls = _build(root)
+    assert calls == all_nodes and set(results.values()) == {"built"}, results
+    results, calls = _build(root)
+    assert calls == [] and set(results.values()) == {"fresh"}, results
+
+    # 2. s1 입력 변경 → s1 노드 + final_video만 재생성
+    _write(root / "code" / "s1.py", "# s1\nclass S1: value = 2\n")
+    results, calls = _build(root)
+    assert calls == ["final_video", "render:s1", "scene_final:s1"], calls
+    assert results["render:s2"] == "fresh" and results["scene_final:s2"] == "fresh"
+
+    # 3. 내용이 같은 touch → 해시가 같으므로 재생성 없음
+    code = root / "code" / "s2.py"
+    stat = code.stat()
+    os.utime(code, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    results, calls = _build(root)
+    assert calls == [], calls
+
+    # 4. 주석만 변경 → render:s2는 재생성되지만 출력이 같으므로 하위 노드는 최신
+    _write(root / "code" / "s2.py", "# s2 (수정)\nclass S2: pass\n")
+    results, calls = _build(root)
+    assert calls == ["render:s2"], calls
+    assert results["scene_final:s2"] == "fresh" and results["final_video"] == "fresh"
+
+    # 5. dry-run: 실행 없이 s1 변경 + 상위 재생성으로 인한 하위 노드 표시
+    _write(root / "code" / "s1.py", "# s1\nclass S1: value = 30\n")
+    plan, calls = _build(root, dry_run=True)
+    assert calls == []
+    assert plan["render:s1"] == "changed" and plan["scene_final:s1"] == "upstream"
+    assert plan["render:s2"] == "fresh"
+
+    # 6. 기록 없는 기존 출력 → 채택 (액션 실행 없음)
+    _build(root)
+    (root / mvp.BUILD_CONFIG["db_file"]).unlink()
+    results, calls = _build(root)
+    assert calls == [] and set(results.values()) == {"adopted"}, results
+    results, calls = _build(root)
+    assert calls == [] and set(results.values()) == {"fresh"}, results
+
+
+def test_pipeline_builder(tmp_path):
+    check_pipeline_builder(tmp_path)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 증분 빌드 테스트")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        check_pipeline_builder(Path(tmp))
+    print("\n✅ 변경 씬만 재생성, touch/동일 출력 스킵, 기존 출력 채택 확인")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+씬 분할 지점 제안 테스트 (SplitPointSuggester, 합성 WAV 사용 - FFmpeg/Whisper 불필요)
+- 쉼이 있는 합성 음성 → find_pauses가 쉼 구간 검출
+- Whisper 단어 시각으로 예상한 경계를 근처 쉼 중심으로 스냅
+- max_cells 초과 시 안내 출력 + 글자 수 비례 경계로 대체 (그래도 쉼에 스냅)
+
+실행:
+    python test_split_point_suggester.py
+    python -m pytest test_split_point_suggester.py
+"""
+
+import io
+import sys
+import tempfile
+import wave
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if __name__ == "__main__" and sys.stdout.encoding != 'utf-8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent.resolve()))
+import math_video_pipeline as mvp  # noqa: E402
+
+SCENES = [("s1", "안녕하세요 여러분!"), ("s2", "오늘은 탄력성을 배웁니다."), ("s3", "시작해 볼까요?")]
+
+# 실제 음성 구간 (쉼: 1.3~2.0초, 3.9~4.6초, 끝 5.6~6.0초)
+SPEECH = [(0.0, 1.3), (2.0, 3.9), (4.6, 5.6)]
+DURATION = 6.0
+
+# Whisper 단어 시각은 쉼 안쪽으로 어긋나 있음 → 예상 경계 1.5초, 4.15초
+WORDS = [
+    {"text": "안녕하세요", "start": 0.0, "end": 0.7},
+    {"text": "여러분", "start": 0.7, "end": 1.1},
+    {"text": "오늘은팔력성을", "start": 1.9, "end": 3.2},
+    {"text": "배웁니다", "start": 3.2, "end": 3.9},
+    {"text": "시작해볼까요", "start": 4.4, "end": 5.6},
+]
+EXPECTED = [(0.0, 1.65), (1.65, 4.25), (4.25, DURATION)]
+
+
+def _write_wav(path: Path, sample_rate: int) -> None:
+    """음성 구간은 톤 + 잡음, 나머지는 약한 잡음인 16비트 mono WAV"""
+    np = mvp.np
+    rng = np.random.default_rng(0)
+    t = np.arange(int(DURATION * sample_rate)) / sample_rate
+    signal = rng.normal(0, 0.001, len(t))
+    for start, end in SPEECH:
+        mask = (t >= start) & (t < end)
+        signal[mask] += 0.3 * np.sin(2 * np.pi * 220 * t[mask]) + rng.normal(0, 0.05, mask.sum())
+    pcm = (np.clip(signal, -1, 1) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+
+
+def _spans(result) -> list:
+    return [(s["start"], s["end"]) for s in result["splits"]]
+
+
+def _near(spans, expected, tolerance: float = 0.02) -> bool:
+    return all(abs(s - es) <= tolerance and abs(e - ee) <= tolerance for (s, e), (es, ee) in zip(spans, expected))
+
+
+def check_split_point_suggester(root: Path) -> None:
+    audio_file = Path(root) / "hook.wav"
+    _write_wav(audio_file, mvp.SPLIT_SUGGEST_CONFIG["sample_rate"])
+
+    # 1. 쉼 검출 + 정렬 경계 스냅
+    suggester = mvp.SplitPointSuggester()
+    result = suggester.suggest(audio_file, SCENES, {"words": WORDS})
+    assert result is not None
+    assert result["pauses"] == 3, result
+    assert abs(result["duration"] - DURATION) < 1e-6
+    assert [s["scene_id"] for s in result["splits"]] == ["s1", "s2", "s3"]
+    assert _near(_spans(result), EXPECTED), _spans(result)
+
+    # 2. max_cells 초과: 안내 출력 후 글자 수 비례 경계 (8:11:6자 → 1.92초, 4.56초) → 쉼에 스냅
+    suggester.aligner = mvp.SubtitleAligner({**mvp.SUBTITLE_ALIGN_CONFIG, "max_cells": 100})
+    bounds = suggester.expected_boundaries([text for _, text in SCENES], {"words": WORDS}, DURATION)
+    assert [round(b, 6) for b in bounds] == [1.92, 4.56], bounds
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = suggester.suggest(audio_file, SCENES, {"words": WORDS})
+    assert "max_cells" in output.getvalue(), output.getvalue()
+    assert _near(_spans(result), EXPECTED), _spans(result)
+
+
+def test_split_point_suggester(tmp_path):
+    check_split_point_suggester(tmp_path)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 씬 분할 지점 제안 테스트")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        check_split_point_suggester(Path(tmp))
+    print("\n✅ 쉼 검출, 경계 스냅, max_cells 대체 확인")
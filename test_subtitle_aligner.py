@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자막 정렬 테스트 (SubtitleAligner, Whisper/API 불필요)
+- 오인식("탄력성" → "팔력성") + 붙어서 인식된 단어("오늘은팔력성을")도 문장 경계 계산
+- 문장 경계는 앞 문장 끝과 다음 문장 시작 사이 쉼의 중간
+- DP 행렬이 max_cells를 넘거나 매칭 비율이 낮으면 None (호출 측 균등 분배)
+
+실행:
+    python test_subtitle_aligner.py
+    python -m pytest test_subtitle_aligner.py
+"""
+
+import io
+import sys
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if __name__ == "__main__" and sys.stdout.encoding != 'utf-8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent.resolve()))
+import math_video_pipeline as mvp  # noqa: E402
+
+SENTENCES = ["안녕하세요 여러분!", "오늘은 탄력성을 배웁니다.", "시작해 볼까요?"]
+
+# 문장 사이 쉼: 1.3~2.0초, 3.9~4.6초
+WORDS = [
+    {"text": "안녕하세요", "start": 0.0, "end": 0.8},
+    {"text": "여러분", "start": 0.8, "end": 1.3},
+    {"text": "오늘은팔력성을", "start": 2.0, "end": 3.2},
+    {"text": "배웁니다", "start": 3.2, "end": 3.9},
+    {"text": "시작해볼까요", "start": 4.6, "end": 5.6},
+]
+DURATION = 6.0
+
+
+def _close(a: float, b: float) -> bool:
+    return abs(a - b) < 1e-6
+
+
+def check_subtitle_aligner() -> None:
+    aligner = mvp.SubtitleAligner()
+
+    # 1. 한글 오인식은 자모 부분 비용으로 근접 매칭 (삭제/삽입 대신 치환)
+    assert aligner.align_chars("탄력성", "팔력성") == [0, 1, 2]
+
+    # 2. 오인식 + 단어 병합이 섞여도 문장 경계는 쉼 중간
+    aligned = aligner.align(SENTENCES, WORDS, DURATION)
+    assert aligned is not None
+    assert [text for text, _, _ in aligned] == SENTENCES
+    bounds = [(start, end) for _, start, end in aligned]
+    expected = [(0.0, 1.65), (1.65, 4.25), (4.25, DURATION)]
+    assert all(_close(s, es) and _close(e, ee) for (s, e), (es, ee) in zip(bounds, expected)), bounds
+
+    # 3. 전혀 다른 인식 결과 → 매칭 비율 미달로 None
+    unrelated = [{"text": "completely different words", "start": 0.0, "end": 5.0}]
+    assert aligner.align(SENTENCES, unrelated, DURATION) is None
+
+    # 4. DP 행렬이 max_cells를 넘으면 None
+    small = mvp.SubtitleAligner({**mvp.SUBTITLE_ALIGN_CONFIG, "max_cells": 100})
+    assert small.align(SENTENCES, WORDS, DURATION) is None
+
+    # 5. 입력이 비었거나 길이가 0이면 None
+    assert aligner.align(SENTENCES, [], DURATION) is None
+    assert aligner.align(SENTENCES, WORDS, 0) is None
+
+
+def test_subtitle_aligner():
+    check_subtitle_aligner()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 자막 정렬 테스트")
+    print("=" * 60)
+    check_subtitle_aligner()
+    print("\n✅ 오인식/단어 병합 정렬, 문장 경계, None 대체 확인")